@@ -6,8 +6,9 @@ from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.db.session import async_session
-from app.core.security import decode_access_token
+from app.db.session import async_session, read_router
+from app.core.security import decode_token_payload
+from app.core.user_cache import UserPrincipal, user_cache
 from app.models.user import User
 
 # OAuth2 scheme for token authentication
@@ -20,11 +21,59 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get a database session for read-only routes.
+    
+    Uses a read replica when DATABASE_REPLICA_URLS is set, except for
+    clients that wrote within READ_YOUR_WRITES_SECONDS (they read from the
+    primary). Never write through this session.
+    """
+    async with read_router.session_factory(request)() as session:
+        yield session
+
+
+async def resolve_principal(token: str, db: AsyncSession) -> Optional[UserPrincipal]:
+    """
+    Resolve an access token to a user principal.
+    
+    Served from the user cache when possible; otherwise the token is decoded,
+    the user is loaded and the result is cached.
+    
+    Args:
+        token: JWT access token
+        db: Database session (only used on a cache miss)
+        
+    Returns:
+        Principal for the token's user, or None if the token is invalid or
+        the user does not exist
+    """
+    principal = user_cache.get(token)
+    if principal is not None:
+        return principal
+    
+    payload = decode_token_payload(token)
+    if payload is None or payload.get("sub") is None:
+        return None
+    
+    # Get user from database
+    query = select(User).where(User.id == payload["sub"])
+    result = await db.execute(query)
+    user = result.scalar_one_or_none()
+    
+    if user is None:
+        return None
+    
+    principal = UserPrincipal.from_user(user)
+    user_cache.put(token, principal, payload.get("exp"))
+    return principal
+
+
 async def get_current_user(
     request: Request,
     token: Optional[str] = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db)
-) -> User:
+) -> UserPrincipal:
     """
     Get current authenticated user from JWT token.
     
@@ -34,7 +83,7 @@ async def get_current_user(
         db: Database session
         
     Returns:
-        Current authenticated user
+        Current authenticated user principal
         
     Raises:
         HTTPException: If token is invalid or user not found
@@ -53,16 +102,7 @@ async def get_current_user(
     if token is None:
         raise credentials_exception
     
-    # Decode token
-    user_id = decode_access_token(token)
-    if user_id is None:
-        raise credentials_exception
-    
-    # Get user from database
-    query = select(User).where(User.id == user_id)
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
-    
+    user = await resolve_principal(token, db)
     if user is None:
         raise credentials_exception
     
@@ -88,7 +128,7 @@ def require_roles(*allowed_roles: str):
     Example:
         @router.post("/admin-only", dependencies=[Depends(require_roles("admin"))])
     """
-    async def role_checker(current_user: User = Depends(get_current_user)) -> User:
+    async def role_checker(current_user: UserPrincipal = Depends(get_current_user)) -> UserPrincipal:
         if current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -103,7 +143,7 @@ async def get_current_user_optional(
     request: Request,
     token: Optional[str] = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db)
-) -> Optional[User]:
+) -> Optional[UserPrincipal]:
     """
     Get current authenticated user from JWT token, or None if not authenticated.
     
@@ -116,7 +156,7 @@ async def get_current_user_optional(
         db: Database session
         
     Returns:
-        Current authenticated user or None
+        Current authenticated user principal or None
     """
     # Try to get token from Authorization header first, then from cookie
     if not token:
@@ -125,16 +165,7 @@ async def get_current_user_optional(
     if not token:
         return None
     
-    # Decode token
-    user_id = decode_access_token(token)
-    if user_id is None:
-        return None
-    
-    # Get user from database
-    query = select(User).where(User.id == user_id)
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
-    
+    user = await resolve_principal(token, db)
     if user is None or not user.is_active:
         return None
     
@@ -2,22 +2,60 @@
 Artworks API endpoints.
 """
 import os
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterable, List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, tuple_
 from sqlmodel import col
-from app.api.deps import get_db, require_roles
+from app.api.deps import get_db, get_read_db, require_roles
 from app.models.artwork import Artwork
 from app.models.category import Category
-from app.models.user import User
-from app.schemas.artwork import ArtworkCreate, ArtworkUpdate, ArtworkImport
+from app.core.user_cache import UserPrincipal
+from app.schemas.artwork import (
+    ArtworkCreate,
+    ArtworkUpdate,
+    ArtworkImport,
+    ArtworkRead,
+    ArtworkSearchHit,
+    ARTWORK_READ_FIELDS,
+    artwork_read,
+)
 from app.services import artist_descriptions  # NEW
+from app.services.search import search_artworks
+from app.services.view_counter import view_counter
+from app.services.cdn_catalog import cdn_catalog, parse_artwork_key
+from app.services.artwork_import import import_artworks
+from app.services.reference_data import get_categories
 from app.core.config import settings
+from app.core.http_cache import (
+    cached_json_response,
+    is_not_modified,
+    not_modified,
+    validator_headers,
+    weak_etag,
+)
+from app.core.responses import FastJSONResponse
+from app.core.pagination import InvalidCursor, encode_cursor, decode_cursor, parse_datetime_key
 
 router = APIRouter()
 
+# Sort name -> column used as the leading keyset key (Artwork.id breaks ties)
+SORT_COLUMNS = {
+    "popularity": Artwork.popularity_score,
+    "views": Artwork.views,
+    "created_at": Artwork.created_at,
+    "likes": Artwork.like_count,
+}
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Columns the detail ETag is derived from: updated_at covers edits, the
+# counters change through bulk UPDATEs that leave updated_at alone
+ARTWORK_VALIDATOR_COLUMNS = [Artwork.updated_at, Artwork.views, Artwork.like_count, Artwork.comment_count]
+
 
 def normalize_image_url(image_path: str) -> str:
     """
@@ -27,41 +65,77 @@ def normalize_image_url(image_path: str) -> str:
     Example: "ml/input/wikiart/Baroque/artist-title.jpg" -> 
              "https://artappspace.nyc3.digitaloceanspaces.com/Baroque/artist-title.jpg"
     """
-    parts = image_path.split("/")
-    if len(parts) >= 2:
-        # Take last two segments: Style/filename.jpg
-        style_and_file = "/".join(parts[-2:])
-    else:
-        # Fallback to just the filename
-        style_and_file = parts[-1] if parts else image_path
-    
-    # Remove any leading slashes from the style_and_file
-    style_and_file = style_and_file.lstrip("/")
+    return normalize_image_urls([image_path])[0]
+
+
+def normalize_image_urls(image_paths: Iterable[str]) -> List[str]:
+    """
+    Convert a batch of image paths to CDN URLs (see normalize_image_url).
     
-    # Construct absolute URL
+    The base URL is resolved once for the whole batch.
+    """
     base_url = settings.ARTWORKS_BASE_URL.rstrip("/")
-    return f"{base_url}/{style_and_file}"
+    # Last two segments (Style/filename.jpg), or just the filename
+    return [
+        f"{base_url}/{'/'.join(image_path.split('/')[-2:]).lstrip('/')}"
+        for image_path in image_paths
+    ]
+
 
+# Columns selected by the listing: ArtworkRead minus the stored image_url,
+# which is replaced by the CDN URL derived from image_path
+LISTING_COLUMNS = [
+    getattr(Artwork, field) for field in ARTWORK_READ_FIELDS if field != "image_url"
+]
 
-@router.get("/artworks", response_model=List[Artwork])
+
+def _cursor_key(sort: str, key):
+    """Convert a raw cursor key back into a value comparable with the sort column."""
+    try:
+        if sort == "popularity":
+            return float(key)
+        if sort in ("views", "likes"):
+            return int(key)
+    except (TypeError, ValueError) as e:
+        raise InvalidCursor("Invalid cursor") from e
+    return parse_datetime_key(key)
+
+
+@router.get("/artworks", response_model=List[ArtworkRead])
 async def list_artworks(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    sort: str = Query("popularity", pattern="^(popularity|views|created_at)$"),
+    sort: str = Query("popularity", pattern="^(popularity|views|created_at|likes)$"),
     style: Optional[str] = None,
     artist: Optional[str] = None,
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List artworks with pagination and filtering.
     
-    - **skip**: Number of records to skip (default: 0)
+    - **skip**: Number of records to skip (default: 0, ignored when cursor is given)
     - **limit**: Maximum number of records to return (default: 20, max: 100)
-    - **sort**: Sort field - popularity, views, or created_at (default: popularity)
+    - **sort**: Sort field - popularity, views, created_at, or likes (default: popularity)
     - **style**: Filter by art style/category
     - **artist**: Filter by artist name
+    - **cursor**: Opaque cursor from the X-Next-Cursor header of the previous page
+    
+    When a full page is returned, the X-Next-Cursor response header holds the
+    cursor for the following page.
+    
+    Listings carry a weak ETag derived from the returned rows, counters
+    included; a matching If-None-Match gets 304 Not Modified without
+    serializing the page. (No Last-Modified: counter updates do not move
+    updated_at, so a date could not tell a stale page apart.)
+    
+    Rows are serialized directly with FastJSONResponse; response_model
+    only documents the shape.
     """
-    query = select(Artwork).where(Artwork.is_active == True)
+    sort_column = SORT_COLUMNS[sort]
+    # Plain rows of the needed columns (no ORM entities or identity map)
+    query = select(*LISTING_COLUMNS).where(Artwork.is_active == True)
     
     # Apply filters
     if style:
@@ -69,30 +143,110 @@ async def list_artworks(
     if artist:
         query = query.where(Artwork.artist.ilike(f"%{artist}%"))
     
-    # Apply sorting
-    if sort == "popularity":
-        query = query.order_by(col(Artwork.popularity_score).desc())
-    elif sort == "views":
-        query = query.order_by(col(Artwork.views).desc())
-    elif sort == "created_at":
-        query = query.order_by(col(Artwork.created_at).desc())
+    # Apply sorting (id breaks ties so keyset positions are unique)
+    query = query.order_by(col(sort_column).desc(), col(Artwork.id).desc())
     
-    # Apply pagination
-    query = query.offset(skip).limit(limit)
+    # Apply pagination: keyset when a cursor is given, offset otherwise
+    if cursor:
+        try:
+            cursor_sort, raw_key, last_id = decode_cursor(cursor)
+            if cursor_sort != sort:
+                raise InvalidCursor("Cursor does not match sort order")
+            last_key = _cursor_key(sort, raw_key)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        query = query.where(tuple_(sort_column, Artwork.id) < tuple_(last_key, last_id))
+    else:
+        query = query.offset(skip)
+    query = query.limit(limit)
     
     result = await db.execute(query)
-    artworks = result.scalars().all()
+    rows = result.all()
+    
+    etag = weak_etag("artworks", request.url.query, *(tuple(row) for row in rows))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    headers = validator_headers(etag)
+    
+    if len(rows) == limit:
+        last = rows[-1]
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            sort, getattr(last, sort_column.key), last.id
+        )
     
     # Normalize image URLs to use Spaces CDN
-    for artwork in artworks:
-        artwork.image_url = normalize_image_url(artwork.image_path)
+    image_urls = normalize_image_urls(row.image_path for row in rows)
+    return FastJSONResponse(
+        [artwork_read(row, image_url) for row, image_url in zip(rows, image_urls)],
+        headers=headers,
+    )
+
+
+@router.get("/artworks/search", response_model=List[ArtworkSearchHit])
+async def search_artworks_endpoint(
+    q: str = Query(..., min_length=1, description="Search in title/artist"),
+    style: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Search active artworks by title or artist, best match first.
+    
+    - **q**: Search text (case-insensitive)
+    - **style**: Filter by art style/category
+    - **skip**: Number of ranked results to skip (default: 0)
+    - **limit**: Maximum number of results to return (default: 20, max: 100)
     
-    return artworks
+    Each result carries a relevance score.
+    """
+    hits = await search_artworks(db, q, style=style, offset=skip, limit=limit)
+    return FastJSONResponse([
+        {
+            "id": artwork.id,
+            "title": artwork.title,
+            "artist": artwork.artist,
+            "year": artwork.year,
+            "style": artwork.style,
+            "image_url": normalize_image_url(artwork.image_path),
+            "popularity_score": artwork.popularity_score,
+            "score": score,
+        }
+        for artwork, score in hits
+    ])
+
+
+def _artwork_etag(artwork_id: UUID, updated_at: datetime, views: int, like_count: int, comment_count: int) -> str:
+    """Weak ETag of an artwork representation, counters included."""
+    return weak_etag("artwork", artwork_id, updated_at.isoformat(), views, like_count, comment_count)
 
 
-@router.get("/artworks/{artwork_id}", response_model=Artwork)
-async def get_artwork(artwork_id: UUID, db: AsyncSession = Depends(get_db)):
-    """Get a single artwork by ID."""
+@router.get("/artworks/{artwork_id}", response_model=ArtworkRead)
+async def get_artwork(
+    artwork_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    """Get a single artwork by ID.
+    
+    Counts a view (buffered and written in batches, so the returned
+    views value lags by up to one flush interval).
+    
+    The response carries a weak ETag derived from updated_at and the
+    views / like / comment counters; a matching If-None-Match gets
+    304 Not Modified after a lookup of those columns. (No Last-Modified:
+    counter updates do not move updated_at.)
+    """
+    if request.headers.get("if-none-match"):
+        result = await db.execute(select(*ARTWORK_VALIDATOR_COLUMNS).where(Artwork.id == artwork_id))
+        validators = result.first()
+        if validators is None:
+            raise HTTPException(status_code=404, detail="Artwork not found")
+        etag = _artwork_etag(artwork_id, *validators)
+        if is_not_modified(request, etag):
+            view_counter.record(artwork_id)
+            return not_modified(etag)
+    
     query = select(Artwork).where(Artwork.id == artwork_id)
     result = await db.execute(query)
     artwork = result.scalar_one_or_none()
@@ -100,10 +254,15 @@ async def get_artwork(artwork_id: UUID, db: AsyncSession = Depends(get_db)):
     if not artwork:
         raise HTTPException(status_code=404, detail="Artwork not found")
     
-    # Normalize image URL to use Spaces CDN
-    artwork.image_url = normalize_image_url(artwork.image_path)
+    view_counter.record(artwork.id)
     
-    return artwork
+    # Normalize image URL to use Spaces CDN
+    return FastJSONResponse(
+        artwork_read(artwork, normalize_image_url(artwork.image_path)),
+        headers=validator_headers(_artwork_etag(
+            artwork.id, artwork.updated_at, artwork.views, artwork.like_count, artwork.comment_count
+        )),
+    )
 
 
 # NEW: Full artist description endpoint for detail page
@@ -123,13 +282,20 @@ async def get_artist_description(artwork_id: UUID, db: AsyncSession = Depends(ge
 
 
 @router.get("/categories", response_model=List[Category])
-async def list_categories(db: AsyncSession = Depends(get_db)):
-    """List all art styles/categories."""
-    query = select(Category)
-    result = await db.execute(query)
-    categories = result.scalars().all()
+async def list_categories(request: Request, db: AsyncSession = Depends(get_read_db)):
+    """
+    List all art styles/categories.
     
-    return categories
+    Served from the reference-data cache with an ETag; a matching
+    If-None-Match gets 304 Not Modified.
+    """
+    categories = await get_categories(db)
+    return cached_json_response(
+        request,
+        categories.body,
+        categories.etag,
+        f"public, max-age={settings.REFERENCE_CACHE_TTL_SECONDS}",
+    )
 
 
 # Admin endpoints (protected by role-based authentication)
@@ -137,7 +303,7 @@ async def list_categories(db: AsyncSession = Depends(get_db)):
 async def create_artwork(
     artwork_data: ArtworkCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_roles("admin"))
+    current_user: UserPrincipal = Depends(require_roles("admin"))
 ):
     """Create a new artwork (admin only).
     
@@ -168,7 +334,7 @@ async def update_artwork(
     artwork_id: UUID,
     artwork_update: ArtworkUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_roles("admin"))
+    current_user: UserPrincipal = Depends(require_roles("admin"))
 ):
     """Update an artwork (admin only).
     
@@ -206,7 +372,7 @@ async def update_artwork(
 async def delete_artwork(
     artwork_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_roles("admin"))
+    current_user: UserPrincipal = Depends(require_roles("admin"))
 ):
     """Soft delete an artwork by setting is_active to False (admin only).
     
@@ -229,7 +395,7 @@ async def delete_artwork(
 async def import_artwork_from_path(
     import_data: ArtworkImport,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_roles("admin"))
+    current_user: UserPrincipal = Depends(require_roles("admin"))
 ):
     """Import artwork from file path (admin only).
     
@@ -318,7 +484,7 @@ async def import_artwork_from_path(
 async def toggle_artwork_active(
     artwork_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_roles("admin", "manager"))
+    current_user: UserPrincipal = Depends(require_roles("admin", "manager"))
 ):
     """Toggle the is_active status of an artwork (admin or manager).
     
@@ -346,15 +512,22 @@ async def toggle_artwork_active(
     return artwork
 
 
+# CDN style prefixes offered for import (Ukiyo_e excluded as requested)
+SCAN_STYLES = ["Baroque", "Impressionism", "Post_Impressionism", "Art_Nouveau_Modern"]
+
+
 @router.get("/artworks/available/scan", dependencies=[Depends(require_roles("admin"))])
 async def scan_available_artworks(
+    refresh: bool = Query(False, description="Re-list the CDN instead of using the cached listing"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_roles("admin"))
+    current_user: UserPrincipal = Depends(require_roles("admin"))
 ):
     """
     Query CDN to get available artworks grouped by style.
     Only returns artworks that are NOT already in the database.
     
+    - **refresh**: Bypass the cached CDN listing (cached for CDN_CATALOG_TTL_SECONDS)
+    
     Returns:
         {
             "Baroque": [
@@ -365,8 +538,7 @@ async def scan_available_artworks(
             ...
         }
     """
-    import xml.etree.ElementTree as ET
-    import urllib.request
+    catalog = await cdn_catalog.get(SCAN_STYLES, refresh=refresh)
     
     # Get all existing artwork filenames from database
     query = select(Artwork.image_path)
@@ -374,160 +546,52 @@ async def scan_available_artworks(
     existing_paths = set(result.scalars().all())
     
     available_artworks = {}
-    
-    # Styles to check (excluding Ukiyo_e as requested)
-    styles_to_scan = ["Baroque", "Impressionism", "Post_Impressionism", "Art_Nouveau_Modern"]
-    
-    for style in styles_to_scan:
-        available_artworks[style] = []
-        
-        try:
-            # Query CDN for this style (get up to 500 items to have plenty of options)
-            cdn_url = f"{settings.ARTWORKS_BASE_URL}/?prefix={style}/&max-keys=500"
-            
-            with urllib.request.urlopen(cdn_url) as response:
-                xml_data = response.read()
-            
-            # Parse XML response
-            root = ET.fromstring(xml_data)
-            namespace = {'s3': 'http://s3.amazonaws.com/doc/2006-03-01/'}
-            
-            for contents in root.findall('s3:Contents', namespace):
-                key_element = contents.find('s3:Key', namespace)
-                if key_element is None:
-                    continue
-                    
-                key = key_element.text
-                
-                if not key or not key.endswith(('.jpg', '.jpeg', '.png')):
-                    continue
-                
-                # Build image path for comparison
-                image_path = f"ml/input/wikiart/{key}"
-                
-                # Skip if already in database
-                if image_path in existing_paths:
-                    continue
-                
-                # Parse filename
-                filename = key.split('/')[-1]
-                filename_base = filename.rsplit('.', 1)[0]
-                
-                # Split by underscore to extract artist and title
-                if "_" in filename_base:
-                    parts = filename_base.split("_", 1)
-                    artist_part = parts[0]
-                    title_part = parts[1] if len(parts) > 1 else parts[0]
-                else:
-                    parts = filename_base.split("-", 1)
-                    artist_part = parts[0]
-                    title_part = parts[1] if len(parts) > 1 else parts[0]
-                
-                # Format: replace hyphens/underscores with spaces, title case
-                artist = artist_part.replace("-", " ").replace("_", " ").title()
-                title = title_part.replace("-", " ").replace("_", " ").title()
-                
-                available_artworks[style].append({
-                    "path": key,  # Just the style/filename, not full path
-                    "title": title,
-                    "artist": artist
-                })
-        
-        except Exception as e:
-            # Log error but continue with other styles
-            print(f"Error scanning {style}: {str(e)}")
-            continue
-    
-    # Remove empty styles
-    available_artworks = {k: v for k, v in available_artworks.items() if v}
+    for style, keys in catalog.items():
+        artworks = []
+        for key in keys:
+            # Skip if already in database
+            if f"ml/input/wikiart/{key}" in existing_paths:
+                continue
+            title, artist = parse_artwork_key(key)
+            artworks.append({
+                "path": key,  # Just the style/filename, not full path
+                "title": title,
+                "artist": artist
+            })
+        # Remove empty styles
+        if artworks:
+            available_artworks[style] = artworks
     
     return available_artworks
 
 
+# Upper bound on paths accepted by one batch import request
+BATCH_IMPORT_MAX_PATHS = 10000
+
+
 @router.post("/artworks/batch-import", dependencies=[Depends(require_roles("admin"))])
 async def batch_import_artworks(
     artwork_paths: List[str],
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_roles("admin"))
+    current_user: UserPrincipal = Depends(require_roles("admin"))
 ):
     """
     Import multiple artworks at once from a list of paths.
     
+    Runs as one transaction: paths are validated first, already imported
+    paths are skipped, and categories for new styles are created.
+    
     Args:
-        artwork_paths: List of image paths relative to WikiArt directory
+        artwork_paths: List of CDN keys like "Baroque/artist-name_title.jpg"
         
     Returns:
-        {"imported": 5, "failed": 0, "details": [...]}
+        {"imported": 5, "skipped": 1, "failed": 0, "created_categories": [...], "details": [...]}
     """
-    import re
-    
-    imported = 0
-    failed = 0
-    details = []
-    
-    for image_path in artwork_paths:
-        try:
-            # Parse style, artist, and title from path
-            # Format: "Style/artist-name_title-name.jpg"
-            parts = image_path.split("/")
-            
-            if len(parts) < 2:
-                details.append({"path": image_path, "status": "failed", "error": "Invalid path format"})
-                failed += 1
-                continue
-            
-            style = parts[0]
-            filename = parts[1].replace(".jpg", "").replace(".png", "")
-            
-            # Parse filename
-            if "_" in filename:
-                file_parts = filename.split("_", 1)
-                artist_part = file_parts[0]
-                title_part = file_parts[1] if len(file_parts) > 1 else file_parts[0]
-            else:
-                file_parts = filename.split("-", 1)
-                artist_part = file_parts[0]
-                title_part = file_parts[1] if len(file_parts) > 1 else file_parts[0]
-            
-            artist = artist_part.replace("-", " ").replace("_", " ").title()
-            title = title_part.replace("-", " ").replace("_", " ").title()
-            
-            # Generate CDN URL
-            image_url = normalize_image_url(image_path)
-            
-            # Create artwork
-            artwork = Artwork(
-                title=title,
-                artist=artist,
-                style=style,
-                image_path=image_path,
-                image_url=image_url,
-                popularity_score=0.0,
-                is_active=True
-            )
-            
-            db.add(artwork)
-            details.append({
-                "path": image_path,
-                "status": "success",
-                "title": title,
-                "artist": artist
-            })
-            imported += 1
-            
-        except Exception as e:
-            details.append({
-                "path": image_path,
-                "status": "failed",
-                "error": str(e)
-            })
-            failed += 1
-    
-    await db.commit()
+    if len(artwork_paths) > BATCH_IMPORT_MAX_PATHS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {BATCH_IMPORT_MAX_PATHS} paths can be imported at once"
+        )
     
-    return {
-        "imported": imported,
-        "failed": failed,
-        "details": details
-    }
+    return await import_artworks(db, artwork_paths)
 
@@ -6,8 +6,10 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.api.deps import get_db, get_current_user
-from app.core.security import verify_password, get_password_hash, create_access_token
+from app.core.security import create_access_token
+from app.core.hashing import password_hasher
 from app.models.user import User
+from app.core.user_cache import UserPrincipal
 from app.schemas.auth import UserCreate, UserResponse, Token, PasswordReset
 
 router = APIRouter()
@@ -49,7 +51,7 @@ async def register(
     user = User(
         email=user_data.email,
         username=user_data.username,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=await password_hasher.hash(user_data.password),
         role="user"  # Default role
     )
     
@@ -81,7 +83,7 @@ async def login(
     user = result.scalar_one_or_none()
     
     # Verify user exists and password is correct
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await password_hasher.verify(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -103,7 +105,7 @@ async def login(
 @router.post("/reset-password")
 async def reset_password(
     password_data: PasswordReset,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -114,21 +116,30 @@ async def reset_password(
     
     Requires authentication.
     """
+    # The cached principal carries no password hash; load the row
+    user = await db.get(User, current_user.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
     # Verify old password
-    if not verify_password(password_data.old_password, current_user.hashed_password):
+    if not await password_hasher.verify(password_data.old_password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password"
         )
     
-    # Update password
-    current_user.hashed_password = get_password_hash(password_data.new_password)
+    # Update password (committing invalidates the user's cached principals)
+    user.hashed_password = await password_hasher.hash(password_data.new_password)
     await db.commit()
     
     return {"message": "Password updated successfully"}
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: UserPrincipal = Depends(get_current_user)):
     """Get current user information."""
     return current_user
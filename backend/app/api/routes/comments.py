@@ -4,14 +4,24 @@ Comments API endpoints for artwork comments.
 from typing import List
 from uuid import UUID
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
 from pydantic import BaseModel, Field
-from app.api.deps import get_db, get_current_user
+from app.api.deps import get_db, get_read_db, get_current_user
 from app.models.user import User
+from app.core.user_cache import UserPrincipal
 from app.models.comment import Comment
 from app.models.artwork import Artwork
+from app.services.counters import adjust_artwork_counter
+from app.core.responses import FastJSONResponse
+from app.core.http_cache import (
+    has_conditional_headers,
+    is_not_modified,
+    not_modified,
+    validator_headers,
+    weak_etag,
+)
 
 router = APIRouter()
 
@@ -35,7 +45,7 @@ class CommentResponse(BaseModel):
 async def create_comment(
     artwork_id: UUID,
     comment_data: CommentCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -64,6 +74,7 @@ async def create_comment(
         content=comment_data.content
     )
     db.add(new_comment)
+    await adjust_artwork_counter(db, artwork_id, "comment_count", 1)
     await db.commit()
     await db.refresh(new_comment)
     
@@ -77,10 +88,16 @@ async def create_comment(
     )
 
 
+def _comments_etag(artwork_id: UUID, count: int, newest) -> str:
+    """Weak ETag of an artwork's comment list."""
+    return weak_etag("comments", artwork_id, count, newest.isoformat() if newest else "")
+
+
 @router.get("/comments/{artwork_id}", response_model=List[CommentResponse])
 async def get_comments(
     artwork_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get all comments for an artwork.
@@ -88,7 +105,23 @@ async def get_comments(
     - **artwork_id**: ID of the artwork
     
     Returns comments in descending order (newest first) with username.
+    The response carries a weak ETag (comment count and newest comment);
+    a matching If-None-Match gets 304 Not Modified after an aggregate
+    lookup instead of the full join.
+    
+    Rows are serialized directly with FastJSONResponse; response_model
+    only documents the shape.
     """
+    if has_conditional_headers(request):
+        stats = await db.execute(
+            select(func.count(Comment.id), func.max(Comment.created_at))
+            .where(Comment.artwork_id == artwork_id)
+        )
+        count, newest = stats.one()
+        etag = _comments_etag(artwork_id, count, newest)
+        if is_not_modified(request, etag):
+            return not_modified(etag)
+    
     # Query comments with user join
     query = (
         select(Comment, User.username)
@@ -100,23 +133,28 @@ async def get_comments(
     result = await db.execute(query)
     rows = result.all()
     
-    return [
-        CommentResponse(
-            id=comment.id,
-            user_id=comment.user_id,
-            artwork_id=comment.artwork_id,
-            username=username,
-            content=comment.content,
-            created_at=comment.created_at
-        )
-        for comment, username in rows
-    ]
+    newest = rows[0][0].created_at if rows else None
+    
+    return FastJSONResponse(
+        [
+            {
+                "id": comment.id,
+                "user_id": comment.user_id,
+                "artwork_id": comment.artwork_id,
+                "username": username,
+                "content": comment.content,
+                "created_at": comment.created_at,
+            }
+            for comment, username in rows
+        ],
+        headers=validator_headers(_comments_etag(artwork_id, len(rows), newest)),
+    )
 
 
 @router.delete("/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_comment(
     comment_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -148,6 +186,7 @@ async def delete_comment(
         )
     
     await db.delete(comment)
+    await adjust_artwork_counter(db, comment.artwork_id, "comment_count", -1)
     await db.commit()
     
     return None
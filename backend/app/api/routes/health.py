@@ -5,16 +5,27 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from app.api.deps import get_db
+from app.db.pool import pool_stats
+from app.db.session import engine, read_router, replica_engines
 
 router = APIRouter()
 
 
 @router.get("/health")
 async def health_check(db: AsyncSession = Depends(get_db)):
-    """Health check endpoint to verify API and database connectivity."""
+    """
+    Health check endpoint to verify API and database connectivity.
+    
+    Also reports this worker's connection pool usage and checkout wait times,
+    plus replica pools and read routing counters when replicas are configured.
+    """
+    pools = {"pool": pool_stats(engine)}
+    if replica_engines:
+        pools["replica_pools"] = [pool_stats(replica) for replica in replica_engines]
+        pools["read_routing"] = read_router.stats()
     try:
         # Test database connection
         await db.execute(text("SELECT 1"))
-        return {"status": "ok", "database": "connected"}
+        return {"status": "ok", "database": "connected", **pools}
     except Exception as e:
-        return {"status": "error", "database": "disconnected", "error": str(e)}
+        return {"status": "error", "database": "disconnected", "error": str(e), **pools}
@@ -6,14 +6,21 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
-from app.api.deps import get_db, get_current_user
-from app.models.user import User
+from app.api.deps import get_db, get_read_db, get_current_user
+from app.core.user_cache import UserPrincipal
 from app.models.like import Like
 from app.models.artwork import Artwork
-from pydantic import BaseModel
+from app.core.responses import FastJSONResponse
+from app.db.routing import read_only
+from app.services.counters import adjust_artwork_counter
+from app.services.likes import get_liked_artwork_ids
+from pydantic import BaseModel, Field
 
 router = APIRouter()
 
+# Maximum number of artwork IDs accepted by the batch like check
+LIKES_CHECK_MAX_IDS = 100
+
 
 class LikedArtworkResponse(BaseModel):
     """Response model for liked artwork."""
@@ -24,6 +31,20 @@ class LikedArtworkResponse(BaseModel):
     image_url: str
 
 
+# Columns selected for /likes/me (exactly the LikedArtworkResponse fields)
+LIKED_ARTWORK_COLUMNS = [getattr(Artwork, field) for field in LikedArtworkResponse.model_fields]
+
+
+class LikeCheckRequest(BaseModel):
+    """Request model for batch like-status checks."""
+    artwork_ids: List[UUID] = Field(..., max_length=LIKES_CHECK_MAX_IDS)
+
+
+class LikeCheckResponse(BaseModel):
+    """Response model for batch like-status checks."""
+    liked: List[UUID]
+
+
 class StyleStatsResponse(BaseModel):
     """Response model for style statistics."""
     style: str
@@ -31,10 +52,31 @@ class StyleStatsResponse(BaseModel):
     percentage: float
 
 
+# Declared before POST /likes/{artwork_id} so "check" is not parsed as an ID
+@router.post("/likes/check", response_model=LikeCheckResponse)
+@read_only
+async def check_liked_batch(
+    check_data: LikeCheckRequest,
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Check which of several artworks are liked by the current user.
+    
+    - **artwork_ids**: Up to 100 artwork IDs (e.g. every card on a gallery page)
+    
+    Returns {"liked": [ids]} with the subset that is liked, in request order.
+    """
+    liked_ids = await get_liked_artwork_ids(db, current_user.id, check_data.artwork_ids)
+    return LikeCheckResponse(
+        liked=[artwork_id for artwork_id in dict.fromkeys(check_data.artwork_ids) if artwork_id in liked_ids]
+    )
+
+
 @router.post("/likes/{artwork_id}", status_code=status.HTTP_200_OK)
 async def like_artwork(
     artwork_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -74,6 +116,7 @@ async def like_artwork(
         artwork_id=artwork_id
     )
     db.add(new_like)
+    await adjust_artwork_counter(db, artwork_id, "like_count", 1)
     await db.commit()
     
     return {"message": "Artwork liked successfully", "liked": True}
@@ -82,7 +125,7 @@ async def like_artwork(
 @router.delete("/likes/{artwork_id}", status_code=status.HTTP_200_OK)
 async def unlike_artwork(
     artwork_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -109,6 +152,7 @@ async def unlike_artwork(
         )
     
     await db.delete(like)
+    await adjust_artwork_counter(db, artwork_id, "like_count", -1)
     await db.commit()
     
     return {"message": "Artwork unliked successfully", "liked": False}
@@ -116,41 +160,32 @@ async def unlike_artwork(
 
 @router.get("/likes/me", response_model=List[LikedArtworkResponse])
 async def get_my_likes(
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get all liked artworks for the current user.
     
-    Returns list of liked artworks with basic information.
+    Returns list of liked artworks with basic information, serialized
+    directly from the rows (response_model documents the shape).
     """
-    # Query likes with artwork join
+    # Query likes with artwork join (only the response columns, as plain rows)
     query = (
-        select(Artwork)
+        select(*LIKED_ARTWORK_COLUMNS)
         .join(Like, Like.artwork_id == Artwork.id)
         .where(Like.user_id == current_user.id)
         .order_by(Like.created_at.desc())
     )
     
     result = await db.execute(query)
-    artworks = result.scalars().all()
     
-    return [
-        LikedArtworkResponse(
-            id=artwork.id,
-            title=artwork.title,
-            artist=artwork.artist,
-            style=artwork.style,
-            image_url=artwork.image_url
-        )
-        for artwork in artworks
-    ]
+    return FastJSONResponse([row._asdict() for row in result.all()])
 
 
 @router.get("/likes/me/stats", response_model=List[StyleStatsResponse])
 async def get_my_likes_stats(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: UserPrincipal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get statistics about liked artworks by style.
@@ -192,7 +227,7 @@ async def get_my_likes_stats(
 @router.get("/likes/check/{artwork_id}")
 async def check_if_liked(
     artwork_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -0,0 +1,56 @@
+"""
+Prometheus metrics endpoint.
+"""
+from typing import Dict, Iterable, List, Tuple
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.core.hashing import password_hasher
+from app.core.metrics import metrics_registry
+from app.core.user_cache import user_cache
+from app.db.pool import pool_stats
+from app.db.session import engine, read_router, replica_engines
+from app.services.view_counter import view_counter
+
+router = APIRouter()
+
+# Values that only ever grow; the rest are point-in-time gauges
+_POOL_COUNTERS = {"checkouts", "timeouts", "wait_seconds_total"}
+_HASHER_COUNTERS = {"completed", "rejected"}
+_USER_CACHE_COUNTERS = {"hits", "misses", "evictions", "invalidations"}
+_VIEW_COUNTER_COUNTERS = {"recorded", "flushed", "flushes", "failures"}
+_READ_ROUTING_COUNTERS = {"replica_reads", "primary_reads"}
+
+
+def _samples(
+    prefix: str, stats: Dict[str, float], counters: Iterable[str], labels: str = ""
+) -> List[Tuple[str, str, float]]:
+    """Turn a stats() dictionary into (name, type, value) samples, skipping non-numeric values."""
+    return [
+        (f"{prefix}_{name}{labels}", "counter" if name in counters else "gauge", value)
+        for name, value in stats.items()
+        if isinstance(value, (int, float))
+    ]
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """
+    Request metrics of this worker in the Prometheus text format.
+    
+    Per route template: request counts by status, wall time and SQL statement
+    histograms, SQL / template render time and response bytes. Also reports
+    the primary and replica connection pools, read routing, the password
+    hashing pool, the user cache and the view counter buffer.
+    """
+    extra = _samples("db_pool", pool_stats(engine), _POOL_COUNTERS)
+    if replica_engines:
+        for index, replica in enumerate(replica_engines):
+            extra += _samples("db_replica_pool", pool_stats(replica), _POOL_COUNTERS, f'{{replica="{index}"}}')
+        extra += _samples("db_read_routing", read_router.stats(), _READ_ROUTING_COUNTERS)
+    extra += _samples("password_hasher", password_hasher.stats(), _HASHER_COUNTERS)
+    extra += _samples("user_cache", user_cache.stats(), _USER_CACHE_COUNTERS)
+    extra += _samples("view_counter", view_counter.stats(), _VIEW_COUNTER_COUNTERS)
+    return PlainTextResponse(
+        metrics_registry.render(extra),
+        media_type="text/plain; version=0.0.4",
+    )
@@ -24,11 +24,66 @@ class Settings(BaseSettings):
         "postgresql+asyncpg://postgres:postgres@db:5432/artgallery"
     )
     
+    # Optional read replicas (comma-separated URLs) for read-only routes
+    DATABASE_REPLICA_URLS: str = os.getenv("DATABASE_REPLICA_URLS", "")
+    # Seconds a client's reads stay on the primary after its own write
+    READ_YOUR_WRITES_SECONDS: float = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+    
+    # Record per-route request metrics (GET /metrics) and send Server-Timing headers
+    REQUEST_METRICS_ENABLED: bool = os.getenv("REQUEST_METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+    
+    # Development/CI detector for repeated (N+1) and slow SQL statements, per
+    # request or script run; findings are logged as warnings
+    QUERY_DETECTOR_ENABLED: bool = os.getenv("QUERY_DETECTOR_ENABLED", "false").lower() in ("1", "true", "yes")
+    # Flag a normalized statement executed more than this many times
+    QUERY_DETECTOR_REPEAT_THRESHOLD: int = int(os.getenv("QUERY_DETECTOR_REPEAT_THRESHOLD", "5"))
+    # Flag a single execution slower than this many milliseconds
+    QUERY_DETECTOR_SLOW_MS: float = float(os.getenv("QUERY_DETECTOR_SLOW_MS", "100"))
+    
+    # Schema handling at worker boot: "check" (refuse to start if migrations are
+    # pending), "migrate" (apply them; single-process development) or "skip".
+    # Migrations are applied with: python -m app.scripts.migrate
+    SCHEMA_BOOT_MODE: str = os.getenv("SCHEMA_BOOT_MODE", "check")
+    
+    # Connection pool, per worker process (size x workers must fit max_connections)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    # Seconds a request waits for a free connection before failing
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # Replace connections older than this many seconds (-1 disables)
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    # Test connections on checkout so dropped ones are replaced transparently
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+    
+    # asyncpg statement caches (0 disables; needed behind pgbouncer in transaction mode)
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "100"))
+    # PostgreSQL session settings sent on connect
+    DB_APPLICATION_NAME: str = os.getenv("DB_APPLICATION_NAME", "artgallery")
+    DB_JIT: str = os.getenv("DB_JIT", "off")
+    
     # Security
     SECRET_KEY: str = os.getenv("SECRET_KEY", secrets.token_urlsafe(32))
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
     
+    # Authenticated-user cache (token -> principal), per process
+    USER_CACHE_TTL_SECONDS: int = int(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+    USER_CACHE_MAX_ENTRIES: int = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
+    
+    # Password hashing pool (bcrypt runs off the event loop in these threads)
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+    # Hash/verify calls allowed to wait for a worker before new ones get 503
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+    
+    # Write-behind artwork view counter
+    VIEW_COUNTER_FLUSH_SECONDS: float = float(os.getenv("VIEW_COUNTER_FLUSH_SECONDS", "5"))
+    VIEW_COUNTER_SHARDS: int = int(os.getenv("VIEW_COUNTER_SHARDS", "16"))
+    
+    # Reference data (categories, style list): in-process cache lifetime and
+    # the max-age browsers/proxies may reuse it for
+    REFERENCE_CACHE_TTL_SECONDS: int = int(os.getenv("REFERENCE_CACHE_TTL_SECONDS", "60"))
+    
     # Static files - WikiArt dataset location
     STATIC_FILES_DIR: str = os.getenv("STATIC_FILES_DIR", "/app/ml/input/wikiart")
     
@@ -37,6 +92,10 @@ class Settings(BaseSettings):
         "ARTWORKS_BASE_URL",
         "https://artappspace.nyc3.digitaloceanspaces.com"
     )
+    
+    # CDN bucket listing used by the admin "available artworks" scan
+    CDN_CATALOG_TTL_SECONDS: int = int(os.getenv("CDN_CATALOG_TTL_SECONDS", "300"))
+    CDN_CATALOG_CONCURRENCY: int = int(os.getenv("CDN_CATALOG_CONCURRENCY", "4"))
 
 
 settings = Settings()
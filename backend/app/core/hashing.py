@@ -0,0 +1,118 @@
+"""
+Async password hashing service.
+
+bcrypt hashing and verification are CPU-bound (~100-300 ms each), so they
+run in a bounded thread pool instead of on the event loop. bcrypt releases
+the GIL while hashing, so threads give real parallelism up to the worker
+count. Calls beyond the worker count queue up to a configurable depth and
+are rejected with PasswordHasherBusy after that.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Raised when the hashing queue is full."""
+
+
+class PasswordHasher:
+    """Bounded thread-pool front end for bcrypt hashing and verification."""
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._peak_queued = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the worker pool on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hash",
+                )
+            return self._executor
+
+    def _call(self, fn: Callable, *args):
+        """Run fn in a worker thread, keeping the queue counters current."""
+        with self._lock:
+            self._queued -= 1
+            self._in_flight += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+
+    async def _submit(self, fn: Callable, *args):
+        """Queue fn on the pool, rejecting when the queue is full."""
+        executor = self._get_executor()
+        with self._lock:
+            if self._queued + self._in_flight >= self.max_workers + self.max_pending:
+                self._rejected += 1
+                raise PasswordHasherBusy("Password hashing queue is full")
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        future = executor.submit(self._call, fn, *args)
+        # A caller cancelled while the job is still queued (e.g. a client
+        # disconnecting during login) cancels the job too, so _call never runs
+        # to release its slot; release it here instead
+        future.add_done_callback(self._release_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def _release_cancelled(self, future) -> None:
+        """Release the queue slot of a job cancelled before it started."""
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    async def hash(self, password: str) -> str:
+        """Hash a password without blocking the event loop."""
+        return await self._submit(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against a hash without blocking the event loop."""
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return pool metrics.
+
+        Returns:
+            Dictionary with worker/queue limits, current queue depth,
+            in-flight calls and completed/rejected totals
+        """
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "queue_depth": self._queued,
+                "peak_queue_depth": self._peak_queued,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool; it is recreated on next use."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
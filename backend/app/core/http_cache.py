@@ -0,0 +1,117 @@
+"""
+HTTP validator helpers (ETag / Last-Modified, If-None-Match /
+If-Modified-Since) for cacheable responses.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+from fastapi import Request, Response
+
+# Clients may store responses but must revalidate before reuse
+REVALIDATE = "no-cache"
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a strong ETag from the given parts (bytes or anything str()-able).
+    
+    The tag only depends on the parts, so every worker process derives the
+    same ETag for the same content.
+    """
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode())
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()}"'
+
+
+def weak_etag(*parts) -> str:
+    """Build a weak ETag (semantically, not byte-for-byte, equivalent content)."""
+    return f"W/{make_etag(*parts)}"
+
+
+def http_date(value: datetime) -> str:
+    """Format a naive-UTC or aware datetime as an HTTP date."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match covers the given ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison, as If-None-Match requires
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    Evaluate the request's conditional headers against the current validators.
+    
+    If-None-Match takes precedence; If-Modified-Since is only consulted when
+    it is absent and a last-modified time is known (compared in whole seconds).
+    """
+    if request.headers.get("if-none-match"):
+        return etag_matches(request, etag)
+    since = request.headers.get("if-modified-since")
+    if not since or last_modified is None:
+        return False
+    try:
+        since_time = parsedate_to_datetime(since)
+    except (TypeError, ValueError):
+        return False
+    if since_time.tzinfo is None:
+        since_time = since_time.replace(tzinfo=timezone.utc)
+    modified = last_modified if last_modified.tzinfo else last_modified.replace(tzinfo=timezone.utc)
+    return modified.replace(microsecond=0) <= since_time
+
+
+def validator_headers(
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = REVALIDATE,
+) -> Dict[str, str]:
+    """Build the ETag / Last-Modified / Cache-Control response headers."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified(
+    etag: str,
+    cache_control: str = REVALIDATE,
+    last_modified: Optional[datetime] = None,
+) -> Response:
+    """Build a 304 response carrying the validators."""
+    return Response(status_code=304, headers=validator_headers(etag, last_modified, cache_control))
+
+
+def has_conditional_headers(request: Request) -> bool:
+    """Return True if the request carries If-None-Match or If-Modified-Since."""
+    return bool(request.headers.get("if-none-match") or request.headers.get("if-modified-since"))
+
+
+def cached_json_response(request: Request, body: bytes, etag: str, cache_control: str) -> Response:
+    """
+    Return pre-serialized JSON, or 304 if the client already has this version.
+    
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        body: Serialized JSON body
+        etag: ETag of the body
+        cache_control: Cache-Control header value
+    """
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
@@ -0,0 +1,130 @@
+"""
+Per-request instrumentation: wall time, SQL statements, template rendering
+and response size.
+
+InstrumentationMiddleware opens a RequestStats for each HTTP request in a
+context variable. SQLAlchemy engine events add every statement executed
+while it is open (engine events run in the request's context, also through
+the async greenlet bridge), and TimedJinja2Templates adds the time spent
+rendering templates. When the response starts, the totals are sent as a
+Server-Timing header (visible in the browser's network panel); when it
+ends, they are recorded in metrics_registry under the matched route
+template, which GET /metrics exposes.
+"""
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+from fastapi.templating import Jinja2Templates
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.metrics import metrics_registry
+
+
+@dataclass
+class RequestStats:
+    """Counters for the request being handled."""
+    sql_count: int = 0
+    sql_seconds: float = 0.0
+    render_seconds: float = 0.0
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    """Return the stats of the request being handled, if instrumented."""
+    return _request_stats.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_stats.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_start_time")
+    if starts:
+        stats.sql_seconds += time.perf_counter() - starts.pop()
+    stats.sql_count += 1
+
+
+class TimedJinja2Templates(Jinja2Templates):
+    """Jinja2Templates that adds template load and render time to the request stats."""
+
+    def TemplateResponse(self, *args, **kwargs):
+        stats = _request_stats.get()
+        if stats is None:
+            return super().TemplateResponse(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return super().TemplateResponse(*args, **kwargs)
+        finally:
+            stats.render_seconds += time.perf_counter() - start
+
+
+def server_timing(stats: RequestStats, app_seconds: float) -> str:
+    """Format the Server-Timing header value (durations in milliseconds)."""
+    return (
+        f"app;dur={app_seconds * 1000:.1f}, "
+        f'db;dur={stats.sql_seconds * 1000:.1f};desc="{stats.sql_count} queries", '
+        f"tpl;dur={stats.render_seconds * 1000:.1f}"
+    )
+
+
+def route_template(scope) -> str:
+    """
+    Return the matched route's path template (e.g. /artworks/{artwork_id}),
+    so a route is one series rather than one per path, or "unmatched".
+    """
+    # FastAPI stores the matched APIRoute in the scope during routing
+    return getattr(scope.get("route"), "path", "unmatched")
+
+
+class InstrumentationMiddleware:
+    """ASGI middleware that times requests and records them per route template."""
+
+    def __init__(self, app, registry=metrics_registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        start = time.perf_counter()
+        status = 500
+        response_bytes = 0
+
+        async def send_wrapper(message):
+            nonlocal status, response_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                timing = server_timing(stats, time.perf_counter() - start)
+                message = {**message, "headers": [*message.get("headers", []), (b"server-timing", timing.encode())]}
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_stats.reset(token)
+            self.registry.observe_request(
+                method=scope["method"],
+                route=route_template(scope),
+                status=status,
+                seconds=time.perf_counter() - start,
+                statements=stats.sql_count,
+                db_seconds=stats.sql_seconds,
+                render_seconds=stats.render_seconds,
+                response_bytes=response_bytes,
+            )
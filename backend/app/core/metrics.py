@@ -0,0 +1,152 @@
+"""
+In-process request metrics in the Prometheus text exposition format.
+
+Per route template (e.g. /api/v1/artworks/{artwork_id}) and method, the
+registry keeps request counts by status, histograms of wall time and SQL
+statements per request, and totals of SQL time, template render time and
+response bytes. Values are per worker process; Prometheus sums them across
+workers when scraping each one.
+"""
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+
+# Histogram bucket upper bounds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+@dataclass
+class _Histogram:
+    """Cumulative-on-render histogram."""
+    bounds: Tuple[float, ...]
+    counts: List[int] = field(init=False)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        self.counts = [0] * len(self.bounds)
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+    def lines(self, name: str, labels: str) -> Iterable[str]:
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            yield f'{name}_bucket{{{labels},le="{bound:g}"}} {cumulative}'
+        yield f'{name}_bucket{{{labels},le="+Inf"}} {self.count}'
+        yield f"{name}_sum{{{labels}}} {self.total:.6f}"
+        yield f"{name}_count{{{labels}}} {self.count}"
+
+
+@dataclass
+class _RouteMetrics:
+    """Aggregates for one (method, route) pair."""
+    statuses: Dict[int, int] = field(default_factory=dict)
+    duration: _Histogram = field(default_factory=lambda: _Histogram(DURATION_BUCKETS))
+    statements: _Histogram = field(default_factory=lambda: _Histogram(STATEMENT_BUCKETS))
+    db_seconds: float = 0.0
+    render_seconds: float = 0.0
+    response_bytes: int = 0
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """Request metrics of this worker process."""
+
+    def __init__(self):
+        self._routes: Dict[Tuple[str, str], _RouteMetrics] = {}
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        statements: int,
+        db_seconds: float,
+        render_seconds: float,
+        response_bytes: int,
+    ) -> None:
+        """Record one finished request."""
+        metrics = self._routes.get((method, route))
+        if metrics is None:
+            metrics = self._routes[(method, route)] = _RouteMetrics()
+        metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+        metrics.duration.observe(seconds)
+        metrics.statements.observe(statements)
+        metrics.db_seconds += db_seconds
+        metrics.render_seconds += render_seconds
+        metrics.response_bytes += response_bytes
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        self._routes.clear()
+
+    def render(self, extra: Iterable[Tuple[str, str, float]] = ()) -> str:
+        """
+        Render the metrics in the Prometheus text format (version 0.0.4).
+
+        Args:
+            extra: Additional samples as (name, type, value), where type is
+                "gauge" or "counter"; name may carry labels, e.g.
+                db_replica_pool_in_use{replica="0"}
+        """
+        routes = sorted(self._routes.items())
+        labelled = [
+            (f'method="{_escape(method)}",route="{_escape(route)}"', metrics)
+            for (method, route), metrics in routes
+        ]
+        lines = [
+            "# HELP http_requests_total Requests by route template and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for labels, metrics in labelled:
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(f'http_requests_total{{{labels},status="{status}"}} {count}')
+
+        lines += [
+            "# HELP http_request_duration_seconds Request wall time.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for labels, metrics in labelled:
+            lines.extend(metrics.duration.lines("http_request_duration_seconds", labels))
+
+        lines += [
+            "# HELP http_request_db_statements SQL statements executed per request.",
+            "# TYPE http_request_db_statements histogram",
+        ]
+        for labels, metrics in labelled:
+            lines.extend(metrics.statements.lines("http_request_db_statements", labels))
+
+        totals = (
+            ("http_request_db_seconds_total", "Time spent executing SQL.", "db_seconds"),
+            ("http_request_render_seconds_total", "Time spent rendering templates.", "render_seconds"),
+            ("http_response_size_bytes_total", "Response body bytes sent.", "response_bytes"),
+        )
+        for name, help_text, attribute in totals:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for labels, metrics in labelled:
+                value = getattr(metrics, attribute)
+                lines.append(f"{name}{{{labels}}} {value:.6f}" if isinstance(value, float) else f"{name}{{{labels}}} {value}")
+
+        # Samples of one metric family must be contiguous, under one TYPE line
+        families: Dict[str, Tuple[str, List[str]]] = {}
+        for name, metric_type, value in extra:
+            family = name.split("{", 1)[0]
+            families.setdefault(family, (metric_type, []))[1].append(f"{name} {value:g}")
+        for family, (metric_type, samples) in families.items():
+            lines += [f"# TYPE {family} {metric_type}", *samples]
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,84 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor is an opaque, URL-safe token encoding the sort name and the
+(sort key, id) tuple of the last row of a page. The next page is fetched
+with a row-value comparison against that tuple, so every page is a bounded
+index range scan regardless of how deep the client has paged.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional, Tuple
+from uuid import UUID
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def _encode_value(value: Any) -> Any:
+    """Convert a sort key value into a JSON-friendly representation."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(sort: str, key: Any, row_id: UUID) -> str:
+    """
+    Encode the position of a row into an opaque cursor.
+
+    Args:
+        sort: Sort name the page was produced with (e.g. "popularity")
+        key: Value of the sort column for the last row of the page
+        row_id: Primary key of the last row (tie-breaker)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps(
+        [sort, _encode_value(key), str(row_id)],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, Any, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string received from the client
+
+    Returns:
+        Tuple of (sort name, raw sort key, row id)
+
+    Raises:
+        InvalidCursor: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, TypeError, UnicodeDecodeError) as e:
+        raise InvalidCursor("Invalid cursor") from e
+    if not (
+        isinstance(payload, list)
+        and len(payload) == 3
+        and isinstance(payload[0], str)
+        and isinstance(payload[2], str)
+    ):
+        raise InvalidCursor("Invalid cursor")
+    sort, key, row_id = payload
+    try:
+        return sort, key, UUID(row_id)
+    except ValueError as e:
+        raise InvalidCursor("Invalid cursor") from e
+
+
+def parse_datetime_key(key: Optional[str]) -> datetime:
+    """Parse a datetime sort key stored in a cursor."""
+    try:
+        return datetime.fromisoformat(key)
+    except (TypeError, ValueError) as e:
+        raise InvalidCursor("Invalid cursor") from e
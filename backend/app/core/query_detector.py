@@ -0,0 +1,245 @@
+"""
+Slow-query and N+1 detector for development and CI.
+
+While a tracking scope is open (one HTTP request via QueryDetectorMiddleware,
+or a script run via query_detector.track()), every SQL statement is grouped
+by its normalized text (literals and bind placeholders replaced by ?), with
+its count, time and the application code that issued it. When the scope
+closes, statements executed more than QUERY_DETECTOR_REPEAT_THRESHOLD times,
+or slower than QUERY_DETECTOR_SLOW_MS in a single execution, are logged as
+findings.
+
+Tracking is off unless QUERY_DETECTOR_ENABLED is set or an observer is
+registered (the pytest query budget plugin does this), so production pays
+only one context variable lookup per statement.
+"""
+import logging
+import re
+import time
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.config import settings
+from app.core.instrumentation import route_template
+
+try:
+    import greenlet
+except ImportError:  # pragma: no cover - installed with SQLAlchemy's asyncio extra
+    greenlet = None
+
+logger = logging.getLogger(__name__)
+
+# Frames from files under this directory are attributed as the statement's origin
+_APP_DIR = str(Path(__file__).resolve().parents[1])
+_THIS_FILE = str(Path(__file__).resolve())
+
+# Application frames kept per origin, innermost first
+STACK_DEPTH = 3
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+|\?")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Reduce a statement to its shape, so executions differing only in
+    parameters group together.
+
+    Literals and placeholders (asyncpg $1, SQLite ?, pyformat) become ?, and
+    IN / VALUES lists of any length become (?, ...).
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(?, ...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def _caller_stack() -> List[str]:
+    """
+    Return the innermost application frames that led to the current statement.
+
+    Async sessions run statements in a greenlet whose own stack starts inside
+    SQLAlchemy; the awaiting coroutines (route, service) are on the parent
+    greenlet's stack, so both are walked.
+    """
+    frames = traceback.extract_stack()
+    if greenlet is not None:
+        parent = greenlet.getcurrent().parent
+        if parent is not None and parent.gr_frame is not None:
+            frames = traceback.extract_stack(parent.gr_frame) + frames
+    stack = []
+    for frame in reversed(frames):
+        # Skip ASGI middleware plumbing; keep routes, services and scripts
+        if frame.name == "__call__" or frame.filename == _THIS_FILE:
+            continue
+        if frame.filename.startswith(_APP_DIR):
+            relative = Path(frame.filename).relative_to(Path(_APP_DIR).parent)
+            stack.append(f"{relative}:{frame.lineno} in {frame.name}")
+            if len(stack) == STACK_DEPTH:
+                break
+    return stack
+
+
+@dataclass
+class StatementGroup:
+    """Executions of one normalized statement."""
+    sql: str
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    origins: Counter = field(default_factory=Counter)
+
+
+@dataclass
+class QueryFinding:
+    """A statement that was repeated too often or ran too slowly."""
+    kind: str  # "repeated" or "slow"
+    sql: str
+    count: int
+    total_ms: float
+    max_ms: float
+    stack: List[str]
+
+    def __str__(self) -> str:
+        where = " <- ".join(self.stack) or "unknown origin"
+        if self.kind == "repeated":
+            summary = f"executed {self.count} times ({self.total_ms:.1f} ms total)"
+        else:
+            summary = f"took {self.max_ms:.1f} ms"
+        return f"{summary} at {where}: {self.sql}"
+
+
+class QueryCollector:
+    """Statements executed within one tracking scope."""
+
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.groups: Dict[str, StatementGroup] = {}
+
+    @property
+    def statement_count(self) -> int:
+        return sum(group.count for group in self.groups.values())
+
+    def record(self, statement: str, seconds: float, stack: List[str]) -> None:
+        sql = normalize_sql(statement)
+        group = self.groups.get(sql)
+        if group is None:
+            group = self.groups[sql] = StatementGroup(sql)
+        group.count += 1
+        group.total_seconds += seconds
+        group.max_seconds = max(group.max_seconds, seconds)
+        group.origins[tuple(stack)] += 1
+
+    def findings(self, repeat_threshold: int, slow_ms: float) -> List[QueryFinding]:
+        """Return statements run more than repeat_threshold times or slower than slow_ms."""
+        findings = []
+        for group in self.groups.values():
+            stack = list(group.origins.most_common(1)[0][0])
+            if group.count > repeat_threshold:
+                findings.append(QueryFinding(
+                    "repeated", group.sql, group.count,
+                    group.total_seconds * 1000, group.max_seconds * 1000, stack,
+                ))
+            if group.max_seconds * 1000 > slow_ms:
+                findings.append(QueryFinding(
+                    "slow", group.sql, group.count,
+                    group.total_seconds * 1000, group.max_seconds * 1000, stack,
+                ))
+        return findings
+
+
+_collector: ContextVar[Optional[QueryCollector]] = ContextVar("query_collector", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _collector.get() is not None:
+        conn.info.setdefault("query_detector_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    collector = _collector.get()
+    starts = conn.info.get("query_detector_start")
+    if collector is None or not starts:
+        return
+    collector.record(statement, time.perf_counter() - starts.pop(), _caller_stack())
+
+
+class QueryDetector:
+    """Opens tracking scopes and reports their findings."""
+
+    def __init__(self, enabled: bool, repeat_threshold: int, slow_ms: float):
+        self.enabled = enabled
+        self.repeat_threshold = repeat_threshold
+        self.slow_ms = slow_ms
+        # Called with each finished QueryCollector (e.g. by the pytest plugin)
+        self.observers: List[Callable[[QueryCollector], None]] = []
+
+    @property
+    def active(self) -> bool:
+        return self.enabled or bool(self.observers)
+
+    @contextmanager
+    def track(self, label: str = "") -> Iterator[QueryCollector]:
+        """
+        Collect the statements executed inside the block (in this context).
+
+        Does nothing unless the detector is active, so scripts can wrap their
+        whole run unconditionally.
+        """
+        collector = QueryCollector(label)
+        if not self.active:
+            yield collector
+            return
+        token = _collector.set(collector)
+        try:
+            yield collector
+        finally:
+            _collector.reset(token)
+            self.finish(collector)
+
+    def finish(self, collector: QueryCollector) -> None:
+        """Log a finished scope's findings and pass it to the observers."""
+        if self.enabled:
+            for finding in collector.findings(self.repeat_threshold, self.slow_ms):
+                logger.warning(f"[{collector.label}] {finding.kind} query {finding}")
+        for observer in self.observers:
+            observer(collector)
+
+
+query_detector = QueryDetector(
+    enabled=settings.QUERY_DETECTOR_ENABLED,
+    repeat_threshold=settings.QUERY_DETECTOR_REPEAT_THRESHOLD,
+    slow_ms=settings.QUERY_DETECTOR_SLOW_MS,
+)
+
+
+class QueryDetectorMiddleware:
+    """ASGI middleware that tracks each HTTP request as one scope."""
+
+    def __init__(self, app, detector: QueryDetector = query_detector):
+        self.app = app
+        self.detector = detector
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.detector.active:
+            await self.app(scope, receive, send)
+            return
+
+        with self.detector.track() as collector:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                # Label once routing has matched, by route template
+                collector.label = f"{scope['method']} {route_template(scope)}"
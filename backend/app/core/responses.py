@@ -0,0 +1,47 @@
+"""
+Fast JSON response class for pre-shaped, trusted payloads.
+
+Routes that build plain dicts/lists straight from database rows can return
+FastJSONResponse(content) instead of going through response_model
+validation and jsonable_encoder. Encoding uses orjson when it is installed
+(UUID and datetime are handled natively) and falls back to the stdlib
+encoder otherwise, producing the same JSON.
+"""
+import json
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode the non-JSON types that appear in row payloads."""
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize a payload to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response that serializes content as-is, without validation.
+    
+    Only use it for payloads built from trusted data; the route's
+    response_model then documents the shape but is not enforced.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -43,7 +43,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-def decode_access_token(token: str) -> Optional[str]:
+def decode_token_payload(token: str) -> Optional[dict]:
     """
     Decode and verify JWT access token.
     
@@ -51,11 +51,26 @@ def decode_access_token(token: str) -> Optional[str]:
         token: JWT token to decode
         
     Returns:
-        Subject (user_id) from token payload, or None if invalid
+        Full token payload (including "sub" and "exp"), or None if invalid
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: str = payload.get("sub")
-        return user_id
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     except JWTError:
         return None
+
+
+def decode_access_token(token: str) -> Optional[str]:
+    """
+    Decode and verify JWT access token.
+    
+    Args:
+        token: JWT token to decode
+        
+    Returns:
+        Subject (user_id) from token payload, or None if invalid
+    """
+    payload = decode_token_payload(token)
+    if payload is None:
+        return None
+    user_id: str = payload.get("sub")
+    return user_id
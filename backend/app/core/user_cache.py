@@ -0,0 +1,180 @@
+"""
+In-process cache of authenticated users.
+
+Maps a raw access token to a lightweight UserPrincipal so that
+authenticated requests (and role checks) skip both JWT decoding and the
+users lookup. Entries expire after USER_CACHE_TTL_SECONDS or when the token
+expires, whichever comes first, and the least recently used entries are
+evicted beyond USER_CACHE_MAX_ENTRIES.
+
+Committed changes to a user row (role change, password reset,
+deactivation, deletion) invalidate that user's entries through session
+events, so every write path is covered without explicit calls. The cache
+is per process; other workers converge within the TTL.
+"""
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Tuple
+from uuid import UUID
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.user import User
+
+_SESSION_KEY = "user_cache_invalidate"
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """Authenticated user as seen by request handlers."""
+    id: UUID
+    email: str
+    username: str
+    role: str
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserPrincipal":
+        """Build a principal from a User row."""
+        return cls(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            role=user.role,
+            is_active=user.is_active,
+        )
+
+
+class UserCache:
+    """Thread-safe TTL + LRU cache of token -> UserPrincipal."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[UserPrincipal, float]]" = OrderedDict()
+        self._tokens_by_user: Dict[UUID, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _remove(self, token: str) -> None:
+        """Drop one entry (caller holds the lock)."""
+        principal, _ = self._entries.pop(token)
+        tokens = self._tokens_by_user.get(principal.id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[principal.id]
+
+    def get(self, token: str) -> Optional[UserPrincipal]:
+        """Return the cached principal for a token, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            principal, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(token)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return principal
+
+    def put(self, token: str, principal: UserPrincipal, token_exp: Optional[float] = None) -> None:
+        """
+        Cache a principal for a token.
+
+        Args:
+            token: Raw access token
+            principal: Principal resolved for the token
+            token_exp: Token "exp" claim (Unix time), caps the entry lifetime
+        """
+        ttl = self.ttl_seconds
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+        if ttl <= 0:
+            return
+        with self._lock:
+            if token in self._entries:
+                self._remove(token)
+            self._entries[token] = (principal, time.monotonic() + ttl)
+            self._tokens_by_user.setdefault(principal.id, set()).add(token)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        """Drop every cached token of a user."""
+        with self._lock:
+            for token in list(self._tokens_by_user.get(user_id, ())):
+                self._remove(token)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction/invalidation counters and current size."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+user_cache = UserCache(
+    max_entries=settings.USER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session, flush_context):
+    """Remember users whose rows changed in this transaction."""
+    for obj in itertools.chain(session.dirty, session.deleted):
+        if isinstance(obj, User):
+            session.info.setdefault(_SESSION_KEY, set()).add(obj.id)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_user_changes(orm_execute_state):
+    """Bulk UPDATE/DELETE on users cannot be attributed to ids; clear everything."""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) == User.__tablename__:
+        orm_execute_state.session.info.setdefault(_SESSION_KEY, set()).add(None)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    """Invalidate cached principals once the user changes are committed."""
+    user_ids = session.info.pop(_SESSION_KEY, None)
+    if not user_ids:
+        return
+    if None in user_ids:
+        user_cache.clear()
+        return
+    for user_id in user_ids:
+        user_cache.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    """Forget collected ids for changes that were rolled back."""
+    session.info.pop(_SESSION_KEY, None)
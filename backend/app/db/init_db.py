@@ -1,14 +1,60 @@
 """
 Database initialization utilities.
+
+These idempotent steps are applied as versioned migrations by
+app.db.migrations.
 """
-from sqlmodel import SQLModel
-from app.db.session import engine
-from app.models.user import User
-from app.models.category import Category
-from app.models.artwork import Artwork
+import logging
+from sqlalchemy import inspect, text
+from app.models.artwork import Artwork, COUNTER_COLUMNS, IMAGE_PATH_UNIQUE_INDEX, LISTING_INDEXES
+
+logger = logging.getLogger(__name__)
+
+
+def add_counter_columns(connection) -> None:
+    """
+    Add the artwork counter columns to databases created before them.
+
+    New columns start at 0; run app.scripts.reconcile_counters to backfill.
+    """
+    existing = {column["name"] for column in inspect(connection).get_columns(Artwork.__tablename__)}
+    for name, ddl in COUNTER_COLUMNS.items():
+        if name not in existing:
+            connection.execute(text(f"ALTER TABLE {Artwork.__tablename__} ADD COLUMN {name} {ddl}"))
+
+
+def create_listing_indexes(connection) -> None:
+    """
+    Create the managed artwork listing indexes if they are missing.
+
+    create_all only emits CREATE INDEX for tables it creates, so databases
+    that predate an index need this pass to pick it up.
+    """
+    for index in LISTING_INDEXES:
+        index.create(connection, checkfirst=True)
+
 
+def create_image_path_index(connection) -> None:
+    """
+    Create the unique image_path index on PostgreSQL if it is missing.
+    
+    Databases that already hold duplicate paths are left alone (with a
+    warning) so migrating does not fail; remove the duplicates and run
+    python -m app.scripts.migrate --reapply 4.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    duplicate = connection.execute(
+        text(
+            f"SELECT image_path FROM {Artwork.__tablename__} "
+            "GROUP BY image_path HAVING count(*) > 1 LIMIT 1"
+        )
+    ).first()
+    if duplicate:
+        logger.warning(
+            f"Not creating {IMAGE_PATH_UNIQUE_INDEX.name}: duplicate image_path values exist "
+            f"(e.g. {duplicate[0]!r})"
+        )
+        return
+    IMAGE_PATH_UNIQUE_INDEX.create(connection, checkfirst=True)
 
-async def init_db():
-    """Create all database tables."""
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
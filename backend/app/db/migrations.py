@@ -0,0 +1,149 @@
+"""
+Versioned schema bootstrap.
+
+Schema changes are an ordered list of migrations, each recorded in
+schema_migrations once applied. They are applied by one explicit step
+(python -m app.scripts.migrate) under a PostgreSQL advisory lock, so
+concurrent runs serialize and only the first does any DDL. Web workers
+only compare the recorded version with SCHEMA_VERSION at boot (one
+indexed query), or skip even that (see ensure_schema).
+
+The first migrations wrap the idempotent steps init_db used to run on
+every start, so databases created before versioning are adopted safely.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import SQLModel
+import app.models  # registers every table on SQLModel.metadata
+from app.db.init_db import (
+    add_counter_columns,
+    create_image_path_index,
+    create_listing_indexes,
+)
+from app.models.schema_migration import SchemaMigration
+from app.services.search import create_search_indexes
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_xact_lock key held while migrating ("ARTGAL" in ASCII)
+MIGRATION_LOCK_KEY = 0x415254474C
+
+
+class SchemaOutOfDate(RuntimeError):
+    """Raised at boot when the database is behind the code's schema version."""
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema step, run with a synchronous connection."""
+    version: int
+    name: str
+    apply: Callable
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "create tables", SQLModel.metadata.create_all),
+    Migration(2, "artwork counter columns", add_counter_columns),
+    Migration(3, "artwork listing indexes", create_listing_indexes),
+    Migration(4, "unique artwork image_path index", create_image_path_index),
+    Migration(5, "search column and indexes", create_search_indexes),
+]
+
+# Schema version this code expects
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+async def current_version(engine: AsyncEngine) -> int:
+    """Return the database's schema version (0 if it was never migrated)."""
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(select(func.max(SchemaMigration.version)))
+        except DBAPIError:
+            # No schema_migrations table yet
+            return 0
+        return result.scalar() or 0
+
+
+async def migrate(engine: AsyncEngine) -> List[Migration]:
+    """
+    Apply every pending migration in one transaction.
+
+    On PostgreSQL the transaction holds an advisory lock, so concurrent
+    runners wait and then find nothing left to do.
+
+    Returns:
+        Migrations applied by this call, in order
+    """
+    async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        await conn.run_sync(SchemaMigration.__table__.create, checkfirst=True)
+        result = await conn.execute(select(SchemaMigration.version))
+        applied = set(result.scalars().all())
+        pending = [migration for migration in MIGRATIONS if migration.version not in applied]
+        for migration in pending:
+            logger.info(f"Applying schema migration {migration.version}: {migration.name}")
+            await conn.run_sync(migration.apply)
+            await conn.execute(
+                insert(SchemaMigration.__table__).values(
+                    version=migration.version,
+                    name=migration.name,
+                    applied_at=datetime.utcnow(),
+                )
+            )
+    return pending
+
+
+async def reapply(engine: AsyncEngine, version: int) -> Migration:
+    """
+    Run one already-recorded migration again (the steps are idempotent).
+
+    Useful when a step was skipped, e.g. the unique image_path index on a
+    database that still had duplicate paths.
+
+    Raises:
+        ValueError: If no migration has that version
+    """
+    migration = next((m for m in MIGRATIONS if m.version == version), None)
+    if migration is None:
+        raise ValueError(f"No schema migration with version {version}")
+    async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        logger.info(f"Re-applying schema migration {migration.version}: {migration.name}")
+        await conn.run_sync(migration.apply)
+    return migration
+
+
+async def ensure_schema(engine: AsyncEngine, mode: str) -> None:
+    """
+    Boot-time schema handling for a web worker.
+
+    Args:
+        engine: Primary database engine
+        mode: "check" (fail fast if the schema is behind), "migrate" (apply
+            pending migrations, for single-process development) or "skip"
+
+    Raises:
+        SchemaOutOfDate: In "check" mode, if migrations are pending
+        ValueError: For an unknown mode
+    """
+    if mode == "skip":
+        return
+    if mode not in ("check", "migrate"):
+        raise ValueError(f"Unknown SCHEMA_BOOT_MODE {mode!r} (expected check, migrate or skip)")
+    version = await current_version(engine)
+    if version >= SCHEMA_VERSION:
+        return
+    if mode == "migrate":
+        await migrate(engine)
+        return
+    raise SchemaOutOfDate(
+        f"Database schema version {version} is behind {SCHEMA_VERSION}; "
+        "run `python -m app.scripts.migrate` before starting workers"
+    )
@@ -0,0 +1,87 @@
+"""
+Connection pool instrumentation.
+
+MeteredQueuePool is the asyncio queue pool with checkout timing: every
+checkout records how long the caller waited for a connection (including
+opening a new one when the pool is below capacity), and checkouts that hit
+DB_POOL_TIMEOUT are counted. pool_stats() combines these with the pool's
+live size / in-use counts, to size DB_POOL_SIZE per worker process.
+"""
+import time
+from typing import Dict
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolMetrics:
+    """Checkout wait counters of one pool (the event loop thread updates them)."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def observe(self, wait_seconds: float) -> None:
+        """Record one successful checkout."""
+        self.checkouts += 1
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+    def stats(self) -> Dict[str, float]:
+        """Return the checkout counters."""
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+            "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+        }
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that times connection checkouts."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        self.metrics.observe(time.perf_counter() - start)
+        return connection
+
+    def recreate(self) -> "MeteredQueuePool":
+        # Keep the counters across dispose() / invalidation
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def pool_stats(engine: AsyncEngine) -> Dict[str, float]:
+    """
+    Return pool occupancy and checkout metrics of an engine.
+
+    Returns:
+        Dictionary with the configured size, connections in use / idle /
+        in overflow, and (for metered pools) checkout wait counters
+    """
+    pool = engine.pool
+    stats: Dict[str, float] = {"pool": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update({
+            "size": pool.size(),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        })
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.stats())
+    return stats
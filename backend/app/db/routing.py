@@ -0,0 +1,142 @@
+"""
+Read-replica routing with read-your-writes stickiness.
+
+Read-only routes take their session from get_read_db, which picks a replica
+(round-robin) when DATABASE_REPLICA_URLS is set and the primary otherwise.
+A client that has just written is pinned to the primary for
+READ_YOUR_WRITES_SECONDS, so it never reads its own change back from a
+lagging replica:
+
+- ReadYourWritesMiddleware marks every successful unsafe request (POST, PUT,
+  PATCH, DELETE), except routes whose endpoint is decorated with
+  @read_only (POSTs that only read, like the batch like check). Browsers get a short-lived cookie, which works across
+  worker processes; bearer-token clients are also remembered in-process by
+  a hash of their credentials.
+- ReadRouter.session_factory() honours either mark.
+"""
+import hashlib
+import itertools
+import time
+from typing import Callable, Dict, List, Optional
+from fastapi import Request
+from sqlalchemy.orm import sessionmaker
+
+# Cookie holding the unix time until which reads stay on the primary
+STICKY_COOKIE = "db_primary_until"
+
+UNSAFE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+# Endpoint attribute set by @read_only
+_READ_ONLY_ATTRIBUTE = "__read_only__"
+
+
+def read_only(endpoint: Callable) -> Callable:
+    """Mark an unsafe-method endpoint as not writing, so it does not pin clients to the primary."""
+    setattr(endpoint, _READ_ONLY_ATTRIBUTE, True)
+    return endpoint
+
+
+def _is_read_only(scope) -> bool:
+    """Return True if the matched route's endpoint is marked @read_only."""
+    # FastAPI stores the matched APIRoute in the scope during routing
+    endpoint = getattr(scope.get("route"), "endpoint", None)
+    return getattr(endpoint, _READ_ONLY_ATTRIBUTE, False)
+
+
+def _client_key(authorization: Optional[str], access_token: Optional[str]) -> Optional[str]:
+    """Return a stable key for the request's credentials, if it has any."""
+    credential = authorization or access_token
+    if not credential:
+        return None
+    return hashlib.sha256(credential.encode()).hexdigest()
+
+
+class ReadRouter:
+    """Chooses the session factory for read-only work."""
+
+    def __init__(self, primary: sessionmaker, replicas: List[sessionmaker], sticky_seconds: float):
+        self.primary = primary
+        self.replicas = replicas
+        self.sticky_seconds = sticky_seconds
+        self._next_replica = itertools.cycle(replicas) if replicas else None
+        self._sticky: Dict[str, float] = {}
+        self.replica_reads = 0
+        self.primary_reads = 0
+
+    def mark_write(self, key: Optional[str]) -> float:
+        """
+        Pin a client to the primary for the sticky window.
+
+        Returns:
+            Unix time at which the pin expires
+        """
+        until = time.time() + self.sticky_seconds
+        if key is not None and self.replicas:
+            now = time.time()
+            if len(self._sticky) > 10000:
+                self._sticky = {k: v for k, v in self._sticky.items() if v > now}
+            self._sticky[key] = until
+        return until
+
+    def is_sticky(self, request: Request) -> bool:
+        """Return True if the request's client wrote within the sticky window."""
+        now = time.time()
+        cookie = request.cookies.get(STICKY_COOKIE)
+        if cookie:
+            try:
+                if float(cookie) > now:
+                    return True
+            except ValueError:
+                pass
+        key = _client_key(request.headers.get("authorization"), request.cookies.get("access_token"))
+        return key is not None and self._sticky.get(key, 0.0) > now
+
+    def session_factory(self, request: Request) -> sessionmaker:
+        """Return the replica or primary session factory for a read request."""
+        if self._next_replica is None or self.is_sticky(request):
+            self.primary_reads += 1
+            return self.primary
+        self.replica_reads += 1
+        return next(self._next_replica)
+
+    def stats(self) -> Dict[str, int]:
+        """Return routing counters for monitoring."""
+        return {
+            "replicas": len(self.replicas),
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+            "sticky_clients": len(self._sticky),
+        }
+
+
+class ReadYourWritesMiddleware:
+    """ASGI middleware that pins writing clients to the primary."""
+
+    def __init__(self, app, router_getter):
+        self.app = app
+        # Looked up per request so tests can swap the router
+        self.router_getter = router_getter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in UNSAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        router: ReadRouter = self.router_getter()
+        if not router.replicas:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] < 400 and not _is_read_only(scope):
+                request = Request(scope)
+                key = _client_key(request.headers.get("authorization"), request.cookies.get("access_token"))
+                until = router.mark_write(key)
+                cookie = (
+                    f"{STICKY_COOKIE}={until:.3f}; Max-Age={int(router.sticky_seconds) + 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message = {**message, "headers": [*message.get("headers", []), (b"set-cookie", cookie.encode())]}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
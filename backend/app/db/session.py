@@ -2,23 +2,78 @@
 Database session management with async SQLAlchemy.
 """
 import os
+from typing import Any, Dict, List
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db.pool import MeteredQueuePool
+from app.db.routing import ReadRouter
 
 # Default echo to False; allow override via env var SQL_ECHO=true
 SQL_ECHO = os.getenv("SQL_ECHO", "false").lower() in ("1", "true", "yes")
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=SQL_ECHO,
-    future=True,
-)
+
+def engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    Build create_async_engine keyword arguments from the DB_* settings.
+    
+    Pool sizing and recycling apply to server databases only (SQLite keeps
+    its default pool); asyncpg additionally gets its statement cache sizes
+    and server_settings (application_name, jit).
+    
+    Args:
+        database_url: SQLAlchemy database URL
+    """
+    url = make_url(database_url)
+    options: Dict[str, Any] = {
+        "echo": SQL_ECHO,
+        "future": True,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if url.get_backend_name() == "sqlite":
+        return options
+    
+    options.update(
+        poolclass=MeteredQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+    if url.get_driver_name() == "asyncpg":
+        server_settings = {"application_name": settings.DB_APPLICATION_NAME}
+        if settings.DB_JIT:
+            server_settings["jit"] = settings.DB_JIT
+        options["connect_args"] = {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+            "server_settings": server_settings,
+        }
+    return options
+
+
+engine = create_async_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
 
 async_session = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+
+def replica_urls() -> List[str]:
+    """Return the configured read replica URLs."""
+    return [url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
+
+# Read replicas (empty unless DATABASE_REPLICA_URLS is set)
+replica_engines = [create_async_engine(url, **engine_options(url)) for url in replica_urls()]
+
+read_router = ReadRouter(
+    async_session,
+    [sessionmaker(replica, class_=AsyncSession, expire_on_commit=False) for replica in replica_engines],
+    settings.READ_YOUR_WRITES_SECONDS,
+)
+
 async def get_session() -> AsyncSession:
     """Dependency for FastAPI routes to get database session."""
     async with async_session() as session:
@@ -5,25 +5,40 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.config import settings
-from app.db.init_db import init_db
-from app.api.routes import health, artworks, auth, likes, comments, artists
+from app.core.hashing import password_hasher, PasswordHasherBusy
+from app.core.instrumentation import InstrumentationMiddleware, TimedJinja2Templates
+from app.core.query_detector import QueryDetectorMiddleware
+from app.db.migrations import ensure_schema
+from app.db.session import async_session, engine, replica_engines
+from app.db.routing import ReadYourWritesMiddleware
+from app.api.routes import health, metrics, artworks, auth, likes, comments, artists
+from app.api import deps
 from app.api.deps import get_db
 from app.models.artwork import Artwork
 from app.web import routes as web_routes
 from app.web import likes_routes, admin_routes
+from app.services.view_counter import view_counter
+from app.services.cdn_catalog import cdn_catalog
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler for startup and shutdown."""
-    # Startup: Create database tables
-    await init_db()
+    # Startup: verify the schema version (migrations run as a separate step)
+    await ensure_schema(engine, settings.SCHEMA_BOOT_MODE)
+    view_counter.start(async_session)
     yield
+    # Shutdown: write buffered views, close the CDN client, stop the password hashing workers,
+    # close the replica pools
+    await view_counter.stop(async_session)
+    await cdn_catalog.close()
+    password_hasher.shutdown()
+    for replica in replica_engines:
+        await replica.dispose()
 
 
 # Create FastAPI app
@@ -33,6 +48,16 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    """Shed login/registration load instead of queueing without bound."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -40,8 +65,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified", "Server-Timing"],
 )
 
+# Pin clients to the primary database right after their own writes
+app.add_middleware(ReadYourWritesMiddleware, router_getter=lambda: deps.read_router)
+
+# Repeated/slow SQL detection; passes requests through unless enabled
+app.add_middleware(QueryDetectorMiddleware)
+
+# Outermost, so timings cover the whole request: per-route metrics and Server-Timing
+if settings.REQUEST_METRICS_ENABLED:
+    app.add_middleware(InstrumentationMiddleware)
+
 # IMPORTANT: mount the more specific path FIRST to avoid shadowing by /static
 app.mount("/static/artworks", StaticFiles(directory="/app/ml/input/wikiart", check_dir=False), name="artworks")
 # Static files for web frontend (CSS, JS, etc.)
@@ -49,6 +85,7 @@ app.mount("/static", StaticFiles(directory="/app/frontend/www/static", check_dir
 
 # Include API routers
 app.include_router(health.router, tags=["health"])
+app.include_router(metrics.router, tags=["health"])
 app.include_router(
     auth.router,
     prefix=f"{settings.API_V1_STR}/auth",
@@ -80,7 +117,7 @@ app.include_router(likes_routes.router, tags=["web"])
 app.include_router(admin_routes.router, tags=["admin"])
 
 # Keep login and artwork detail pages for now (can be moved to web router later)
-templates = Jinja2Templates(directory="/app/frontend/www/templates")
+templates = TimedJinja2Templates(directory="/app/frontend/www/templates")
 
 
 @app.get("/login", response_class=HTMLResponse)
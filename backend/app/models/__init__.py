@@ -6,5 +6,6 @@ from app.models.artwork import Artwork
 from app.models.category import Category
 from app.models.like import Like
 from app.models.comment import Comment
+from app.models.schema_migration import SchemaMigration
 
-__all__ = ["User", "Artwork", "Category", "Like", "Comment"]
+__all__ = ["User", "Artwork", "Category", "Like", "Comment", "SchemaMigration"]
@@ -4,6 +4,8 @@ Artwork model for storing art pieces.
 from datetime import datetime
 from typing import Optional
 from uuid import UUID, uuid4
+from sqlalchemy import Index, event
+from sqlalchemy.orm import object_session
 from sqlmodel import Field, SQLModel
 
 
@@ -21,6 +23,76 @@ class Artwork(SQLModel, table=True):
     image_url: str  # served URL: "/static/artworks/Baroque/filename.jpg"
     popularity_score: float = Field(default=0.0, index=True)
     views: int = Field(default=0)
+    like_count: int = Field(default=0)  # maintained by like/unlike
+    comment_count: int = Field(default=0)  # maintained by comment create/delete
     is_active: bool = Field(default=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+@event.listens_for(Artwork, "before_update")
+def _touch_updated_at(mapper, connection, target):
+    """Stamp updated_at on ORM updates (bulk counter UPDATEs leave it alone)."""
+    session = object_session(target)
+    if session is not None and session.is_modified(target, include_collections=False):
+        target.updated_at = datetime.utcnow()
+
+
+def _active_listing_index(name: str, *columns) -> Index:
+    """Build a partial index over active artworks only."""
+    return Index(
+        name,
+        *columns,
+        postgresql_where=Artwork.is_active == True,
+        sqlite_where=Artwork.is_active == True,
+    )
+
+
+# Managed index set matching the listing/gallery query shapes:
+# WHERE is_active [AND style = ?] ORDER BY <sort key> DESC, id DESC
+LISTING_INDEXES = [
+    _active_listing_index(
+        "ix_artworks_active_popularity",
+        Artwork.popularity_score.desc(), Artwork.id.desc(),
+    ),
+    _active_listing_index(
+        "ix_artworks_active_views",
+        Artwork.views.desc(), Artwork.id.desc(),
+    ),
+    _active_listing_index(
+        "ix_artworks_active_created",
+        Artwork.created_at.desc(), Artwork.id.desc(),
+    ),
+    _active_listing_index(
+        "ix_artworks_active_likes",
+        Artwork.like_count.desc(), Artwork.id.desc(),
+    ),
+    _active_listing_index(
+        "ix_artworks_active_style_popularity",
+        Artwork.style, Artwork.popularity_score.desc(), Artwork.id.desc(),
+    ),
+    _active_listing_index(
+        "ix_artworks_active_style_views",
+        Artwork.style, Artwork.views.desc(), Artwork.id.desc(),
+    ),
+    _active_listing_index(
+        "ix_artworks_active_style_created",
+        Artwork.style, Artwork.created_at.desc(), Artwork.id.desc(),
+    ),
+    _active_listing_index(
+        "ix_artworks_active_style_likes",
+        Artwork.style, Artwork.like_count.desc(), Artwork.id.desc(),
+    ),
+]
+
+# Counter columns added after the initial schema: name -> DDL type clause
+COUNTER_COLUMNS = {
+    "like_count": "INTEGER NOT NULL DEFAULT 0",
+    "comment_count": "INTEGER NOT NULL DEFAULT 0",
+}
+
+# Unique image_path backing the seeder's INSERT ... ON CONFLICT (image_path).
+# PostgreSQL only: SQLite development/test databases may hold duplicate paths.
+IMAGE_PATH_UNIQUE_INDEX = Index(
+    "ux_artworks_image_path", Artwork.image_path, unique=True
+).ddl_if(dialect="postgresql")
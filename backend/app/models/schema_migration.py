@@ -0,0 +1,15 @@
+"""
+Record of applied schema migrations.
+"""
+from datetime import datetime
+from sqlmodel import Field, SQLModel
+
+
+class SchemaMigration(SQLModel, table=True):
+    """One applied migration; the schema version is the highest version recorded."""
+    
+    __tablename__ = "schema_migrations"
+    
+    version: int = Field(primary_key=True)
+    name: str
+    applied_at: datetime = Field(default_factory=datetime.utcnow)
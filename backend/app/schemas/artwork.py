@@ -1,7 +1,8 @@
 """
 Artwork schemas for API requests and responses.
 """
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, Optional
 from uuid import UUID
 from pydantic import BaseModel, Field
 
@@ -34,3 +35,63 @@ class ArtworkImport(BaseModel):
     title: Optional[str] = None
     artist: Optional[str] = None
     style: Optional[str] = None
+
+
+class ArtworkSearchHit(BaseModel):
+    """Schema for a ranked artwork search result."""
+    id: UUID
+    title: str
+    artist: str
+    year: Optional[int] = None
+    style: str
+    image_url: str
+    popularity_score: float
+    score: float
+
+
+class ArtworkRead(BaseModel):
+    """Read-only artwork representation returned by the public API."""
+    id: UUID
+    title: str
+    artist: str
+    year: Optional[int] = None
+    style: str
+    image_path: str
+    image_url: str
+    popularity_score: float
+    views: int
+    like_count: int
+    comment_count: int
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+ARTWORK_READ_FIELDS = tuple(ArtworkRead.model_fields)
+
+
+def artwork_read(artwork: Any, image_url: str) -> Dict[str, Any]:
+    """
+    Build the ArtworkRead payload of a trusted artwork row without validation.
+    
+    Args:
+        artwork: Artwork instance, or a projected row of the ArtworkRead
+            columns (image_url may be left out of the projection)
+        image_url: Public image URL to return in place of the stored one
+    
+    Returns:
+        Dict ready for FastJSONResponse
+    """
+    mapping = getattr(artwork, "_mapping", None)
+    if mapping is not None:
+        data = dict(mapping)
+    else:
+        # Loaded ORM values are read from the instance dict, skipping the
+        # instrumented attribute lookup; expired ones fall back to getattr
+        state = artwork.__dict__
+        data = {
+            field: state[field] if field in state else getattr(artwork, field)
+            for field in ARTWORK_READ_FIELDS
+        }
+    data["image_url"] = image_url
+    return data
@@ -0,0 +1,482 @@
+"""
+Script to load-test the hot gallery endpoints on a synthetic dataset.
+Run with: python -m app.scripts.benchmark [--artworks 10000] [--users 200] [--likes-per-user 50]
+          [--comments 20000] [--seed 42] [--requests 200] [--concurrency 10] [--warmup 20]
+          [--database-url URL] [--base-url URL] [--skip-seed] [--output FILE] [--compare FILE]
+
+By default the app is driven in-process through httpx's AsyncClient, against
+a fresh SQLite database seeded from --seed, so two runs with the same
+arguments see the same data. Pass --database-url to use another database
+(e.g. a dedicated PostgreSQL one; with --skip-seed to reuse data seeded
+earlier) and --base-url to drive a running uvicorn instead, in which case
+--database-url must be the server's database.
+
+Seeding only uses bulk inserts through the models' tables and never deletes
+anything, but it does add benchmark users, artworks, likes and comments: do
+not point it at a database you care about.
+
+For each scenario the script reports p50/p95/p99 latency, throughput and SQL
+statements per request (read from the Server-Timing header, so
+REQUEST_METRICS_ENABLED must be on), and writes them as JSON. --compare
+prints the change against a previous results file.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import platform
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import AsyncGenerator, Callable, Dict, List, Optional
+from uuid import UUID
+from httpx import AsyncClient
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.core.security import create_access_token, get_password_hash
+from app.models.artwork import Artwork
+from app.models.category import Category
+from app.models.comment import Comment
+from app.models.like import Like
+from app.models.user import User
+
+BATCH_SIZE = 1000
+
+STYLES = (
+    "Impressionism", "Baroque", "Realism", "Romanticism", "Expressionism",
+    "Cubism", "Renaissance", "Surrealism", "Abstract_Expressionism", "Pop_Art",
+)
+
+# Benchmark users are bench_user_<n>, all with this password
+USER_PREFIX = "bench_user_"
+PASSWORD = "benchmark-password"
+
+# Fixed clock, so seeded timestamps do not depend on when the run happens
+BASE_TIME = datetime(2024, 1, 1)
+
+# High bits of the deterministic ids, one value per table
+_ID_PREFIX = {"artwork": 0xA1, "user": 0xB2, "like": 0xC3, "comment": 0xD4}
+
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+def _id(kind: str, index: int) -> UUID:
+    """Deterministic id of the index-th seeded row of a kind."""
+    return UUID(int=(_ID_PREFIX[kind] << 120) | index)
+
+
+@dataclass
+class DatasetSize:
+    """How much synthetic data to seed."""
+    artworks: int
+    users: int
+    likes_per_user: int
+    comments: int
+
+
+@dataclass
+class Dataset:
+    """Seeded rows the scenarios need."""
+    user_ids: List[UUID]
+    usernames: List[str]
+    commented_artwork_ids: List[UUID]
+
+
+@dataclass
+class Scenario:
+    """One endpoint to load: request i is sent as request(client, i)."""
+    name: str
+    request: Callable
+
+
+async def _insert(session: AsyncSession, table, rows: List[dict]) -> None:
+    """Insert rows in multi-row batches."""
+    for start in range(0, len(rows), BATCH_SIZE):
+        await session.execute(insert(table), rows[start:start + BATCH_SIZE])
+
+
+async def seed_dataset(session_factory: sessionmaker, size: DatasetSize, seed: int) -> None:
+    """
+    Seed categories, artworks, users, likes and comments.
+
+    Likes and comments are drawn first, so the artworks' like_count and
+    comment_count are inserted consistent with them. Comments go to the top
+    1% of artworks, as on a real gallery.
+    """
+    rng = random.Random(seed)
+    likes = [
+        (user, artwork)
+        for user in range(size.users)
+        for artwork in rng.sample(range(size.artworks), size.likes_per_user)
+    ]
+    hot_artworks = max(1, size.artworks // 100)
+    comments = [rng.randrange(hot_artworks) for _ in range(size.comments)]
+    like_counts = Counter(artwork for _, artwork in likes)
+    comment_counts = Counter(comments)
+
+    async with session_factory() as session:
+        existing = set((await session.execute(select(Category.name))).scalars().all())
+        await _insert(session, Category.__table__, [
+            {"name": style, "slug": style.lower().replace("_", "-")}
+            for style in STYLES if style not in existing
+        ])
+
+        for start in range(0, size.artworks, BATCH_SIZE):
+            rows = []
+            for index in range(start, min(start + BATCH_SIZE, size.artworks)):
+                style = STYLES[index % len(STYLES)]
+                path = f"{style}/bench-artist-{index % 500}_artwork-{seed}-{index}.jpg"
+                created_at = BASE_TIME - timedelta(minutes=rng.randrange(525600))
+                rows.append({
+                    "id": _id("artwork", index),
+                    "title": f"Artwork {index}",
+                    "artist": f"Bench Artist {index % 500}",
+                    "year": 1500 + rng.randrange(500),
+                    "style": style,
+                    "image_path": f"ml/input/wikiart/{path}",
+                    "image_url": f"/static/artworks/{path}",
+                    "popularity_score": round(rng.random() * 100, 4),
+                    "views": rng.randrange(10000),
+                    "like_count": like_counts.get(index, 0),
+                    "comment_count": comment_counts.get(index, 0),
+                    "is_active": True,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                })
+            await _insert(session, Artwork.__table__, rows)
+
+        # One bcrypt hash shared by every user keeps seeding fast
+        hashed_password = get_password_hash(PASSWORD)
+        await _insert(session, User.__table__, [
+            {
+                "id": _id("user", index),
+                "email": f"{USER_PREFIX}{index}@example.com",
+                "username": f"{USER_PREFIX}{index}",
+                "hashed_password": hashed_password,
+                "role": "user",
+                "is_active": True,
+                "created_at": BASE_TIME,
+            }
+            for index in range(size.users)
+        ])
+        await _insert(session, Like.__table__, [
+            {
+                "id": _id("like", index),
+                "user_id": _id("user", user),
+                "artwork_id": _id("artwork", artwork),
+                "created_at": BASE_TIME + timedelta(seconds=index),
+            }
+            for index, (user, artwork) in enumerate(likes)
+        ])
+        await _insert(session, Comment.__table__, [
+            {
+                "id": _id("comment", index),
+                "user_id": _id("user", index % size.users),
+                "artwork_id": _id("artwork", artwork),
+                "content": f"Benchmark comment {index}",
+                "created_at": BASE_TIME + timedelta(seconds=index),
+            }
+            for index, artwork in enumerate(comments)
+        ])
+        await session.commit()
+
+
+async def load_dataset(session_factory: sessionmaker, commented_artworks: int = 100) -> Dataset:
+    """Read back the benchmark users and the most-commented artworks."""
+    async with session_factory() as session:
+        users = (await session.execute(
+            select(User.id, User.username)
+            .where(User.username.startswith(USER_PREFIX))
+            .order_by(User.created_at, User.username)
+        )).all()
+        artwork_ids = (await session.execute(
+            select(Comment.artwork_id)
+            .group_by(Comment.artwork_id)
+            .order_by(func.count().desc(), Comment.artwork_id)
+            .limit(commented_artworks)
+        )).scalars().all()
+    return Dataset(
+        user_ids=[user_id for user_id, _ in users],
+        usernames=[username for _, username in users],
+        commented_artwork_ids=list(artwork_ids),
+    )
+
+
+async def count_rows(session_factory: sessionmaker) -> Dict[str, int]:
+    """Return the size of each table the scenarios read."""
+    counts = {}
+    async with session_factory() as session:
+        for name, model in (("artworks", Artwork), ("users", User), ("likes", Like), ("comments", Comment)):
+            counts[name] = (await session.execute(select(func.count()).select_from(model))).scalar_one()
+    return counts
+
+
+def build_scenarios(dataset: Dataset) -> List[Scenario]:
+    """Return the hot endpoints, spreading requests over users and artworks."""
+    if not dataset.user_ids or not dataset.commented_artwork_ids:
+        raise ValueError("Dataset has no benchmark users or comments; seed it first")
+    tokens = [create_access_token(data={"sub": str(user_id)}) for user_id in dataset.user_ids]
+
+    def authorized(index: int) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {tokens[index % len(tokens)]}"}
+
+    scenarios = [Scenario("GET /", lambda client, i: client.get("/"))]
+    for sort in ("popularity", "views", "created_at", "likes"):
+        scenarios.append(Scenario(
+            f"GET /api/v1/artworks?sort={sort}",
+            lambda client, i, sort=sort: client.get("/api/v1/artworks", params={"sort": sort}),
+        ))
+    scenarios += [
+        Scenario(
+            "GET /api/v1/likes/me",
+            lambda client, i: client.get("/api/v1/likes/me", headers=authorized(i)),
+        ),
+        Scenario(
+            "GET /api/v1/comments/{artwork_id}",
+            lambda client, i: client.get(
+                f"/api/v1/comments/{dataset.commented_artwork_ids[i % len(dataset.commented_artwork_ids)]}"
+            ),
+        ),
+        Scenario(
+            "POST /api/v1/auth/login",
+            lambda client, i: client.post(
+                "/api/v1/auth/login",
+                data={"username": dataset.usernames[i % len(dataset.usernames)], "password": PASSWORD},
+            ),
+        ),
+    ]
+    return scenarios
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100) of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_values) * q / 100))
+    return sorted_values[rank - 1]
+
+
+async def run_scenario(client: AsyncClient, scenario: Scenario, requests: int, concurrency: int, warmup: int) -> Dict:
+    """
+    Send warmup requests, then requests with up to concurrency in flight.
+
+    Returns:
+        Latency percentiles (ms), throughput, error count and SQL statements per request
+    """
+    for index in range(warmup):
+        await scenario.request(client, index)
+
+    latencies: List[float] = []
+    queries: List[int] = []
+    errors = 0
+    counter = itertools.count(warmup)
+
+    async def worker() -> None:
+        nonlocal errors
+        while True:
+            index = next(counter)
+            if index >= warmup + requests:
+                return
+            start = time.perf_counter()
+            response = await scenario.request(client, index)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+            match = _QUERIES.search(response.headers.get("server-timing", ""))
+            if match:
+                queries.append(int(match.group(1)))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        "requests_per_second": round(requests / elapsed, 1) if elapsed else 0.0,
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+        "queries_max": max(queries) if queries else None,
+    }
+
+
+async def run_scenarios(client: AsyncClient, dataset: Dataset, requests: int, concurrency: int, warmup: int) -> Dict[str, Dict]:
+    """Run every scenario in turn and return their results by name."""
+    results = {}
+    for scenario in build_scenarios(dataset):
+        results[scenario.name] = await run_scenario(client, scenario, requests, concurrency, warmup)
+    return results
+
+
+def print_results(results: Dict[str, Dict]) -> None:
+    """Print one line per scenario."""
+    print(f"{'scenario':<40} {'p50':>8} {'p95':>8} {'p99':>8} {'req/s':>8} {'queries':>8} {'errors':>6}")
+    for name, result in results.items():
+        queries = result["queries_per_request"]
+        print(
+            f"{name:<40} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f} "
+            f"{result['requests_per_second']:>8.1f} {'-' if queries is None else queries:>8} {result['errors']:>6}"
+        )
+
+
+def print_comparison(results: Dict[str, Dict], baseline: Dict[str, Dict]) -> None:
+    """Print the change of each scenario's p50, p95 and throughput against a baseline."""
+    print("Change against baseline (negative latency / positive req/s is better):")
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"  {name:<40} (not in baseline)")
+            continue
+        changes = []
+        for key in ("p50_ms", "p95_ms", "requests_per_second"):
+            if before[key]:
+                changes.append(f"{key} {(result[key] - before[key]) / before[key] * 100:+.1f}%")
+        if result["queries_per_request"] != before.get("queries_per_request"):
+            changes.append(f"queries {before.get('queries_per_request')} -> {result['queries_per_request']}")
+        print(f"  {name:<40} {', '.join(changes)}")
+
+
+def _git_commit() -> Optional[str]:
+    """Return the checked-out commit, if this is a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+@asynccontextmanager
+async def _in_process_client(session_factory: sessionmaker) -> AsyncGenerator[AsyncClient, None]:
+    """Yield a client calling the app in-process, with sessions from session_factory."""
+    from app.api.deps import get_db, get_read_db
+    from app.main import app
+
+    async def benchmark_db() -> AsyncGenerator[AsyncSession, None]:
+        async with session_factory() as session:
+            yield session
+
+    overrides = dict(app.dependency_overrides)
+    app.dependency_overrides[get_db] = benchmark_db
+    app.dependency_overrides[get_read_db] = benchmark_db
+    try:
+        async with AsyncClient(app=app, base_url="http://benchmark") as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+        app.dependency_overrides.update(overrides)
+
+
+async def run_benchmark(args: argparse.Namespace) -> int:
+    """
+    Seed (unless --skip-seed), run every scenario and write the results.
+
+    Returns:
+        0 on success, 1 on error or if any request failed
+    """
+    try:
+        from app.db.migrations import migrate
+        from app.db.session import engine_options
+
+        database_url = args.database_url
+        if database_url is None:
+            if args.base_url:
+                database_url = settings.DATABASE_URL
+            else:
+                database_url = f"sqlite+aiosqlite:///{Path(tempfile.mkdtemp()) / 'benchmark.db'}"
+        engine = create_async_engine(database_url, **engine_options(database_url))
+        session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        size = DatasetSize(args.artworks, args.users, args.likes_per_user, args.comments)
+
+        try:
+            if not args.skip_seed:
+                await migrate(engine)
+                start = time.perf_counter()
+                await seed_dataset(session_factory, size, args.seed)
+                print(f"✅ Seeded {asdict(size)} in {time.perf_counter() - start:.1f}s")
+            dataset = await load_dataset(session_factory)
+            rows = await count_rows(session_factory)
+
+            if args.base_url:
+                async with AsyncClient(base_url=args.base_url, timeout=60) as client:
+                    results = await run_scenarios(client, dataset, args.requests, args.concurrency, args.warmup)
+            else:
+                async with _in_process_client(session_factory) as client:
+                    results = await run_scenarios(client, dataset, args.requests, args.concurrency, args.warmup)
+        finally:
+            await engine.dispose()
+
+        report = {
+            "meta": {
+                "commit": _git_commit(),
+                "python": platform.python_version(),
+                "database": engine.dialect.name,
+                "target": args.base_url or "in-process",
+                "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+            },
+            # Actual table sizes, which also covers reused (--skip-seed) databases
+            "dataset": {**rows, "seed": None if args.skip_seed else args.seed},
+            "parameters": {"requests": args.requests, "concurrency": args.concurrency, "warmup": args.warmup},
+            "scenarios": results,
+        }
+        print_results(results)
+        if args.compare:
+            baseline = json.loads(Path(args.compare).read_text())
+            print_comparison(results, baseline["scenarios"])
+        Path(args.output).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+        print(f"✅ Results written to {args.output}")
+
+        failed = [name for name, result in results.items() if result["errors"]]
+        if failed:
+            print(f"❌ Requests failed in: {', '.join(failed)}")
+            return 1
+        return 0
+
+    except Exception as e:
+        print(f"❌ Error running benchmark: {str(e)}")
+        return 1
+
+
+def main():
+    """Run the benchmark script."""
+    parser = argparse.ArgumentParser(description="Load-test the hot gallery endpoints")
+    parser.add_argument("--artworks", type=int, default=10000, help="Artworks to seed (default: 10000)")
+    parser.add_argument("--users", type=int, default=200, help="Users to seed (default: 200)")
+    parser.add_argument("--likes-per-user", type=int, default=50, help="Likes per user (default: 50)")
+    parser.add_argument("--comments", type=int, default=20000, help="Comments to seed (default: 20000)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed of the dataset (default: 42)")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per scenario (default: 200)")
+    parser.add_argument("--concurrency", type=int, default=10, help="Requests in flight (default: 10)")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per scenario (default: 20)")
+    parser.add_argument("--database-url", default=None, help="Database to seed and query (default: a new SQLite file)")
+    parser.add_argument("--base-url", default=None, help="Benchmark a running server instead of the app in-process")
+    parser.add_argument("--skip-seed", action="store_true", help="Reuse data seeded by an earlier run")
+    parser.add_argument("--output", default="benchmark-results.json", help="Results file (default: benchmark-results.json)")
+    parser.add_argument("--compare", default=None, help="Previous results file to compare against")
+    args = parser.parse_args()
+    if args.artworks < 1 or args.users < 1:
+        parser.error("--artworks and --users must be at least 1")
+    if args.likes_per_user > args.artworks:
+        parser.error("--likes-per-user cannot exceed --artworks")
+    sys.exit(asyncio.run(run_benchmark(args)))
+
+
+if __name__ == "__main__":
+    main()
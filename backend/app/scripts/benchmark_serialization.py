@@ -0,0 +1,101 @@
+"""
+Script to compare the CPU cost of serializing an artwork page.
+Run with: python -m app.scripts.benchmark_serialization [--items 100] [--rounds 500]
+
+"before" runs FastAPI's response_model path (validate List[Artwork],
+dump, encode with the stdlib json module); "after" builds ArtworkRead dicts
+and renders them with FastJSONResponse, as the read routes now do.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List
+from uuid import uuid4
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from app.core import responses
+from app.core.responses import FastJSONResponse
+from app.models.artwork import Artwork
+from app.schemas.artwork import artwork_read
+
+
+def make_artworks(count: int) -> List[Artwork]:
+    """Build a page of detached artworks resembling real rows."""
+    now = datetime.utcnow()
+    return [
+        Artwork(
+            id=uuid4(),
+            title=f"Water Lilies {index}",
+            artist="Claude Monet",
+            year=1900 + index % 30,
+            style="Impressionism",
+            image_path=f"ml/input/wikiart/Impressionism/claude-monet_water-lilies-{index}.jpg",
+            image_url=f"/static/artworks/Impressionism/claude-monet_water-lilies-{index}.jpg",
+            popularity_score=round(100 - index * 0.37, 2),
+            views=index * 13,
+            like_count=index % 17,
+            comment_count=index % 5,
+            is_active=True,
+            created_at=now - timedelta(days=index),
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+async def cpu_per_call(render: Callable[[], Awaitable[bytes]], rounds: int) -> float:
+    """Return the mean process CPU time of one render, in milliseconds."""
+    await render()  # warm up
+    start = time.process_time()
+    for _ in range(rounds):
+        await render()
+    return (time.process_time() - start) * 1000 / rounds
+
+
+async def run_benchmark(items: int, rounds: int) -> int:
+    """
+    Time both serialization paths on the same page of artworks.
+
+    Returns:
+        0 on success, non-zero on error
+    """
+    try:
+        artworks = make_artworks(items)
+        field = create_response_field(name="Response_list_artworks", type_=List[Artwork])
+
+        async def before() -> bytes:
+            content = await serialize_response(field=field, response_content=artworks)
+            return JSONResponse(content).body
+
+        async def after() -> bytes:
+            return FastJSONResponse([artwork_read(artwork, artwork.image_url) for artwork in artworks]).body
+
+        encoder = "orjson" if responses.orjson is not None else "stdlib json (orjson not installed)"
+        before_ms = await cpu_per_call(before, rounds)
+        after_ms = await cpu_per_call(after, rounds)
+        print(f"✅ {items} artworks x {rounds} rounds, fast path encoder: {encoder}")
+        print(f"   response_model + JSONResponse: {before_ms:.3f} ms CPU per request")
+        print(f"   ArtworkRead + FastJSONResponse: {after_ms:.3f} ms CPU per request")
+        print(f"   speedup: {before_ms / after_ms:.1f}x")
+        return 0
+
+    except Exception as e:
+        print(f"❌ Error running benchmark: {str(e)}")
+        return 1
+
+
+def main():
+    """Run the serialization benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark artwork response serialization")
+    parser.add_argument("--items", type=int, default=100, help="Artworks per response (default: 100)")
+    parser.add_argument("--rounds", type=int, default=500, help="Timed renders per path (default: 500)")
+    args = parser.parse_args()
+    exit_code = asyncio.run(run_benchmark(args.items, args.rounds))
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
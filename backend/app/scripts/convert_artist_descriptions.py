@@ -0,0 +1,77 @@
+"""
+Script to convert the ML artist descriptions .pt file into the SQLite store
+served by the web app (torch is only needed here, not at runtime).
+Run with: python -m app.scripts.convert_artist_descriptions [--source PT] [--output DB] [--if-stale]
+"""
+import argparse
+import sys
+from pathlib import Path
+from app.services.artist_descriptions import write_store
+
+DEFAULT_SOURCE = "/app/ml/output/artist_descriptions.pt"
+DEFAULT_OUTPUT = "/app/ml/output/artist_descriptions.sqlite3"
+
+
+def is_stale(source: Path, output: Path) -> bool:
+    """Return True if the store is missing or older than its source."""
+    return not output.exists() or output.stat().st_mtime < source.stat().st_mtime
+
+
+def convert_descriptions(source: str, output: str, if_stale: bool = False) -> int:
+    """
+    Load the .pt descriptions file and write the SQLite store.
+    
+    Args:
+        source: Path to artist_descriptions.pt
+        output: Path of the store to (re)write
+        if_stale: Skip (successfully) when the source is missing or the
+            store is already up to date, so deploys can run this every time
+        
+    Returns:
+        0 on success, non-zero on error
+    """
+    try:
+        if if_stale:
+            if not Path(source).exists():
+                print(f"⚠️  No artist descriptions source at {source}, skipping")
+                return 0
+            if not is_stale(Path(source), Path(output)):
+                print(f"✅ Artist descriptions store {output} is up to date")
+                return 0
+        
+        import torch
+        
+        descriptions = torch.load(source, map_location='cpu')
+        if not isinstance(descriptions, dict):
+            print(f"❌ Unexpected descriptions format: {type(descriptions)}")
+            return 1
+        
+        count = write_store(descriptions, Path(output))
+        print(f"✅ Wrote {count} artist descriptions to {output}")
+        return 0
+    
+    except Exception as e:
+        print(f"❌ Error converting artist descriptions: {str(e)}")
+        return 1
+
+
+def main():
+    """Run the conversion script."""
+    parser = argparse.ArgumentParser(
+        description="Convert artist_descriptions.pt into the SQLite descriptions store"
+    )
+    parser.add_argument("--source", type=str, default=DEFAULT_SOURCE, help="Source .pt file")
+    parser.add_argument("--output", type=str, default=DEFAULT_OUTPUT, help="Output SQLite store")
+    parser.add_argument(
+        "--if-stale",
+        action="store_true",
+        help="Only convert when the store is missing or older than the source",
+    )
+    args = parser.parse_args()
+    
+    exit_code = convert_descriptions(args.source, args.output, args.if_stale)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
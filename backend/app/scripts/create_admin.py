@@ -7,7 +7,7 @@ import argparse
 import sys
 from app.db.session import async_session
 from app.models.user import User
-from app.core.security import get_password_hash
+from app.core.hashing import password_hasher
 from sqlalchemy import select, or_
 
 
@@ -54,7 +54,7 @@ async def create_or_promote_admin(username: str, email: str, password: str = Non
                 
                 # Optionally update password if provided
                 if password:
-                    existing_user.hashed_password = get_password_hash(password)
+                    existing_user.hashed_password = await password_hasher.hash(password)
                     print("✅ User promoted to admin and password updated!")
                 else:
                     print("✅ User promoted to admin!")
@@ -74,7 +74,7 @@ async def create_or_promote_admin(username: str, email: str, password: str = Non
                 new_admin = User(
                     email=email,
                     username=username,
-                    hashed_password=get_password_hash(password),
+                    hashed_password=await password_hasher.hash(password),
                     role="admin"
                 )
                 db.add(new_admin)
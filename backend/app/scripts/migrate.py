@@ -0,0 +1,64 @@
+"""
+Script to bring the database schema up to date.
+Run once per deploy, before starting the web workers:
+    python -m app.scripts.migrate [--check] [--reapply VERSION]
+"""
+import argparse
+import asyncio
+import sys
+from app.db.migrations import SCHEMA_VERSION, current_version, migrate, reapply
+from app.db.session import engine
+
+
+async def run_migrate(check: bool = False, reapply_version: int = None):
+    """
+    Apply pending schema migrations (or only report the version).
+    
+    Args:
+        check: Only report whether migrations are pending
+        reapply_version: Re-run this already-applied migration instead
+    
+    Returns:
+        0 on success (and, with check, when the schema is current), 1 otherwise
+    """
+    try:
+        if reapply_version is not None:
+            migration = await reapply(engine, reapply_version)
+            print(f"✅ Re-applied migration {migration.version}: {migration.name}")
+            return 0
+        
+        version = await current_version(engine)
+        if check:
+            if version >= SCHEMA_VERSION:
+                print(f"✅ Schema is current (version {version})")
+                return 0
+            print(f"❌ Schema version {version} is behind {SCHEMA_VERSION}")
+            return 1
+        
+        applied = await migrate(engine)
+        for migration in applied:
+            print(f"✅ Applied migration {migration.version}: {migration.name}")
+        if not applied:
+            print(f"✅ Schema already current (version {version})")
+        return 0
+    
+    except Exception as e:
+        print(f"❌ Error migrating database: {str(e)}")
+        return 1
+    
+    finally:
+        await engine.dispose()
+
+
+def main():
+    """Run the schema migration script."""
+    parser = argparse.ArgumentParser(description="Apply database schema migrations")
+    parser.add_argument("--check", action="store_true", help="Only check whether migrations are pending")
+    parser.add_argument("--reapply", type=int, metavar="VERSION", help="Re-run one applied migration")
+    args = parser.parse_args()
+    exit_code = asyncio.run(run_migrate(args.check, args.reapply))
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Script to profile worker startup (cold import of the application).
+Run with: python -m app.scripts.profile_startup [--runs 5] [--top 25] [--max-seconds 2.5]
+
+Each run imports app.main in a fresh interpreter, the way a new uvicorn
+worker does. The script prints the slowest modules from a
+``python -X importtime`` pass, then the median/max import time and peak RSS
+over the runs. With --max-seconds it exits non-zero when the median import
+time exceeds the budget, or when a heavy module is loaded at startup, so it
+can guard against startup regressions.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Directory containing the app package
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Modules the web tier must not load at startup
+HEAVY_MODULES = ("torch", "pandas", "numpy", "httpx")
+
+_MEASURE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "heavy": [name for name in %r if name in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def import_report(top: int) -> List[Tuple[int, int, str]]:
+    """
+    Run ``python -X importtime`` over app.main.
+
+    Returns:
+        (cumulative us, self us, module) of the slowest imports, slowest first
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), module.rstrip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def measure_cold_start() -> Dict:
+    """Import app.main in a fresh interpreter and return its measurements."""
+    result = subprocess.run(
+        [sys.executable, "-c", _MEASURE],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_profile(runs: int, top: int, max_seconds: float = None) -> int:
+    """
+    Print the import report and cold-start measurements.
+
+    Returns:
+        0 on success, 1 if the budget is exceeded, a heavy module is loaded
+        or profiling fails
+    """
+    try:
+        print(f"Slowest imports of app.main (top {top}, cumulative / self ms):")
+        for cumulative_us, self_us, module in import_report(top):
+            print(f"  {cumulative_us / 1000:8.1f} {self_us / 1000:8.1f}  {module}")
+
+        samples = [measure_cold_start() for _ in range(runs)]
+        seconds = [sample["seconds"] for sample in samples]
+        median = statistics.median(seconds)
+        rss_mb = max(sample["max_rss_kb"] for sample in samples) / 1024
+        heavy = sorted({name for sample in samples for name in sample["heavy"]})
+
+        print(f"Cold start over {runs} runs: median {median:.3f}s, max {max(seconds):.3f}s, peak RSS {rss_mb:.0f} MB")
+        if heavy:
+            print(f"❌ Heavy modules loaded at startup: {', '.join(heavy)}")
+            return 1
+        if max_seconds is not None and median > max_seconds:
+            print(f"❌ Median import time {median:.3f}s exceeds budget {max_seconds:.3f}s")
+            return 1
+        print("✅ Startup within budget" if max_seconds is not None else "✅ No heavy modules loaded at startup")
+        return 0
+
+    except Exception as e:
+        print(f"❌ Error profiling startup: {str(e)}")
+        return 1
+
+
+def main():
+    """Run the startup profiling script."""
+    parser = argparse.ArgumentParser(description="Profile application import time")
+    parser.add_argument("--runs", type=int, default=5, help="Cold imports to time (default: 5)")
+    parser.add_argument("--top", type=int, default=25, help="Modules to list in the import report (default: 25)")
+    parser.add_argument("--max-seconds", type=float, default=None, help="Fail if the median import time exceeds this")
+    args = parser.parse_args()
+    sys.exit(run_profile(args.runs, args.top, args.max_seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Script to repair drift in the denormalized artwork counters.
+Run with: python -m app.scripts.reconcile_counters
+"""
+import asyncio
+import sys
+from app.db.session import async_session
+from app.services.counters import reconcile_counters
+
+
+async def run_reconcile():
+    """
+    Recompute like_count and comment_count for every artwork.
+    
+    Returns:
+        0 on success, non-zero on error
+    """
+    try:
+        async with async_session() as db:
+            repaired = await reconcile_counters(db)
+        
+        for counter, count in repaired.items():
+            print(f"✅ {counter}: repaired {count} artworks")
+        return 0
+    
+    except Exception as e:
+        print(f"❌ Error reconciling counters: {str(e)}")
+        return 1
+
+
+def main():
+    """Run the counter reconciliation script."""
+    exit_code = asyncio.run(run_reconcile())
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,24 @@ Data ingestion script to populate database from ML datasets.
 """
 import os
 import asyncio
+import heapq
 import logging
 import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
-import torch
-from sqlmodel import select, SQLModel
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
+from sqlalchemy import Float, String, bindparam, column, insert, inspect, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlmodel import select
+from app.core.query_detector import query_detector
+from app.db.migrations import migrate
 from app.db.session import async_session, engine
 from app.models.category import Category
-from app.models.artwork import Artwork
+from app.models.artwork import Artwork, IMAGE_PATH_UNIQUE_INDEX
 
 # Concise logging; silence SQL engine spam
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -19,6 +28,16 @@ logger = logging.getLogger("app.scripts.seed_data")
 logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
 
+# Rows per INSERT/UPDATE statement (keeps PostgreSQL bind parameters < 32767)
+BATCH_SIZE = 1000
+
+# Default number of style folders scanned concurrently
+SCAN_WORKERS = 4
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+_artworks = Artwork.__table__
+
 def parse_filename(filename: str) -> Tuple[str, str]:
     """
     Parse artwork filename to extract artist and title.
@@ -41,21 +60,117 @@ def slugify(text: str) -> str:
 async def load_or_create_categories(styles: List[str], quiet: bool = True) -> Dict[str, Category]:
     """Load existing categories or create new ones."""
     async with async_session() as session:
+        slugs = {style: slugify(style) for style in styles}
+        result = await session.execute(select(Category).where(Category.slug.in_(list(slugs.values()))))
+        by_slug = {category.slug: category for category in result.scalars().all()}
         categories: Dict[str, Category] = {}
         for style in styles:
-            slug = slugify(style)
-            query = select(Category).where(Category.slug == slug)
-            result = await session.execute(query)
-            category = result.scalar_one_or_none()
+            category = by_slug.get(slugs[style])
             if not category:
-                category = Category(name=style, slug=slug)
+                category = Category(name=style, slug=slugs[style])
                 session.add(category)
+                by_slug[category.slug] = category
                 if not quiet:
                     logger.info(f"Creating category: {style}")
             categories[style] = category
         await session.commit()
         return categories
 
+def _batches(items: List, size: int = BATCH_SIZE):
+    """Yield consecutive slices of at most size items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+async def load_existing_artworks(session) -> Dict[str, Tuple[UUID, float, str]]:
+    """Load image_path -> (id, popularity_score, image_url) for every artwork in one query."""
+    result = await session.execute(
+        select(Artwork.image_path, Artwork.id, Artwork.popularity_score, Artwork.image_url)
+    )
+    return {image_path: (artwork_id, score, url) for image_path, artwork_id, score, url in result.all()}
+
+async def has_image_path_index(session) -> bool:
+    """Return True if the unique image_path index (migration 4) exists."""
+    def check(sync_session) -> bool:
+        indexes = inspect(sync_session.connection()).get_indexes(_artworks.name)
+        return any(index["name"] == IMAGE_PATH_UNIQUE_INDEX.name for index in indexes)
+    return await session.run_sync(check)
+
+async def insert_artworks(session, rows: List[dict]) -> None:
+    """
+    Insert new artwork rows in multi-row batches.
+
+    On PostgreSQL this is INSERT ... ON CONFLICT (image_path) DO UPDATE, so a
+    row added concurrently since the existing paths were loaded is updated
+    instead of failing the batch. That needs the unique image_path index,
+    which migration 4 skips on databases holding duplicate paths; without it
+    the batches fall back to ON CONFLICT DO NOTHING (no conflict target).
+    """
+    postgres = session.get_bind().dialect.name == "postgresql"
+    upsert = postgres and await has_image_path_index(session)
+    if postgres and not upsert:
+        logger.warning(
+            f"{IMAGE_PATH_UNIQUE_INDEX.name} is missing (duplicate image paths?); "
+            "inserting without image_path upserts. Remove the duplicates and run "
+            "python -m app.scripts.migrate --reapply 4"
+        )
+    for batch in _batches(rows):
+        if upsert:
+            statement = pg_insert(_artworks).values(batch)
+            statement = statement.on_conflict_do_update(
+                index_elements=[_artworks.c.image_path],
+                set_={
+                    "popularity_score": statement.excluded.popularity_score,
+                    "image_url": statement.excluded.image_url,
+                    "updated_at": statement.excluded.updated_at,
+                },
+            )
+            await session.execute(statement)
+        elif postgres:
+            await session.execute(pg_insert(_artworks).values(batch).on_conflict_do_nothing())
+        else:
+            await session.execute(insert(_artworks), batch)
+
+async def update_artworks(session, changes: List[Tuple[UUID, float, str]]) -> None:
+    """
+    Set popularity_score and image_url for existing artworks by id.
+
+    PostgreSQL gets one UPDATE ... FROM (VALUES ...) per batch; other
+    databases run a single executemany UPDATE.
+    """
+    now = datetime.utcnow()
+    if session.get_bind().dialect.name == "postgresql":
+        for batch in _batches(changes):
+            changed = values(
+                column("id", _artworks.c.id.type),
+                column("popularity_score", Float),
+                column("image_url", String),
+                name="changed",
+            ).data(batch)
+            await session.execute(
+                update(_artworks)
+                .where(_artworks.c.id == changed.c.id)
+                .values(
+                    popularity_score=changed.c.popularity_score,
+                    image_url=changed.c.image_url,
+                    updated_at=now,
+                )
+            )
+        return
+
+    await session.execute(
+        update(_artworks)
+        .where(_artworks.c.id == bindparam("changed_id"))
+        .values(
+            popularity_score=bindparam("changed_score"),
+            image_url=bindparam("changed_url"),
+            updated_at=now,
+        ),
+        [
+            {"changed_id": artwork_id, "changed_score": score, "changed_url": url}
+            for artwork_id, score, url in changes
+        ],
+    )
+
 def _score_from_dict(scores: dict) -> float:
     """Pick a popularity score, preferring Wikipedia 12-month normalized."""
     for key in ("wikipedia_views_normalized", "wikipedia_12m", "wikipedia"):
@@ -88,6 +203,9 @@ def load_popularity_scores(pt_file: str) -> Dict[str, float]:
         logger.warning(f"Popularity scores file not found: {pt_file}")
         return {}
     try:
+        # Deferred: PyTorch is only needed to read the scores file
+        import torch
+
         data = torch.load(pt_file)
         pop: Dict[str, float] = {}
         if isinstance(data, dict) and data:
@@ -115,12 +233,156 @@ def load_popularity_scores(pt_file: str) -> Dict[str, float]:
         logger.error(f"Error loading popularity scores: {e}")
         return {}
 
+@dataclass
+class StyleScan:
+    """Image files of one style folder with their popularity scores."""
+    style: str
+    files: List[Tuple[str, float]]  # (filename, score)
+    keep: Set[str]  # filenames eligible to be added as new rows
+
+def scan_style(
+    wikiart_dir: str,
+    style: str,
+    popularity_scores: Dict[str, float] | None,
+    top_percentage: float,
+) -> StyleScan:
+    """
+    List one style folder and pick the images to keep (runs in a worker thread).
+
+    With popularity scores the top_percentage highest scored images are kept;
+    without, a deterministic per-style random sample of that size.
+    """
+    with os.scandir(os.path.join(wikiart_dir, style)) as entries:
+        image_files = [
+            entry.name for entry in entries
+            if entry.name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file()
+        ]
+    if not image_files:
+        return StyleScan(style=style, files=[], keep=set())
+
+    keep_count = max(1, int(len(image_files) * top_percentage))
+    if popularity_scores:
+        files = [
+            (img, float(popularity_scores.get(f"{style}/{img}", popularity_scores.get(img, 0.0))))
+            for img in image_files
+        ]
+        keep = {img for img, _ in heapq.nlargest(keep_count, files, key=lambda item: item[1])}
+    else:
+        files = [(img, 0.0) for img in image_files]
+        # Random sample by top_percentage, seeded per style so it does not
+        # depend on the order in which styles finish scanning
+        keep = set(random.Random(f"42:{style}").sample(sorted(image_files), keep_count))
+    return StyleScan(style=style, files=files, keep=keep)
+
+async def scan_styles(
+    wikiart_dir: str,
+    styles: List[str],
+    popularity_scores: Dict[str, float] | None,
+    top_percentage: float,
+    workers: int,
+    queue: asyncio.Queue,
+) -> None:
+    """
+    Scan style folders in a thread pool and stream the results into queue.
+
+    At most `workers` folders are scanned at once and scanning pauses while
+    the queue is full, so a slow database writer bounds memory use. A None
+    sentinel is queued when scanning is done (or has failed).
+    """
+    loop = asyncio.get_running_loop()
+    pending = list(sorted(styles))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wikiart-scan")
+
+    async def worker() -> None:
+        while pending:
+            style = pending.pop(0)
+            scan = await loop.run_in_executor(
+                pool, scan_style, wikiart_dir, style, popularity_scores, top_percentage
+            )
+            await queue.put(scan)
+
+    tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException as e:
+        # Stop the other workers so nothing is queued after the sentinel
+        pending.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if not isinstance(e, asyncio.CancelledError):
+            await queue.put(None)
+        raise
+    finally:
+        # Scans already running in threads are abandoned, not waited for on the loop
+        pool.shutdown(wait=False, cancel_futures=True)
+    await queue.put(None)
+
+
+async def write_style(
+    session,
+    scan: StyleScan,
+    existing_artworks: Dict[str, Tuple[UUID, float, str]],
+    update_existing: bool,
+) -> Tuple[int, int, int]:
+    """
+    Diff one scanned style against the existing rows and write the changes.
+
+    Returns:
+        Tuple of (added, updated, files with popularity > 0)
+    """
+    style = scan.style
+    with_pop_gt0 = 0
+    new_rows: List[dict] = []
+    changes: List[Tuple[UUID, float, str]] = []
+    now = datetime.utcnow()
+
+    # Diff in memory: update existing rows for ALL files; add only for keep set
+    for image_file, score in scan.files:
+        image_path = f"ml/input/wikiart/{style}/{image_file}"
+        image_url = f"/static/artworks/{style}/{image_file}"
+        existing = existing_artworks.get(image_path)
+
+        if score > 0:
+            with_pop_gt0 += 1
+
+        if existing:
+            artwork_id, current_score, current_url = existing
+            if update_existing and (current_score != score or current_url != image_url):
+                changes.append((artwork_id, score, image_url))
+        elif image_file in scan.keep:
+            artist, title = parse_filename(image_file)
+            new_rows.append({
+                "id": uuid4(),
+                "title": title,
+                "artist": artist,
+                "year": None,
+                "style": style,
+                "image_path": image_path,
+                "image_url": image_url,
+                "popularity_score": score,
+                "views": 0,
+                "like_count": 0,
+                "comment_count": 0,
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+            })
+
+    if new_rows:
+        await insert_artworks(session, new_rows)
+    if changes:
+        await update_artworks(session, changes)
+    await session.commit()
+    return len(new_rows), len(changes), with_pop_gt0
+
 async def seed_artworks(
     wikiart_dir: str,
     popularity_scores: Dict[str, float] | None = None,
     top_percentage: float = 0.1,
     quiet: bool = True,
     update_existing: bool = True,
+    workers: int = SCAN_WORKERS,
 ):
     """
     Seed database with artwork data.
@@ -129,90 +391,80 @@ async def seed_artworks(
     - If popularity_scores provided: rank by score per style and keep top_percentage for adding new rows, but update popularity for ALL existing rows.
     - If no popularity_scores: randomly sample per style by top_percentage (deterministic) for adding new rows.
     - Existing rows: updated (popularity_score and image_url) when update_existing=True.
+
+    Style folders are scanned by `workers` threads and streamed through a
+    bounded queue to a single database writer, so writes overlap with
+    filesystem I/O. Existing paths are loaded once and diffed in memory; new
+    rows are inserted and changed rows updated in batches of BATCH_SIZE, one
+    commit per style.
+
+    Returns:
+        Dict with scanned/added/updated counts, elapsed_seconds and rows_per_second
+        (None if there was nothing to scan)
     """
     if not os.path.exists(wikiart_dir):
         logger.warning(f"WikiArt directory not found: {wikiart_dir}")
         return
 
-    styles = [d for d in os.listdir(wikiart_dir) if os.path.isdir(os.path.join(wikiart_dir, d))]
+    with os.scandir(wikiart_dir) as entries:
+        styles = [entry.name for entry in entries if entry.is_dir()]
     if not styles:
         logger.warning("No style folders found in WikiArt directory")
         return
 
+    started = time.perf_counter()
     await load_or_create_categories(styles, quiet=True)
 
-    async with async_session() as session:
-        total_added = 0
-        rng = random.Random(42)  # deterministic random
-        for style in sorted(styles):
-            style_dir = os.path.join(wikiart_dir, style)
-            image_files = [f for f in os.listdir(style_dir) if f.lower().endswith((".jpg", ".jpeg", ".png"))]
-            scanned = len(image_files)
-            if scanned == 0:
-                if not quiet:
-                    logger.info(f"{style}: scanned=0 kept=0 added=0 with_pop>0=0")
-                continue
-
-            # Build lookup for this style
-            def lookup_score(img: str) -> float:
-                if not popularity_scores:
-                    return 0.0
-                key_style = f"{style}/{img}"
-                return float(popularity_scores.get(key_style, popularity_scores.get(img, 0.0)))
-
-            # Determine which new images to add
-            keep_set = set()
-            if popularity_scores:
-                scored = [(img, lookup_score(img)) for img in image_files]
-                scored.sort(key=lambda x: x[1], reverse=True)
-                keep_count = max(1, int(len(scored) * top_percentage))
-                keep_set = {img for img, _ in scored[:keep_count]}
-            else:
-                # Random sample by top_percentage
-                keep_count = max(1, int(len(image_files) * top_percentage))
-                tmp = image_files[:]
-                rng.shuffle(tmp)
-                keep_set = set(tmp[:keep_count])
-
-            kept = len(keep_set)
-            added = 0
-            with_pop_gt0 = 0
-
-            # Update existing rows for ALL files; add only for keep_set
-            for image_file in image_files:
-                image_path = f"ml/input/wikiart/{style}/{image_file}"
-                result = await session.execute(select(Artwork).where(Artwork.image_path == image_path))
-                existing = result.scalar_one_or_none()
-
-                score = lookup_score(image_file)
-                if score > 0:
-                    with_pop_gt0 += 1
-
-                if existing:
-                    if update_existing:
-                        existing.popularity_score = score
-                        existing.image_url = f"/static/artworks/{style}/{image_file}"
-                else:
-                    if image_file in keep_set:
-                        artist, title = parse_filename(image_file)
-                        artwork = Artwork(
-                            title=title,
-                            artist=artist,
-                            style=style,
-                            image_path=image_path,
-                            image_url=f"/static/artworks/{style}/{image_file}",
-                            popularity_score=score,
-                            views=0,
-                            is_active=True,
-                        )
-                        session.add(artwork)
-                        added += 1
-                        total_added += 1
-
-            await session.commit()
-            logger.info(f"{style}: scanned={scanned} kept={kept} added={added} with_pop>0={with_pop_gt0}")
-
-        logger.info(f"TOTAL: styles={len(styles)} artworks_added={total_added}")
+    workers = max(1, workers)
+    queue: asyncio.Queue[Optional[StyleScan]] = asyncio.Queue(maxsize=workers * 2)
+    scanner = asyncio.create_task(
+        scan_styles(wikiart_dir, styles, popularity_scores, top_percentage, workers, queue)
+    )
+
+    total_scanned = 0
+    total_added = 0
+    total_updated = 0
+    try:
+        async with async_session() as session:
+            # One query for every existing path instead of one per image file
+            existing_artworks = await load_existing_artworks(session)
+            while (scan := await queue.get()) is not None:
+                scanned = len(scan.files)
+                total_scanned += scanned
+                if scanned == 0:
+                    if not quiet:
+                        logger.info(f"{scan.style}: scanned=0 kept=0 added=0 with_pop>0=0")
+                    continue
+
+                added, updated, with_pop_gt0 = await write_style(
+                    session, scan, existing_artworks, update_existing
+                )
+                total_added += added
+                total_updated += updated
+                logger.info(
+                    f"{scan.style}: scanned={scanned} kept={len(scan.keep)} added={added} "
+                    f"updated={updated} with_pop>0={with_pop_gt0}"
+                )
+        # Surface scan errors (the sentinel is queued even on failure)
+        await scanner
+    except BaseException:
+        scanner.cancel()
+        raise
+
+    elapsed = time.perf_counter() - started
+    written = total_added + total_updated
+    rate = written / elapsed if elapsed > 0 else 0.0
+    logger.info(
+        f"TOTAL: styles={len(styles)} scanned={total_scanned} artworks_added={total_added} "
+        f"updated={total_updated} elapsed={elapsed:.2f}s rows/sec={rate:.0f}"
+    )
+    return {
+        "scanned": total_scanned,
+        "added": total_added,
+        "updated": total_updated,
+        "elapsed_seconds": elapsed,
+        "rows_per_second": rate,
+    }
 
 async def main():
     """Main entry point for data seeding."""
@@ -224,17 +476,20 @@ async def main():
     wikiart_dir = project_root / "ml" / "input" / "wikiart"
     popularity_file = project_root / "ml" / "output" / "artwork_popularity_by_artist.pt"
 
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+    # Same runner (and advisory lock) as python -m app.scripts.migrate, so the
+    # schema is recorded in schema_migrations and workers pass the boot check
+    await migrate(engine)
 
     popularity_scores = load_popularity_scores(str(popularity_file))
-    await seed_artworks(
-        str(wikiart_dir),
-        popularity_scores=popularity_scores if popularity_scores else None,
-        top_percentage=0.1,
-        quiet=True,
-        update_existing=True,
-    )
+    # With QUERY_DETECTOR_ENABLED, logs statements repeated per file or slow
+    with query_detector.track("seed_data"):
+        await seed_artworks(
+            str(wikiart_dir),
+            popularity_scores=popularity_scores if popularity_scores else None,
+            top_percentage=0.1,
+            quiet=True,
+            update_existing=True,
+        )
 
     logger.info("=" * 60)
     logger.info("Data seeding completed!")
@@ -6,7 +6,7 @@ import asyncio
 import sys
 from app.db.session import async_session
 from app.models.user import User
-from app.core.security import get_password_hash
+from app.core.hashing import password_hasher
 from sqlalchemy import select
 
 
@@ -46,7 +46,7 @@ async def seed_users():
                 if existing_user:
                     # Update existing user
                     existing_user.email = user_data["email"]
-                    existing_user.hashed_password = get_password_hash(user_data["password"])
+                    existing_user.hashed_password = await password_hasher.hash(user_data["password"])
                     existing_user.role = user_data["role"]
                     existing_user.is_active = True
                     print(f"✅ Updated user: {user_data['username']} ({user_data['role']})")
@@ -55,7 +55,7 @@ async def seed_users():
                     new_user = User(
                         username=user_data["username"],
                         email=user_data["email"],
-                        hashed_password=get_password_hash(user_data["password"]),
+                        hashed_password=await password_hasher.hash(user_data["password"]),
                         role=user_data["role"],
                         is_active=True
                     )
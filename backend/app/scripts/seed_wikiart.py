@@ -4,12 +4,13 @@ CLI wrapper for seeding WikiArt data into the database.
 Usage:
     docker compose exec backend python -m app.scripts.seed_wikiart --wikiart-dir /app/ml/input/wikiart --top 0.01
     docker compose exec backend python -m app.scripts.seed_wikiart --wikiart-dir /app/ml/input/wikiart --top 0.1 --popularity-pt /app/ml/output/popularity.pt
+    docker compose exec backend python -m app.scripts.seed_wikiart --wikiart-dir /app/ml/input/wikiart --top 0.1 --workers 8
 """
 import asyncio
 import argparse
 import logging
 from pathlib import Path
-from app.scripts.seed_data import seed_artworks, load_popularity_scores
+from app.scripts.seed_data import SCAN_WORKERS, seed_artworks, load_popularity_scores
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -39,6 +40,12 @@ def main():
         default=None,
         help="Optional path to popularity scores .pt file",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SCAN_WORKERS,
+        help=f"Number of style folders scanned in parallel (default: {SCAN_WORKERS})",
+    )
     
     args = parser.parse_args()
     
@@ -47,6 +54,7 @@ def main():
     logger.info("=" * 60)
     logger.info(f"WikiArt directory: {args.wikiart_dir}")
     logger.info(f"Top percentage: {args.top * 100}%")
+    logger.info(f"Scan workers: {args.workers}")
     
     # Load popularity scores if provided
     popularity_scores = {}
@@ -62,6 +70,7 @@ def main():
             wikiart_dir=args.wikiart_dir,
             popularity_scores=popularity_scores,
             top_percentage=args.top,
+            workers=args.workers,
         )
     )
     
@@ -1,23 +1,36 @@
 """
 Artist description loader service.
-Loads and caches artist descriptions from ML output file.
+
+Descriptions are served from a compact SQLite store (one row per artist
+slug holding the best available description and its pre-rendered
+snippet). On first use the store is read into a slug-keyed dict, so a
+lookup is one slugify plus one dict hit; nothing is unpickled and torch
+is not needed at runtime. Build the store from the ML output .pt file
+with python -m app.scripts.convert_artist_descriptions (docker-compose runs
+it on startup, before the web server).
 """
 import re
-import torch
-from typing import Optional, Dict
+import sqlite3
+import tempfile
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
 from pathlib import Path
 import logging
 import os
 
 logger = logging.getLogger(__name__)
 
-# Module-level cache
-_descriptions_cache: Optional[Dict[str, Dict]] = None
+# Source fields in priority order, used when building the store
+DESCRIPTION_FIELDS = [
+    'llm_standard_description',
+    'wikipedia_description',
+    'google_arts_description',
+    'rijksmuseum_works',
+]
 
-# Try multiple possible paths for the descriptions file
+# Try multiple possible paths for the descriptions store
 _POSSIBLE_PATHS = [
-    Path("/app/ml/output/artist_descriptions.pt"),
-    Path(os.path.join(os.path.dirname(__file__), "../../../ml/output/artist_descriptions.pt")),
+    Path("/app/ml/output/artist_descriptions.sqlite3"),
+    Path(os.path.join(os.path.dirname(__file__), "../../../ml/output/artist_descriptions.sqlite3")),
 ]
 
 
@@ -36,8 +49,8 @@ def slugify_artist(artist_name: str) -> str:
     Returns:
         Slugified artist name
     """
-    # Convert to lowercase
-    slug = artist_name.lower()
+    # Case-fold (a stricter lowercase for case-insensitive matching)
+    slug = artist_name.casefold()
     # Replace non-alphanumeric characters with underscore
     slug = re.sub(r'[^a-z0-9]+', '_', slug)
     # Remove leading/trailing underscores
@@ -47,54 +60,218 @@ def slugify_artist(artist_name: str) -> str:
     return slug
 
 
-def _load_descriptions() -> Dict[str, Dict]:
+class ArtistDescription(NamedTuple):
+    """Full description and pre-rendered snippet for one artist."""
+    description: str
+    snippet: str
+
+
+def make_snippet(description: str) -> str:
+    """
+    Render the short snippet shown on gallery cards.
+    
+    Args:
+        description: Full artist description
+        
+    Returns:
+        The first two sentences, with an ellipsis if there is more content
+    """
+    # Split into sentences and take first few
+    sentences = description.split('. ')
+    
+    # Take first 2-3 sentences as snippet
+    snippet_sentences = sentences[:min(2, len(sentences))]
+    snippet = '. '.join(snippet_sentences)
+    
+    # Add ellipsis if there's more content
+    if len(sentences) > 2:
+        if not snippet.endswith('.'):
+            snippet += '.'
+        snippet += '...'
+    elif not snippet.endswith('.'):
+        snippet += '.'
+    
+    return snippet
+
+
+def best_description(artist_data) -> Optional[str]:
     """
-    Load artist descriptions from .pt file into memory.
+    Pick the description to serve from one entry of the source .pt file.
     
+    Args:
+        artist_data: Dict of description fields, or a plain description string
+        
     Returns:
-        Dictionary mapping slugified artist names to description data
+        First non-empty field in DESCRIPTION_FIELDS order, or None
     """
-    global _descriptions_cache
+    if isinstance(artist_data, str):
+        return artist_data.strip() or None
+    if not isinstance(artist_data, dict):
+        return None
+    for field in DESCRIPTION_FIELDS:
+        desc = artist_data.get(field)
+        # Ensure it's a string and not empty after stripping
+        if isinstance(desc, str) and desc.strip():
+            return desc.strip()
+    return None
+
+
+def _iter_entries(descriptions: Dict) -> Iterator[Tuple[str, str, str]]:
+    """Yield (slug, description, snippet) rows from a source descriptions dict."""
+    for key, artist_data in descriptions.items():
+        desc = best_description(artist_data)
+        if desc:
+            yield slugify_artist(str(key)), desc, make_snippet(desc)
+
+
+def write_store(descriptions: Dict, path: Path) -> int:
+    """
+    Write a descriptions store from a source descriptions dict.
     
-    if _descriptions_cache is not None:
-        return _descriptions_cache
+    Args:
+        descriptions: Dict of artist slug (or name) -> description fields or string
+        path: Output SQLite file, replaced if it exists
+        
+    Returns:
+        Number of artists written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique temporary file next to the store, so concurrent builds don't collide
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    os.close(fd)
+    os.chmod(tmp_name, 0o644)  # mkstemp creates the file private to its owner
+    tmp_path = Path(tmp_name)
+    
+    connection = sqlite3.connect(tmp_path)
+    try:
+        connection.execute(
+            "CREATE TABLE descriptions ("
+            "slug TEXT PRIMARY KEY, description TEXT NOT NULL, snippet TEXT NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        connection.executemany(
+            "INSERT OR REPLACE INTO descriptions (slug, description, snippet) VALUES (?, ?, ?)",
+            _iter_entries(descriptions),
+        )
+        connection.commit()
+        count = connection.execute("SELECT count(*) FROM descriptions").fetchone()[0]
+        connection.execute("VACUUM")
+    except BaseException:
+        connection.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    else:
+        connection.close()
+    
+    # Swap in atomically so running workers never see a partial file
+    os.replace(tmp_path, path)
+    return count
+
+
+class DescriptionStore:
+    """In-memory, slug-keyed index over a descriptions store."""
+    
+    def __init__(self, path: Path):
+        self.path = path
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(descriptions)")}
+            if "snippet" in columns:
+                rows = connection.execute("SELECT slug, description, snippet FROM descriptions")
+                self._entries = {slug: ArtistDescription(desc, snippet) for slug, desc, snippet in rows}
+            else:
+                # Store built before snippets were precomputed
+                rows = connection.execute("SELECT slug, description FROM descriptions")
+                self._entries = {slug: ArtistDescription(desc, make_snippet(desc)) for slug, desc in rows}
+        finally:
+            connection.close()
+    
+    def get(self, slug: str) -> Optional[ArtistDescription]:
+        """Return the entry stored for an artist slug."""
+        return self._entries.get(slug)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Module-level store, opened lazily; False once we know there is none
+_store = None
+
+
+def get_store() -> Optional[DescriptionStore]:
+    """
+    Open the descriptions store on first use.
+    
+    Returns:
+        The shared store, or None if no store file is available
+    """
+    global _store
+    
+    if _store is not None:
+        return _store or None
     
     try:
         # Try to find the file in possible paths
-        descriptions_path = None
-        for path in _POSSIBLE_PATHS:
-            if path.exists():
-                descriptions_path = path
-                break
+        store_path = next((path for path in _POSSIBLE_PATHS if path.exists()), None)
         
-        if descriptions_path is None:
-            logger.warning(f"Artist descriptions file not found in any of: {_POSSIBLE_PATHS}")
-            _descriptions_cache = {}
-            return _descriptions_cache
+        if store_path is None:
+            logger.warning(
+                f"Artist descriptions store not found in any of: {_POSSIBLE_PATHS}; "
+                "build it with python -m app.scripts.convert_artist_descriptions"
+            )
+            _store = False
+            return None
         
-        # Load the torch file
-        descriptions = torch.load(descriptions_path, map_location='cpu')
+        _store = DescriptionStore(store_path)
+        logger.info(f"Loaded {len(_store)} artist descriptions from {store_path}")
+        return _store
         
-        if not isinstance(descriptions, dict):
-            logger.error(f"Artist descriptions file has unexpected format: {type(descriptions)}")
-            _descriptions_cache = {}
-            return _descriptions_cache
+    except Exception as e:
+        logger.error(f"Error opening artist descriptions store: {e}")
+        _store = False
+        return None
+
+
+def get_entry(artist_name: str) -> Optional[ArtistDescription]:
+    """
+    Get the description and snippet for an artist.
+    
+    Args:
+        artist_name: Name of the artist (matched case-insensitively by slug)
         
-        _descriptions_cache = descriptions
-        logger.info(f"Loaded {len(_descriptions_cache)} artist descriptions from {descriptions_path}")
-        return _descriptions_cache
+    Returns:
+        ArtistDescription or None if not found
+    """
+    store = get_store()
+    if store is None or not artist_name:
+        return None
+    
+    return store.get(slugify_artist(artist_name))
+
+
+def describe_artists(artist_names: Iterable[str]) -> Dict[str, Optional[ArtistDescription]]:
+    """
+    Look up each distinct artist once, e.g. for a page of gallery cards.
+    
+    Args:
+        artist_names: Artist names, possibly repeated
         
-    except Exception as e:
-        logger.error(f"Error loading artist descriptions: {e}")
-        _descriptions_cache = {}
-        return _descriptions_cache
+    Returns:
+        Dict of artist name -> ArtistDescription (or None if not found)
+    """
+    entries: Dict[str, Optional[ArtistDescription]] = {}
+    for name in artist_names:
+        if name not in entries:
+            entries[name] = get_entry(name)
+    return entries
 
 
 def get_description(artist_name: str) -> Optional[str]:
     """
     Get the best available description for an artist.
     
-    Priority order:
+    Priority order (resolved when the store is built):
     1. llm_standard_description
     2. wikipedia_description
     3. google_arts_description
@@ -106,27 +283,8 @@ def get_description(artist_name: str) -> Optional[str]:
     Returns:
         Artist description or None if not found
     """
-    descriptions = _load_descriptions()
-    
-    # Convert artist name to slug
-    slug = slugify_artist(artist_name)
-    
-    # Check if artist exists in cache
-    if slug not in descriptions:
-        return None
-    
-    artist_data = descriptions[slug]
-    
-    # Try to get description in priority order
-    for field in ['llm_standard_description', 'wikipedia_description', 
-                  'google_arts_description', 'rijksmuseum_works']:
-        if field in artist_data and artist_data[field]:
-            desc = artist_data[field]
-            # Ensure it's a string and not empty after stripping
-            if isinstance(desc, str) and desc.strip():
-                return desc.strip()
-    
-    return None
+    entry = get_entry(artist_name)
+    return entry.description if entry else None
 
 
 def get_description_snippet(artist_name: str, max_lines: int = 3) -> Optional[str]:
@@ -140,31 +298,12 @@ def get_description_snippet(artist_name: str, max_lines: int = 3) -> Optional[st
     Returns:
         Short description snippet or None if not found
     """
-    description = get_description(artist_name)
-    
-    if not description:
-        return None
-    
-    # Split into sentences and take first few
-    sentences = description.split('. ')
-    
-    # Take first 2-3 sentences as snippet
-    snippet_sentences = sentences[:min(2, len(sentences))]
-    snippet = '. '.join(snippet_sentences)
-    
-    # Add ellipsis if there's more content
-    if len(sentences) > 2:
-        if not snippet.endswith('.'):
-            snippet += '.'
-        snippet += '...'
-    elif not snippet.endswith('.'):
-        snippet += '.'
-    
-    return snippet
+    entry = get_entry(artist_name)
+    return entry.snippet if entry else None
 
 
 def reload_descriptions():
-    """Force reload of artist descriptions from file."""
-    global _descriptions_cache
-    _descriptions_cache = None
-    _load_descriptions()
+    """Force the descriptions store to be reloaded (e.g. after a rebuild)."""
+    global _store
+    _store = None
+    get_store()
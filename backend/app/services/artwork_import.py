@@ -0,0 +1,210 @@
+"""
+Bulk import of CDN artworks by "Style/filename.jpg" key.
+
+The whole batch is validated up front, existing paths and known categories
+are fetched in one query each, missing categories are created, and new
+artworks are written with multi-row INSERT ... ON CONFLICT DO NOTHING in a
+single transaction. Every input path gets its own status, so one bad row
+no longer fails the batch.
+"""
+import logging
+import re
+from datetime import datetime
+from typing import Dict, Iterable, List, Set, Tuple
+from uuid import uuid4
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+from app.core.config import settings
+from app.models.artwork import Artwork
+from app.models.category import Category
+from app.services.cdn_catalog import IMAGE_EXTENSIONS, parse_artwork_key
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT statement / values per IN list
+BATCH_SIZE = 1000
+
+# Prefix under which CDN keys are stored as image_path (matches the seeders)
+IMAGE_PATH_PREFIX = "ml/input/wikiart/"
+
+# "Style/filename.ext" with no further nesting
+_KEY_PATTERN = re.compile(r"^[A-Za-z0-9][\w\-. ]*/[^/\\]+$")
+
+
+def _chunks(items: List, size: int = BATCH_SIZE) -> Iterable[List]:
+    """Yield consecutive slices of at most size items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _insert(dialect: str, table):
+    """Return a dialect INSERT supporting ON CONFLICT DO NOTHING."""
+    return pg_insert(table) if dialect == "postgresql" else sqlite_insert(table)
+
+
+def category_slug(style: str) -> str:
+    """Slug for an auto-created category (same rule as the seeders)."""
+    return style.lower().replace(" ", "-").replace("_", "-")
+
+
+def validate_key(key: str) -> str:
+    """
+    Check an import key and return an error message, or "" if it is valid.
+
+    Args:
+        key: Path relative to the bucket root, e.g. "Baroque/rembrandt_night-watch.jpg"
+    """
+    if not key or not _KEY_PATTERN.match(key):
+        return "Invalid path format (expected Style/filename)"
+    if ".." in key.split("/"):
+        return "Invalid path format (expected Style/filename)"
+    if not key.lower().endswith(IMAGE_EXTENSIONS):
+        return "Unsupported file type"
+    return ""
+
+
+async def _existing_paths(db: AsyncSession, paths: List[str]) -> Set[str]:
+    """Return which of the given image paths are already stored."""
+    existing: Set[str] = set()
+    for chunk in _chunks(paths):
+        result = await db.execute(select(Artwork.image_path).where(col(Artwork.image_path).in_(chunk)))
+        existing.update(result.scalars().all())
+    return existing
+
+
+async def _ensure_categories(db: AsyncSession, styles: Set[str]) -> Tuple[Set[str], List[str]]:
+    """
+    Make sure a category exists for every style.
+
+    Returns:
+        Tuple of (styles that now have a category, names of created categories)
+    """
+    result = await db.execute(select(Category.name).where(col(Category.name).in_(list(styles))))
+    known = set(result.scalars().all())
+    missing = sorted(styles - known)
+    if not missing:
+        return known, []
+
+    dialect = db.get_bind().dialect.name
+    statement = _insert(dialect, Category.__table__).values(
+        [{"name": style, "slug": category_slug(style)} for style in missing]
+    ).on_conflict_do_nothing()
+    await db.execute(statement)
+
+    # A slug clash with an existing category leaves that style uncreated
+    result = await db.execute(select(Category.name).where(col(Category.name).in_(missing)))
+    created = sorted(result.scalars().all())
+    return known | set(created), created
+
+
+async def import_artworks(db: AsyncSession, keys: List[str]) -> Dict:
+    """
+    Import artworks for a batch of CDN keys in one transaction.
+
+    Args:
+        db: Database session (committed on success)
+        keys: Paths like "Baroque/rembrandt_night-watch.jpg"
+
+    Returns:
+        {"imported", "skipped", "failed", "created_categories", "details"}, where
+        details holds one {"path", "status", ...} entry per input key, in order.
+        status is "success", "skipped" (already imported or repeated) or "failed".
+    """
+    details: List[Dict] = []
+    candidates: Dict[str, Dict] = {}  # image_path -> detail of the row to insert
+
+    for raw_key in keys:
+        key = (raw_key or "").strip().lstrip("/")
+        if key.startswith(IMAGE_PATH_PREFIX):
+            key = key[len(IMAGE_PATH_PREFIX):]
+        error = validate_key(key)
+        if error:
+            details.append({"path": raw_key, "status": "failed", "error": error})
+            continue
+        image_path = f"{IMAGE_PATH_PREFIX}{key}"
+        if image_path in candidates:
+            details.append({"path": raw_key, "status": "skipped", "reason": "Duplicate in request"})
+            continue
+        title, artist = parse_artwork_key(key)
+        detail = {"path": raw_key, "status": "success", "title": title, "artist": artist}
+        candidates[image_path] = detail
+        details.append(detail)
+
+    created_categories: List[str] = []
+    if candidates:
+        # Paths imported before image_path was normalized were stored bare
+        existing = await _existing_paths(
+            db, list(candidates) + [path[len(IMAGE_PATH_PREFIX):] for path in candidates]
+        )
+        pending: Dict[str, Dict] = {}
+        for image_path, detail in candidates.items():
+            if image_path in existing or image_path[len(IMAGE_PATH_PREFIX):] in existing:
+                detail.update(status="skipped", reason="Already imported")
+            else:
+                pending[image_path] = detail
+
+        styles = {path[len(IMAGE_PATH_PREFIX):].split("/", 1)[0] for path in pending}
+        known_styles: Set[str] = set()
+        if styles:
+            known_styles, created_categories = await _ensure_categories(db, styles)
+
+        base_url = settings.ARTWORKS_BASE_URL.rstrip("/")
+        now = datetime.utcnow()
+        rows = []
+        for image_path, detail in pending.items():
+            key = image_path[len(IMAGE_PATH_PREFIX):]
+            style = key.split("/", 1)[0]
+            if style not in known_styles:
+                detail.update(status="failed", error=f"Could not create category {style!r}")
+                continue
+            rows.append({
+                "id": uuid4(),
+                "title": detail["title"],
+                "artist": detail["artist"],
+                "year": None,
+                "style": style,
+                "image_path": image_path,
+                "image_url": f"{base_url}/{key}",
+                "popularity_score": 0.0,
+                "views": 0,
+                "like_count": 0,
+                "comment_count": 0,
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+            })
+
+        table = Artwork.__table__
+        dialect = db.get_bind().dialect.name
+        inserted: Set[str] = set()
+        for batch in _chunks(rows):
+            statement = (
+                _insert(dialect, table)
+                .values(batch)
+                .on_conflict_do_nothing()
+                .returning(table.c.image_path)
+            )
+            result = await db.execute(statement)
+            inserted.update(result.scalars().all())
+        for row in rows:
+            if row["image_path"] not in inserted:
+                # Imported concurrently since the existing paths were read
+                pending[row["image_path"]].update(status="skipped", reason="Already imported")
+
+    await db.commit()
+
+    counts = {"success": 0, "skipped": 0, "failed": 0}
+    for detail in details:
+        counts[detail["status"]] += 1
+    if created_categories:
+        logger.info(f"Batch import created categories: {', '.join(created_categories)}")
+    return {
+        "imported": counts["success"],
+        "skipped": counts["skipped"],
+        "failed": counts["failed"],
+        "created_categories": created_categories,
+        "details": details,
+    }
@@ -0,0 +1,77 @@
+"""
+Version stamps for the artwork catalog.
+
+The process-local version is bumped whenever a session commits a change
+to artworks or categories, so in-process derived data (search index,
+caches) can tell cheaply whether it is stale. Writes that bypass the ORM
+session (raw engine connections) should call bump() themselves.
+High-frequency statements that only touch counters (views, likes,
+comments) run with UNTRACKED execution options so they do not invalidate
+everything.
+"""
+import itertools
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.models.artwork import Artwork
+from app.models.category import Category
+
+_TRACKED_MODELS = (Artwork, Category)
+_TRACKED_TABLES = {model.__tablename__ for model in _TRACKED_MODELS}
+_SESSION_FLAG = "catalog_changed"
+
+# Execution options for bulk statements that do not change catalog content
+UNTRACKED = {"catalog_untracked": True}
+
+_counter = itertools.count(1)
+_version = 0
+
+
+def current() -> int:
+    """Return the current catalog version."""
+    return _version
+
+
+def bump() -> int:
+    """Advance the catalog version and return the new value."""
+    global _version
+    _version = next(_counter)
+    return _version
+
+
+def _flag(session: Session) -> None:
+    """Mark the session's transaction as changing the catalog."""
+    session.info[_SESSION_FLAG] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context):
+    """Flag the session if the flush touched catalog rows."""
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, _TRACKED_MODELS):
+            _flag(session)
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement(orm_execute_state):
+    """Flag the session for bulk INSERT/UPDATE/DELETE statements on catalog tables."""
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if orm_execute_state.execution_options.get("catalog_untracked"):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) in _TRACKED_TABLES:
+        _flag(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session):
+    """Bump the version once the flagged changes are visible to other sessions."""
+    if session.info.pop(_SESSION_FLAG, False):
+        bump()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_on_rollback(session):
+    """Discard the flag for changes that never became visible."""
+    session.info.pop(_SESSION_FLAG, None)
@@ -0,0 +1,279 @@
+"""
+Catalog of artwork images available on the S3-compatible CDN bucket.
+
+Keys are listed with ListObjectsV2 over one shared httpx.AsyncClient
+(connection reuse), following continuation tokens until the listing is
+complete, with styles fetched concurrently. Parsed listings are cached per
+style for CDN_CATALOG_TTL_SECONDS; concurrent callers share a single
+refresh, and a style whose refresh fails keeps serving its last listing.
+
+Refreshes are conditional where the server allows it: each cached page
+keeps the ETag it was served with and is re-requested with If-None-Match,
+so an unchanged page costs a 304 instead of a download and parse. Servers
+that send no ETag on listings (AWS S3 among them) are simply re-listed.
+
+httpx is imported on first use: it is only needed by the admin scan, and
+its import (which also loads its CLI dependencies) is a sizeable share of
+worker startup time.
+"""
+import asyncio
+import logging
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+S3_NAMESPACE = {"s3": "http://s3.amazonaws.com/doc/2006-03-01/"}
+
+# Keys per ListObjectsV2 page (the S3 maximum)
+PAGE_SIZE = 1000
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+
+def parse_list_objects(xml_data: bytes) -> Tuple[List[str], Optional[str], Optional[str]]:
+    """
+    Parse one ListObjects response page.
+
+    Args:
+        xml_data: ListBucketResult XML document
+
+    Returns:
+        Tuple of (keys, continuation token, start-after key); the last two
+        are None unless the listing is truncated
+    """
+    root = ET.fromstring(xml_data)
+    keys = [
+        element.text
+        for element in root.findall("s3:Contents/s3:Key", S3_NAMESPACE)
+        if element.text
+    ]
+    truncated = root.findtext("s3:IsTruncated", default="false", namespaces=S3_NAMESPACE)
+    if truncated.strip().lower() != "true":
+        return keys, None, None
+    token = root.findtext("s3:NextContinuationToken", namespaces=S3_NAMESPACE)
+    if token:
+        return keys, token, None
+    # Servers without continuation tokens: resume after the last key
+    return keys, None, keys[-1] if keys else None
+
+
+def parse_artwork_key(key: str) -> Tuple[str, str]:
+    """
+    Derive (title, artist) from a "Style/artist-name_title-words.jpg" key.
+
+    Args:
+        key: Object key relative to the bucket root
+
+    Returns:
+        Tuple of (title, artist), title-cased
+    """
+    filename = key.split("/")[-1]
+    filename_base = filename.rsplit(".", 1)[0]
+
+    # Split by underscore to extract artist and title
+    separator = "_" if "_" in filename_base else "-"
+    parts = filename_base.split(separator, 1)
+    artist_part = parts[0]
+    title_part = parts[1] if len(parts) > 1 else parts[0]
+
+    # Format: replace hyphens/underscores with spaces, title case
+    artist = artist_part.replace("-", " ").replace("_", " ").title()
+    title = title_part.replace("-", " ").replace("_", " ").title()
+    return title, artist
+
+
+@dataclass
+class _Page:
+    """One ListObjects page, with the validator it was served with."""
+    params: Dict[str, str]
+    keys: List[str]
+    next_params: Optional[Dict[str, str]]
+    etag: Optional[str]
+
+
+@dataclass
+class _Listing:
+    """Cached image keys of one style prefix."""
+    keys: List[str]
+    fetched_at: float
+    pages: List[_Page]
+
+
+class CdnCatalog:
+    """TTL-cached, conditionally refreshed listing of CDN image keys per style."""
+
+    def __init__(
+        self,
+        base_url: str,
+        ttl_seconds: float = 300,
+        concurrency: int = 4,
+        timeout: float = 10.0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.ttl_seconds = ttl_seconds
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._listings: Dict[str, _Listing] = {}
+        self._refresh_lock = asyncio.Lock()
+        self.requests = 0
+        self.refreshes = 0
+        self.not_modified = 0
+        self.errors = 0
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=self.concurrency),
+            )
+        return self._client
+
+    async def list_pages(self, prefix: str, cached: Sequence[_Page] = ()) -> List[_Page]:
+        """
+        Fetch every ListObjects page under a prefix, following pagination.
+
+        Args:
+            prefix: Key prefix such as "Baroque/"
+            cached: Pages of a previous listing; a page requested with the
+                same parameters is revalidated with If-None-Match and
+                reused if the server answers 304 Not Modified
+
+        Returns:
+            The pages of the listing, in order
+
+        Raises:
+            httpx.HTTPError: If a page cannot be fetched
+        """
+        client = self._get_client()
+        pages: List[_Page] = []
+        params: Optional[Dict[str, str]] = {"list-type": "2", "prefix": prefix, "max-keys": str(PAGE_SIZE)}
+        while params is not None:
+            previous = cached[len(pages)] if len(pages) < len(cached) else None
+            headers = {}
+            if previous is not None and previous.etag and previous.params == params:
+                headers["If-None-Match"] = previous.etag
+            response = await client.get(f"{self.base_url}/", params=params, headers=headers)
+            self.requests += 1
+            if response.status_code == 304 and headers:
+                self.not_modified += 1
+                pages.append(previous)
+                params = previous.next_params
+                continue
+            response.raise_for_status()
+            page_keys, token, start_after = parse_list_objects(response.content)
+            next_params = None
+            if token:
+                next_params = {**params, "continuation-token": token}
+                next_params.pop("start-after", None)
+            elif start_after:
+                next_params = {**params, "start-after": start_after}
+                next_params.pop("continuation-token", None)
+            pages.append(_Page(params, page_keys, next_params, response.headers.get("etag")))
+            params = next_params
+        return pages
+
+    async def list_keys(self, prefix: str) -> List[str]:
+        """
+        List every object key under a prefix, following pagination.
+
+        Args:
+            prefix: Key prefix such as "Baroque/"
+
+        Returns:
+            All keys under the prefix, in listing order
+
+        Raises:
+            httpx.HTTPError: If a page cannot be fetched
+        """
+        return [key for page in await self.list_pages(prefix) for key in page.keys]
+
+    async def _refresh(self, styles: List[str]) -> None:
+        """
+        Re-list the given styles concurrently, revalidating cached pages and
+        keeping old listings on failure.
+        """
+        import httpx
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def refresh_style(style: str) -> None:
+            previous = self._listings.get(style)
+            async with semaphore:
+                try:
+                    pages = await self.list_pages(f"{style}/", previous.pages if previous else ())
+                except (httpx.HTTPError, ET.ParseError) as e:
+                    self.errors += 1
+                    logger.error(f"Error listing CDN style {style}: {e}")
+                    return
+            images = [key for page in pages for key in page.keys if key.lower().endswith(IMAGE_EXTENSIONS)]
+            self._listings[style] = _Listing(keys=images, fetched_at=time.monotonic(), pages=pages)
+
+        await asyncio.gather(*(refresh_style(style) for style in styles))
+        self.refreshes += 1
+
+    def _stale(self, styles: List[str]) -> List[str]:
+        """Return the styles whose cached listing is missing or expired."""
+        now = time.monotonic()
+        return [
+            style for style in styles
+            if style not in self._listings
+            or now - self._listings[style].fetched_at >= self.ttl_seconds
+        ]
+
+    async def get(self, styles: List[str], refresh: bool = False) -> Dict[str, List[str]]:
+        """
+        Return the image keys of each style, refreshing stale listings.
+
+        Args:
+            styles: Style prefixes to list
+            refresh: Re-list every style even if its listing is fresh
+
+        Returns:
+            Dict of style -> image keys (styles never listed successfully are omitted)
+        """
+        if refresh or self._stale(styles):
+            async with self._refresh_lock:
+                # Another request may have refreshed while we waited
+                stale = list(styles) if refresh else self._stale(styles)
+                if stale:
+                    await self._refresh(stale)
+        return {style: self._listings[style].keys for style in styles if style in self._listings}
+
+    def clear(self) -> None:
+        """Drop all cached listings."""
+        self._listings.clear()
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters for monitoring."""
+        return {
+            "styles": len(self._listings),
+            "keys": sum(len(listing.keys) for listing in self._listings.values()),
+            "requests": self.requests,
+            "refreshes": self.refreshes,
+            "not_modified": self.not_modified,
+            "errors": self.errors,
+        }
+
+
+cdn_catalog = CdnCatalog(
+    settings.ARTWORKS_BASE_URL,
+    ttl_seconds=settings.CDN_CATALOG_TTL_SECONDS,
+    concurrency=settings.CDN_CATALOG_CONCURRENCY,
+)
@@ -0,0 +1,77 @@
+"""
+Denormalized artwork counters (like_count, comment_count).
+
+Counters are adjusted with a relative UPDATE in the same transaction as
+the like/comment write, so concurrent requests never lose increments.
+reconcile_counters() recomputes them from the source tables in bulk to
+repair any drift.
+"""
+from typing import Dict
+from uuid import UUID
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.artwork import Artwork
+from app.models.comment import Comment
+from app.models.like import Like
+from app.services.catalog_version import UNTRACKED
+
+# Counter column -> (source model, foreign key column to artworks)
+COUNTER_SOURCES = {
+    "like_count": (Like, Like.artwork_id),
+    "comment_count": (Comment, Comment.artwork_id),
+}
+
+
+async def adjust_artwork_counter(db: AsyncSession, artwork_id: UUID, counter: str, delta: int) -> None:
+    """
+    Atomically add delta to an artwork counter (never below zero).
+    
+    Args:
+        db: Database session (caller commits)
+        artwork_id: Artwork to update
+        counter: "like_count" or "comment_count"
+        delta: Amount to add (negative to decrement)
+    """
+    column = getattr(Artwork, counter)
+    query = (
+        update(Artwork)
+        .where(Artwork.id == artwork_id)
+        .values({counter: column + delta})
+        .execution_options(**UNTRACKED)
+    )
+    if delta < 0:
+        query = query.where(column >= -delta)
+    await db.execute(query)
+
+
+async def reconcile_counters(db: AsyncSession) -> Dict[str, int]:
+    """
+    Recompute every artwork counter from its source table.
+    
+    Each counter is repaired with one set-based UPDATE that only touches
+    rows whose stored value has drifted.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Number of repaired artworks per counter
+    """
+    repaired = {}
+    for counter, (model, artwork_fk) in COUNTER_SOURCES.items():
+        actual = (
+            select(func.count())
+            .select_from(model)
+            .where(artwork_fk == Artwork.id)
+            .scalar_subquery()
+        )
+        column = getattr(Artwork, counter)
+        result = await db.execute(
+            update(Artwork)
+            .where(column != actual)
+            .values({counter: actual})
+            .execution_options(synchronize_session=False, **UNTRACKED)
+        )
+        repaired[counter] = result.rowcount
+    await db.commit()
+    return repaired
@@ -0,0 +1,37 @@
+"""
+Like lookups shared by the API and the server-rendered pages.
+"""
+from typing import Iterable, Set
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+from app.models.like import Like
+
+
+async def get_liked_artwork_ids(
+    db: AsyncSession,
+    user_id: UUID,
+    artwork_ids: Iterable[UUID],
+) -> Set[UUID]:
+    """
+    Return which of the given artworks the user has liked.
+    
+    Args:
+        db: Database session
+        user_id: ID of the user
+        artwork_ids: Artwork IDs to check
+        
+    Returns:
+        Subset of artwork_ids liked by the user (single IN query)
+    """
+    artwork_ids = list(set(artwork_ids))
+    if not artwork_ids:
+        return set()
+    
+    query = select(Like.artwork_id).where(
+        Like.user_id == user_id,
+        col(Like.artwork_id).in_(artwork_ids),
+    )
+    result = await db.execute(query)
+    return set(result.scalars().all())
@@ -0,0 +1,113 @@
+"""
+Process-local cache of catalog reference data (categories, active styles).
+
+Entries are stamped with the catalog version they were loaded at and are
+reloaded when the version moves on (an artwork or category changed in this
+process) or after REFERENCE_CACHE_TTL_SECONDS, which bounds staleness for
+changes made by other worker processes. Each entry keeps its serialized
+JSON and a content ETag so responses can be served and revalidated
+without touching the database.
+"""
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List
+from sqlalchemy import distinct, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.http_cache import make_etag
+from app.models.artwork import Artwork
+from app.models.category import Category
+from app.services import catalog_version
+
+
+@dataclass(frozen=True)
+class ReferenceData:
+    """A cached value with its JSON serialization and ETag."""
+    value: Any
+    body: bytes
+    etag: str
+    version: int
+    loaded_at: float
+
+
+class ReferenceCache:
+    """Named reference-data entries invalidated by catalog version and TTL."""
+
+    def __init__(self, ttl_seconds: float = 60):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, ReferenceData] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(
+        self,
+        name: str,
+        db: AsyncSession,
+        loader: Callable[[AsyncSession], Awaitable[Any]],
+    ) -> ReferenceData:
+        """
+        Return the cached entry, loading it if missing or stale.
+        
+        Args:
+            name: Entry name
+            db: Database session used on a miss
+            loader: Coroutine function returning a JSON-serializable value
+        """
+        version = catalog_version.current()
+        entry = self._entries.get(name)
+        if (
+            entry is not None
+            and entry.version == version
+            and time.monotonic() - entry.loaded_at < self.ttl_seconds
+        ):
+            self.hits += 1
+            return entry
+        
+        self.misses += 1
+        value = await loader(db)
+        body = json.dumps(value, separators=(",", ":")).encode()
+        entry = ReferenceData(
+            value=value,
+            body=body,
+            etag=make_etag(name, body),
+            version=version,
+            loaded_at=time.monotonic(),
+        )
+        self._entries[name] = entry
+        return entry
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters for monitoring."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+reference_cache = ReferenceCache(ttl_seconds=settings.REFERENCE_CACHE_TTL_SECONDS)
+
+
+async def _load_categories(db: AsyncSession) -> List[Dict]:
+    result = await db.execute(select(Category).order_by(Category.id))
+    return [
+        {"id": category.id, "name": category.name, "slug": category.slug}
+        for category in result.scalars().all()
+    ]
+
+
+async def _load_active_styles(db: AsyncSession) -> List[str]:
+    query = select(distinct(Artwork.style)).where(Artwork.is_active == True).order_by(Artwork.style)
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
+async def get_categories(db: AsyncSession) -> ReferenceData:
+    """Return all categories as [{"id", "name", "slug"}, ...]."""
+    return await reference_cache.get("categories", db, _load_categories)
+
+
+async def get_active_styles(db: AsyncSession) -> ReferenceData:
+    """Return the sorted styles that have at least one active artwork."""
+    return await reference_cache.get("active_styles", db, _load_active_styles)
@@ -0,0 +1,258 @@
+"""
+Artwork search service.
+
+On PostgreSQL, title/artist search runs against a generated ``search_vector``
+tsvector column (GIN indexed) and pg_trgm GIN indexes, which also serve the
+substring ILIKE match, and results are ranked by ts_rank_cd plus trigram
+similarity.
+
+On other databases (SQLite in tests and local development), a process-local
+trigram inverted index over active and inactive artworks is used instead. It
+is rebuilt lazily whenever the catalog version changes.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+from sqlalchemy import func, literal_column, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+from app.models.artwork import Artwork
+from app.services import catalog_version
+
+logger = logging.getLogger(__name__)
+
+# Weight of an artist match relative to a title match
+ARTIST_WEIGHT = 0.8
+
+# DDL for the PostgreSQL search column and indexes (idempotent)
+POSTGRES_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    ALTER TABLE artworks ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(artist, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_artworks_search_vector ON artworks USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS ix_artworks_title_trgm ON artworks USING gin (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_artworks_artist_trgm ON artworks USING gin (artist gin_trgm_ops)",
+]
+
+
+def create_search_indexes(connection) -> None:
+    """Create the search column and indexes on PostgreSQL; no-op elsewhere."""
+    if connection.dialect.name != "postgresql":
+        return
+    for statement in POSTGRES_SEARCH_DDL:
+        connection.execute(text(statement))
+
+
+def _trigrams(value: str) -> Set[str]:
+    """Return the set of 3-character substrings of a lowercased string."""
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+def _field_score(query: str, value: str, value_trigrams: Set[str]) -> float:
+    """
+    Score how well a lowercased field matches a lowercased query.
+
+    Exact matches beat leading matches, which beat matches at a word
+    boundary, which beat plain substrings; trigram overlap separates
+    results within the same tier.
+    """
+    if query not in value:
+        return 0.0
+    if value == query:
+        tier = 4.0
+    elif value.startswith(query):
+        tier = 3.0
+    elif f" {query}" in value:
+        tier = 2.0
+    else:
+        tier = 1.0
+    query_trigrams = _trigrams(query)
+    union = query_trigrams | value_trigrams
+    similarity = len(query_trigrams & value_trigrams) / len(union) if union else 0.0
+    return tier + similarity
+
+
+@dataclass
+class _Document:
+    """Searchable projection of an artwork."""
+    id: UUID
+    title: str
+    artist: str
+    title_trigrams: Set[str]
+    artist_trigrams: Set[str]
+    style: str
+    is_active: bool
+    created_at: datetime
+
+
+class TrigramIndex:
+    """In-process trigram inverted index over artwork titles and artists."""
+
+    def __init__(self):
+        self.version: Optional[int] = None
+        self._documents: List[_Document] = []
+        self._postings: Dict[str, Set[int]] = {}
+
+    def build(self, rows, version: int) -> None:
+        """Rebuild the index from (id, title, artist, style, is_active, created_at) rows."""
+        documents = []
+        postings: Dict[str, Set[int]] = {}
+        for position, (artwork_id, title, artist, style, is_active, created_at) in enumerate(rows):
+            title = (title or "").lower()
+            artist = (artist or "").lower()
+            document = _Document(
+                id=artwork_id,
+                title=title,
+                artist=artist,
+                title_trigrams=_trigrams(title),
+                artist_trigrams=_trigrams(artist),
+                style=style,
+                is_active=is_active,
+                created_at=created_at,
+            )
+            for trigram in document.title_trigrams | document.artist_trigrams:
+                postings.setdefault(trigram, set()).add(position)
+            documents.append(document)
+        self._documents = documents
+        self._postings = postings
+        self.version = version
+        logger.info(f"Built artwork search index: {len(documents)} documents, {len(postings)} trigrams")
+
+    def _candidates(self, query: str) -> List[int]:
+        """Return positions of documents that may contain the query."""
+        trigrams = _trigrams(query)
+        if not trigrams:
+            return list(range(len(self._documents)))
+        postings = sorted((self._postings.get(t, set()) for t in trigrams), key=len)
+        return list(set.intersection(*postings))
+
+    def search(
+        self,
+        q: str,
+        style: Optional[str] = None,
+        include_inactive: bool = False,
+    ) -> List[Tuple[UUID, float]]:
+        """Return (artwork id, score) pairs ordered by relevance, then newest first."""
+        query = q.strip().lower()
+        if not query:
+            return []
+        hits = []
+        for position in self._candidates(query):
+            document = self._documents[position]
+            if not include_inactive and not document.is_active:
+                continue
+            if style and document.style != style:
+                continue
+            score = max(
+                _field_score(query, document.title, document.title_trigrams),
+                ARTIST_WEIGHT * _field_score(query, document.artist, document.artist_trigrams),
+            )
+            if score > 0:
+                hits.append((document, score))
+        hits.sort(key=lambda hit: (hit[1], hit[0].created_at, hit[0].id.hex), reverse=True)
+        return [(document.id, round(score, 4)) for document, score in hits]
+
+
+_index = TrigramIndex()
+
+
+async def _fallback_index(db: AsyncSession) -> TrigramIndex:
+    """Return the in-process index, rebuilding it if the catalog changed."""
+    version = catalog_version.current()
+    if _index.version != version:
+        result = await db.execute(
+            select(
+                Artwork.id,
+                Artwork.title,
+                Artwork.artist,
+                Artwork.style,
+                Artwork.is_active,
+                Artwork.created_at,
+            )
+        )
+        _index.build(result.all(), version)
+    return _index
+
+
+async def _search_postgres(
+    db: AsyncSession,
+    q: str,
+    style: Optional[str],
+    include_inactive: bool,
+    offset: int,
+    limit: int,
+) -> List[Tuple[Artwork, float]]:
+    """Ranked search using the tsvector column and pg_trgm indexes."""
+    tsquery = func.websearch_to_tsquery("simple", q)
+    search_vector = literal_column("artworks.search_vector")
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    pattern = f"%{escaped}%"
+    score = (
+        func.ts_rank_cd(search_vector, tsquery)
+        + func.greatest(
+            func.similarity(Artwork.title, q),
+            ARTIST_WEIGHT * func.similarity(Artwork.artist, q),
+        )
+    ).label("score")
+
+    query = select(Artwork, score).where(
+        search_vector.op("@@")(tsquery)
+        | col(Artwork.title).ilike(pattern, escape="\\")
+        | col(Artwork.artist).ilike(pattern, escape="\\")
+    )
+    if not include_inactive:
+        query = query.where(Artwork.is_active == True)
+    if style:
+        query = query.where(Artwork.style == style)
+    query = (
+        query.order_by(score.desc(), col(Artwork.created_at).desc(), col(Artwork.id).desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    result = await db.execute(query)
+    return [(artwork, round(float(rank), 4)) for artwork, rank in result.all()]
+
+
+async def search_artworks(
+    db: AsyncSession,
+    q: str,
+    style: Optional[str] = None,
+    include_inactive: bool = False,
+    offset: int = 0,
+    limit: int = 20,
+) -> List[Tuple[Artwork, float]]:
+    """
+    Search artworks by title or artist, ranked by relevance.
+
+    Args:
+        db: Database session
+        q: Search text (matched as a case-insensitive substring)
+        style: Optional exact style filter
+        include_inactive: Include artworks with is_active=False (admin views)
+        offset: Number of ranked results to skip
+        limit: Maximum number of results to return
+
+    Returns:
+        List of (artwork, score) pairs, best match first
+    """
+    if not q or not q.strip():
+        return []
+
+    if db.get_bind().dialect.name == "postgresql":
+        return await _search_postgres(db, q.strip(), style, include_inactive, offset, limit)
+
+    index = await _fallback_index(db)
+    ranked = index.search(q, style=style, include_inactive=include_inactive)[offset:offset + limit]
+    if not ranked:
+        return []
+
+    result = await db.execute(select(Artwork).where(col(Artwork.id).in_([artwork_id for artwork_id, _ in ranked])))
+    artworks = {artwork.id: artwork for artwork in result.scalars().all()}
+    return [(artworks[artwork_id], score) for artwork_id, score in ranked if artwork_id in artworks]
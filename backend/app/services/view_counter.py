@@ -0,0 +1,179 @@
+"""
+Write-behind view counter for Artwork.views.
+
+Views are aggregated in memory, spread over lock-striped shards so
+recording a view is a dict increment. A background task periodically
+drains the shards and applies all pending increments in one batched
+UPDATE ... FROM (VALUES ...) statement on PostgreSQL, turning a hot-row
+write per view into one write per artwork per flush interval. Pending counts are flushed
+on shutdown and merged back if a flush fails.
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import Integer, column, update, values
+from sqlmodel import col
+from app.core.config import settings
+from app.models.artwork import Artwork
+from app.services.catalog_version import UNTRACKED
+
+logger = logging.getLogger(__name__)
+
+
+def _increment_statements(dialect: str, drained: Dict[UUID, int]) -> List:
+    """
+    Build the UPDATE statements applying a batch of view increments.
+    
+    PostgreSQL gets a single UPDATE ... FROM (VALUES ...). SQLite cannot
+    alias VALUES columns, so there artworks are grouped by increment and
+    updated with one IN-list statement per distinct increment.
+    """
+    if dialect == "postgresql":
+        increments = values(
+            column("artwork_id", Artwork.id.type),
+            column("views", Integer),
+            name="increments",
+        ).data(list(drained.items()))
+        return [
+            update(Artwork)
+            .where(Artwork.id == increments.c.artwork_id)
+            .values(views=Artwork.views + increments.c.views)
+            .execution_options(synchronize_session=False, **UNTRACKED)
+        ]
+    
+    by_increment: Dict[int, List[UUID]] = {}
+    for artwork_id, count in drained.items():
+        by_increment.setdefault(count, []).append(artwork_id)
+    return [
+        update(Artwork)
+        .where(col(Artwork.id).in_(artwork_ids))
+        .values(views=Artwork.views + count)
+        .execution_options(synchronize_session=False, **UNTRACKED)
+        for count, artwork_ids in by_increment.items()
+    ]
+
+
+class ViewCounter:
+    """Sharded in-memory buffer of artwork view increments."""
+
+    def __init__(self, shards: int = 16):
+        self._shards = [({}, threading.Lock()) for _ in range(shards)]
+        self._task: Optional[asyncio.Task] = None
+        self.recorded = 0
+        self.flushed = 0
+        self.flushes = 0
+        self.failures = 0
+        self.last_flush_seconds = 0.0
+
+    def _shard(self, artwork_id: UUID):
+        return self._shards[artwork_id.int % len(self._shards)]
+
+    def record(self, artwork_id: UUID, count: int = 1) -> None:
+        """Buffer view increments for an artwork."""
+        counts, lock = self._shard(artwork_id)
+        with lock:
+            counts[artwork_id] = counts.get(artwork_id, 0) + count
+            self.recorded += count
+
+    def pending(self) -> int:
+        """Return the number of buffered, not yet flushed views."""
+        total = 0
+        for counts, lock in self._shards:
+            with lock:
+                total += sum(counts.values())
+        return total
+
+    def _drain(self) -> Dict[UUID, int]:
+        """Take all buffered increments, leaving the shards empty."""
+        drained: Dict[UUID, int] = {}
+        for counts, lock in self._shards:
+            # Cleared in place: record() may hold this dict while waiting for the lock
+            with lock:
+                drained.update(counts)
+                counts.clear()
+        return drained
+
+    def _merge_back(self, drained: Dict[UUID, int]) -> None:
+        """Return increments from a failed flush to the buffer."""
+        for artwork_id, count in drained.items():
+            counts, lock = self._shard(artwork_id)
+            with lock:
+                counts[artwork_id] = counts.get(artwork_id, 0) + count
+
+    async def flush(self, session_factory: Callable) -> int:
+        """
+        Apply all buffered increments in one transaction.
+        
+        Args:
+            session_factory: Callable returning an AsyncSession context manager
+            
+        Returns:
+            Number of views written
+        """
+        drained = self._drain()
+        if not drained:
+            return 0
+        
+        started = time.perf_counter()
+        try:
+            async with session_factory() as session:
+                for statement in _increment_statements(session.get_bind().dialect.name, drained):
+                    await session.execute(statement)
+                await session.commit()
+        except Exception as e:
+            self._merge_back(drained)
+            self.failures += 1
+            logger.error(f"Error flushing {len(drained)} artwork view counts: {e}")
+            raise
+        
+        written = sum(drained.values())
+        self.flushed += written
+        self.flushes += 1
+        self.last_flush_seconds = time.perf_counter() - started
+        return written
+
+    async def _run(self, session_factory: Callable, interval: float) -> None:
+        """Flush periodically until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush(session_factory)
+            except Exception:
+                pass  # logged in flush; counts retried next interval
+
+    def start(self, session_factory: Callable, interval: Optional[float] = None) -> None:
+        """Start the periodic flush task on the running event loop."""
+        if self._task is None:
+            interval = interval or settings.VIEW_COUNTER_FLUSH_SECONDS
+            self._task = asyncio.create_task(self._run(session_factory, interval))
+
+    async def stop(self, session_factory: Callable) -> None:
+        """Stop the periodic flush task and flush whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush(session_factory)
+        except Exception:
+            pass  # logged in flush
+
+    def stats(self) -> Dict[str, float]:
+        """Return counters for monitoring."""
+        return {
+            "pending": self.pending(),
+            "recorded": self.recorded,
+            "flushed": self.flushed,
+            "flushes": self.flushes,
+            "failures": self.failures,
+            "last_flush_seconds": round(self.last_flush_seconds, 6),
+        }
+
+
+view_counter = ViewCounter(shards=settings.VIEW_COUNTER_SHARDS)
@@ -9,7 +9,7 @@ from sqlmodel import SQLModel
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.main import app
-from app.api.deps import get_db
+from app.api.deps import get_db, get_read_db
 
 # Test database URL (using in-memory SQLite for tests)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -35,6 +35,12 @@ async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
 
 # Override the dependency
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_read_db] = override_get_db
+
+
+def pytest_configure(config):
+    """Enforce per-endpoint SQL query budgets (see app/tests/query_budget.py)."""
+    config.pluginmanager.import_plugin("app.tests.query_budget")
 
 
 # Removed deprecated event_loop fixture - using default from pytest-asyncio
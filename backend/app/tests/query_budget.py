@@ -0,0 +1,94 @@
+"""
+Pytest plugin enforcing per-endpoint SQL query budgets.
+
+Every request a test makes through the app is tracked by
+QueryDetectorMiddleware. The test fails if a request executed more SQL
+statements than its endpoint's budget in QUERY_BUDGETS, or than a budget set
+with the marker:
+
+    @pytest.mark.query_budget(3)                    # every request in the test
+    @pytest.mark.query_budget(1, endpoint="GET /")  # one endpoint
+
+Endpoints are "METHOD /route/template", as in the /metrics labels.
+"""
+from typing import Dict, List, Optional
+import pytest
+from app.core.query_detector import QueryCollector, query_detector
+
+# Statements allowed per request for the hot endpoints, independent of data size
+QUERY_BUDGETS: Dict[str, int] = {
+    "GET /": 3,
+    "GET /api/v1/artworks": 2,
+    "GET /api/v1/artworks/search": 2,
+    "GET /api/v1/artworks/{artwork_id}": 2,
+    "GET /api/v1/categories": 1,
+    "GET /api/v1/comments/{artwork_id}": 2,
+    "GET /api/v1/likes/me": 2,
+    "GET /api/v1/likes/me/stats": 2,
+    "GET /me/likes": 2,
+    "POST /api/v1/auth/login": 1,
+    "POST /api/v1/likes/{artwork_id}": 5,
+}
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(max_queries, endpoint=None): fail if a request (to endpoint, "
+        "or any request) executes more than max_queries SQL statements",
+    )
+
+
+def _budget_lookup(item):
+    """
+    Return a function giving the budget of an endpoint for this test: an
+    endpoint marker, else a blanket marker, else QUERY_BUDGETS (None if unlimited).
+    """
+    endpoints: Dict[str, int] = {}
+    blanket: Optional[int] = None
+    # iter_markers yields the closest marker first; apply it last so it wins
+    for marker in reversed(list(item.iter_markers("query_budget"))):
+        endpoint = marker.kwargs.get("endpoint")
+        if endpoint is None:
+            blanket = marker.args[0]
+        else:
+            endpoints[endpoint] = marker.args[0]
+
+    def lookup(endpoint: str) -> Optional[int]:
+        if endpoint in endpoints:
+            return endpoints[endpoint]
+        if blanket is not None:
+            return blanket
+        return QUERY_BUDGETS.get(endpoint)
+
+    return lookup
+
+
+def _describe(collector: QueryCollector, budget: int) -> str:
+    """Describe a request that went over budget, heaviest statements first."""
+    lines = [f"{collector.label} executed {collector.statement_count} SQL statements (budget {budget}):"]
+    for group in sorted(collector.groups.values(), key=lambda g: -g.count):
+        origin = " <- ".join(group.origins.most_common(1)[0][0]) or "unknown origin"
+        lines.append(f"  {group.count}x {group.sql}\n      at {origin}")
+    return "\n".join(lines)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    budget_for = _budget_lookup(item)
+    requests: List[QueryCollector] = []
+    query_detector.observers.append(requests.append)
+    try:
+        # Raises if the test itself failed, which is reported as is
+        result = yield
+    finally:
+        query_detector.observers.remove(requests.append)
+
+    violations = []
+    for collector in requests:
+        budget = budget_for(collector.label)
+        if budget is not None and collector.statement_count > budget:
+            violations.append(_describe(collector, budget))
+    if violations:
+        pytest.fail("Query budget exceeded:\n" + "\n".join(violations), pytrace=False)
+    return result
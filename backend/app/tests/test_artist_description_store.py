@@ -0,0 +1,151 @@
+"""
+Tests for the SQLite artist description store.
+"""
+import sqlite3
+import pytest
+from httpx import AsyncClient
+from app.scripts.convert_artist_descriptions import convert_descriptions
+from app.services import artist_descriptions
+from app.services.artist_descriptions import describe_artists, make_snippet, write_store
+
+
+@pytest.fixture
+def description_store(tmp_path, monkeypatch):
+    """Build a small store and point the service at it."""
+    path = tmp_path / "artist_descriptions.sqlite3"
+    write_store(
+        {
+            "rembrandt": {
+                "llm_standard_description": "Rembrandt was a Dutch Golden Age painter. He is famous.",
+                "wikipedia_description": "Wikipedia text.",
+            },
+            "abdullah_suriosubroto": {
+                "llm_standard_description": "",
+                "wikipedia_description": "An Indonesian painter.",
+            },
+            "nobody_known": {"llm_standard_description": "   "},
+            "Claude Monet": "French painter.",
+        },
+        path,
+    )
+    monkeypatch.setattr(artist_descriptions, "_POSSIBLE_PATHS", [path])
+    artist_descriptions.reload_descriptions()
+    yield path
+    monkeypatch.undo()
+    artist_descriptions.reload_descriptions()
+
+
+def test_write_store_resolves_priority(description_store):
+    """The store keeps the first non-empty field per artist."""
+    store = artist_descriptions.get_store()
+    assert len(store) == 3
+    assert store.get("rembrandt").description.startswith("Rembrandt was a Dutch Golden Age painter")
+    assert store.get("abdullah_suriosubroto").description == "An Indonesian painter."
+    assert store.get("nobody_known") is None
+
+
+def test_get_description_from_store(description_store):
+    """Lookups slugify the name, so they are case-insensitive."""
+    assert artist_descriptions.get_description("REMBRANDT") == artist_descriptions.get_description("Rembrandt")
+    assert artist_descriptions.get_description("Claude Monet") == "French painter."
+    assert artist_descriptions.get_description("Unknown Artist") is None
+    assert artist_descriptions.get_description_snippet("Rembrandt") == (
+        "Rembrandt was a Dutch Golden Age painter. He is famous."
+    )
+
+
+def test_snippets_are_precomputed(description_store):
+    """Snippets are rendered when the store is built, not per request."""
+    with sqlite3.connect(description_store) as connection:
+        snippet = connection.execute(
+            "SELECT snippet FROM descriptions WHERE slug = 'claude_monet'"
+        ).fetchone()[0]
+    assert snippet == "French painter."
+    assert make_snippet("One. Two. Three. Four") == "One. Two...."
+
+
+def test_describe_artists_deduplicates(description_store):
+    """Each distinct artist on a page is looked up once."""
+    entries = describe_artists(["Rembrandt", "Unknown", "Rembrandt", "rembrandt"])
+    assert set(entries) == {"Rembrandt", "Unknown", "rembrandt"}
+    assert entries["Rembrandt"] == entries["rembrandt"]
+    assert entries["Unknown"] is None
+
+
+def test_store_without_snippet_column(tmp_path, monkeypatch):
+    """Stores built before snippets existed still load."""
+    path = tmp_path / "legacy.sqlite3"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE descriptions (slug TEXT PRIMARY KEY, description TEXT NOT NULL)")
+        connection.execute("INSERT INTO descriptions VALUES ('claude_monet', 'A. B. C.')")
+    monkeypatch.setattr(artist_descriptions, "_POSSIBLE_PATHS", [path])
+    artist_descriptions.reload_descriptions()
+    try:
+        assert artist_descriptions.get_description_snippet("Claude Monet") == "A. B...."
+    finally:
+        monkeypatch.undo()
+        artist_descriptions.reload_descriptions()
+
+
+def test_missing_store(tmp_path, monkeypatch):
+    """Without a store, descriptions are simply unavailable."""
+    monkeypatch.setattr(artist_descriptions, "_POSSIBLE_PATHS", [tmp_path / "missing.sqlite3"])
+    artist_descriptions.reload_descriptions()
+    try:
+        assert artist_descriptions.get_store() is None
+        assert artist_descriptions.get_description("Rembrandt") is None
+    finally:
+        monkeypatch.undo()
+        artist_descriptions.reload_descriptions()
+
+
+def test_missing_store_is_not_built_at_runtime(tmp_path, monkeypatch):
+    """A source .pt file without a store is left to the deploy step, not converted in a request."""
+    path = tmp_path / "artist_descriptions.sqlite3"
+    path.with_suffix(".pt").write_bytes(b"not loaded")
+    monkeypatch.setattr(artist_descriptions, "_POSSIBLE_PATHS", [path])
+    artist_descriptions.reload_descriptions()
+    try:
+        assert artist_descriptions.get_store() is None
+        assert not path.exists()
+    finally:
+        monkeypatch.undo()
+        artist_descriptions.reload_descriptions()
+
+
+def test_write_store_leaves_no_temporary_files(tmp_path):
+    """Rebuilding swaps the store in place without leftovers."""
+    path = tmp_path / "artist_descriptions.sqlite3"
+    write_store({"rembrandt": "A Dutch painter."}, path)
+    write_store({"rembrandt": "A Dutch painter.", "claude_monet": "French painter."}, path)
+    assert [child.name for child in tmp_path.iterdir()] == [path.name]
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT count(*) FROM descriptions").fetchone()[0] == 2
+
+
+def test_convert_if_stale(tmp_path):
+    """--if-stale skips a missing source and an up-to-date store."""
+    torch = pytest.importorskip("torch")
+    source = tmp_path / "artist_descriptions.pt"
+    output = tmp_path / "artist_descriptions.sqlite3"
+    assert convert_descriptions(str(source), str(output), if_stale=True) == 0
+    assert not output.exists()
+
+    torch.save({"rembrandt": "A Dutch painter."}, source)
+    assert convert_descriptions(str(source), str(output), if_stale=True) == 0
+    assert output.exists()
+    built = output.stat().st_mtime_ns
+    assert convert_descriptions(str(source), str(output), if_stale=True) == 0
+    assert output.stat().st_mtime_ns == built
+
+
+@pytest.mark.asyncio
+async def test_artist_description_endpoint(async_client: AsyncClient, description_store):
+    """The artists API serves descriptions from the shared store."""
+    response = await async_client.get("/api/v1/artists/rembrandt/description")
+    assert response.status_code == 200
+    assert "Dutch Golden Age" in response.json()["description"]
+
+    response = await async_client.get("/api/v1/artists/Unknown Artist/description")
+    assert response.status_code == 200
+    assert "renowned artist" in response.json()["description"]
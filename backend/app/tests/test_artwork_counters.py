@@ -0,0 +1,138 @@
+"""
+Tests for denormalized artwork like/comment counters.
+"""
+import pytest
+from uuid import uuid4
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.user import User
+from app.models.artwork import Artwork
+from app.models.category import Category
+from app.models.like import Like
+from app.core.security import get_password_hash
+from app.services.counters import reconcile_counters
+
+
+@pytest.fixture
+async def counter_category(db_session: AsyncSession) -> Category:
+    """Create a test category."""
+    unique_id = uuid4().hex[:8]
+    category = Category(name=f"Counters{unique_id}", slug=f"counters-{unique_id}")
+    db_session.add(category)
+    await db_session.commit()
+    await db_session.refresh(category)
+    return category
+
+
+@pytest.fixture
+async def counter_artwork(db_session: AsyncSession, counter_category: Category) -> Artwork:
+    """Create a test artwork."""
+    artwork = Artwork(
+        title="Counter Artwork",
+        artist="Counter Artist",
+        style=counter_category.name,
+        image_path="test/counter.jpg",
+        image_url="/static/artworks/test/counter.jpg",
+    )
+    db_session.add(artwork)
+    await db_session.commit()
+    await db_session.refresh(artwork)
+    return artwork
+
+
+@pytest.fixture
+async def counter_headers(async_client: AsyncClient, db_session: AsyncSession) -> dict:
+    """Create a user and return its auth headers."""
+    unique_id = uuid4().hex[:8]
+    user = User(
+        email=f"counter{unique_id}@example.com",
+        username=f"counter{unique_id}",
+        hashed_password=get_password_hash("password123"),
+    )
+    db_session.add(user)
+    await db_session.commit()
+    response = await async_client.post(
+        "/api/v1/auth/login",
+        data={"username": user.username, "password": "password123"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _counts(async_client: AsyncClient, artwork: Artwork):
+    data = (await async_client.get(f"/api/v1/artworks/{artwork.id}")).json()
+    return data["like_count"], data["comment_count"]
+
+
+@pytest.mark.asyncio
+async def test_like_and_comment_counters(
+    async_client: AsyncClient,
+    counter_headers: dict,
+    counter_artwork: Artwork
+):
+    """Test that likes and comments keep the artwork counters current."""
+    assert await _counts(async_client, counter_artwork) == (0, 0)
+    
+    await async_client.post(f"/api/v1/likes/{counter_artwork.id}", headers=counter_headers)
+    # Liking twice does not double count
+    await async_client.post(f"/api/v1/likes/{counter_artwork.id}", headers=counter_headers)
+    response = await async_client.post(
+        f"/api/v1/comments/{counter_artwork.id}",
+        json={"content": "Counting"},
+        headers=counter_headers
+    )
+    comment_id = response.json()["id"]
+    assert await _counts(async_client, counter_artwork) == (1, 1)
+    
+    await async_client.delete(f"/api/v1/likes/{counter_artwork.id}", headers=counter_headers)
+    await async_client.delete(f"/api/v1/comments/{comment_id}", headers=counter_headers)
+    assert await _counts(async_client, counter_artwork) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_counters_repairs_drift(
+    async_client: AsyncClient,
+    counter_headers: dict,
+    counter_artwork: Artwork,
+    db_session: AsyncSession
+):
+    """Test that reconciliation recomputes drifted counters from source rows."""
+    await async_client.post(f"/api/v1/likes/{counter_artwork.id}", headers=counter_headers)
+    await db_session.execute(
+        update(Artwork)
+        .where(Artwork.id == counter_artwork.id)
+        .values(like_count=42, comment_count=7)
+    )
+    await db_session.commit()
+    
+    repaired = await reconcile_counters(db_session)
+    
+    assert repaired["like_count"] >= 1
+    assert repaired["comment_count"] >= 1
+    assert await _counts(async_client, counter_artwork) == (1, 0)
+    
+    # A second run finds nothing to repair
+    assert await reconcile_counters(db_session) == {"like_count": 0, "comment_count": 0}
+
+
+@pytest.mark.asyncio
+async def test_list_artworks_sorted_by_likes(
+    async_client: AsyncClient,
+    db_session: AsyncSession,
+    counter_category: Category
+):
+    """Test the likes sort order on the artwork listing."""
+    for i, likes in enumerate([3, 10, 0]):
+        db_session.add(Artwork(
+            title=f"Liked {i}",
+            artist="Artist",
+            style=counter_category.name,
+            image_path=f"test/liked{i}.jpg",
+            image_url=f"/static/liked{i}.jpg",
+            like_count=likes,
+        ))
+    await db_session.commit()
+    
+    response = await async_client.get(f"/api/v1/artworks?sort=likes&style={counter_category.name}")
+    assert response.status_code == 200
+    assert [a["like_count"] for a in response.json()] == [10, 3, 0]
@@ -256,3 +256,63 @@ async def test_pagination(async_client: AsyncClient, db_session: AsyncSession):
     assert response.status_code == 200
     artworks = response.json()
     assert len(artworks) == 5
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination(async_client: AsyncClient, db_session: AsyncSession):
+    """Test keyset pagination walks every artwork exactly once, including ties."""
+    category = Category(name="Cursor_Style", slug="cursor-style")
+    db_session.add(category)
+    await db_session.commit()
+    
+    for i in range(7):
+        artwork = Artwork(
+            title=f"Cursor Artwork {i}",
+            artist="Cursor Artist",
+            style="Cursor_Style",
+            image_path=f"ml/input/wikiart/Cursor_Style/cursor{i}.jpg",
+            image_url=f"/static/artworks/Cursor_Style/cursor{i}.jpg",
+            popularity_score=float(i // 2),  # pairs of equal scores
+        )
+        db_session.add(artwork)
+    await db_session.commit()
+    
+    for sort in ("popularity", "views", "created_at"):
+        response = await async_client.get(f"/api/v1/artworks?style=Cursor_Style&sort={sort}&limit=7")
+        expected = [a["id"] for a in response.json()]
+        
+        seen = []
+        cursor = None
+        while True:
+            url = f"/api/v1/artworks?style=Cursor_Style&sort={sort}&limit=3"
+            if cursor:
+                url += f"&cursor={cursor}"
+            response = await async_client.get(url)
+            assert response.status_code == 200
+            seen.extend(a["id"] for a in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+        
+        assert seen == expected
+        assert len(seen) == 7
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_invalid_cursor(async_client: AsyncClient):
+    """Test that malformed or mismatched cursors are rejected."""
+    response = await async_client.get("/api/v1/artworks?cursor=not-a-cursor")
+    assert response.status_code == 400
+    
+    from app.core.pagination import encode_cursor
+    from uuid import uuid4
+    cursor = encode_cursor("views", 3, uuid4())
+    response = await async_client.get(f"/api/v1/artworks?sort=popularity&cursor={cursor}")
+    assert response.status_code == 400
+    
+    # Well-formed JSON with the wrong payload types
+    import base64
+    for payload in (b'["popularity",1.0,123]', b'{"a":1,"b":2,"c":3}', b'[1,1.0,"x"]'):
+        cursor = base64.urlsafe_b64encode(payload).decode().rstrip("=")
+        response = await async_client.get(f"/api/v1/artworks?sort=popularity&cursor={cursor}")
+        assert response.status_code == 400
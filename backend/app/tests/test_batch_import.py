@@ -0,0 +1,93 @@
+"""
+Tests for the bulk artwork batch import.
+"""
+import time
+import pytest
+from uuid import uuid4
+from httpx import AsyncClient
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
+from app.models.artwork import Artwork
+from app.models.category import Category
+from app.tests.test_admin_artworks import create_admin_user, get_admin_token
+
+
+@pytest.fixture
+async def admin_headers(async_client: AsyncClient, db_session: AsyncSession) -> dict:
+    """Create an admin and return its auth headers."""
+    admin = await create_admin_user(db_session)
+    token = await get_admin_token(async_client, admin)
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.asyncio
+async def test_batch_import_reports_per_row_status(
+    async_client: AsyncClient, db_session: AsyncSession, admin_headers: dict
+):
+    """Bad rows fail individually; duplicates are skipped; new styles get categories."""
+    style = f"ImportStyle{uuid4().hex[:8]}"
+    paths = [
+        f"{style}/claude-monet_water-lilies.jpg",
+        f"{style}/claude-monet_water-lilies.jpg",
+        f"{style}/notes.txt",
+        "no-style.jpg",
+        f"{style}/../secret.jpg",
+        f"{style}/edgar-degas_dancers.png",
+    ]
+
+    response = await async_client.post("/api/v1/artworks/batch-import", json=paths, headers=admin_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["imported"] == 2
+    assert data["skipped"] == 1
+    assert data["failed"] == 3
+    assert data["created_categories"] == [style]
+    assert [d["status"] for d in data["details"]] == [
+        "success", "skipped", "failed", "failed", "failed", "success"
+    ]
+    assert data["details"][0]["artist"] == "Claude Monet"
+    assert data["details"][0]["title"] == "Water Lilies"
+
+    category = (await db_session.execute(select(Category).where(Category.name == style))).scalar_one()
+    assert category.slug == style.lower()
+    artworks = (await db_session.execute(select(Artwork).where(Artwork.style == style))).scalars().all()
+    assert sorted(a.image_path for a in artworks) == [
+        f"ml/input/wikiart/{style}/claude-monet_water-lilies.jpg",
+        f"ml/input/wikiart/{style}/edgar-degas_dancers.png",
+    ]
+    assert all(a.image_url.endswith(a.image_path.split("/", 3)[-1]) for a in artworks)
+
+    # Importing again skips everything that already exists
+    response = await async_client.post("/api/v1/artworks/batch-import", json=paths[:1], headers=admin_headers)
+    assert response.json()["skipped"] == 1
+    assert response.json()["imported"] == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_import_thousands_of_paths(
+    async_client: AsyncClient, db_session: AsyncSession, admin_headers: dict
+):
+    """Large batches are written in multi-row inserts within one request."""
+    style = f"BulkStyle{uuid4().hex[:8]}"
+    paths = [f"{style}/bulk-artist_work-{index}.jpg" for index in range(2500)]
+
+    started = time.perf_counter()
+    response = await async_client.post("/api/v1/artworks/batch-import", json=paths, headers=admin_headers)
+    elapsed = time.perf_counter() - started
+
+    assert response.status_code == 200
+    assert response.json()["imported"] == 2500
+    count = (await db_session.execute(
+        select(func.count()).select_from(Artwork).where(Artwork.style == style)
+    )).scalar_one()
+    assert count == 2500
+    assert elapsed < 10  # generous bound; typically well under a second
+
+
+@pytest.mark.asyncio
+async def test_batch_import_requires_admin(async_client: AsyncClient):
+    """Anonymous callers cannot import."""
+    response = await async_client.post("/api/v1/artworks/batch-import", json=["Baroque/a_b.jpg"])
+    assert response.status_code == 401
@@ -0,0 +1,70 @@
+"""
+Tests for the load-test harness, on a small dataset in its own database.
+"""
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.db.migrations import migrate
+from app.scripts import benchmark
+from app.scripts.benchmark import DatasetSize
+
+
+@pytest.fixture
+async def benchmark_sessions(tmp_path):
+    """Session factory of a migrated, empty benchmark database."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'benchmark.db'}")
+    await migrate(engine)
+    yield sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_seed_dataset_is_consistent(benchmark_sessions):
+    """Seeding creates the requested rows, with counters matching likes and comments."""
+    size = DatasetSize(artworks=300, users=4, likes_per_user=5, comments=30)
+
+    await benchmark.seed_dataset(benchmark_sessions, size, seed=7)
+
+    assert await benchmark.count_rows(benchmark_sessions) == {
+        "artworks": 300, "users": 4, "likes": 20, "comments": 30,
+    }
+    dataset = await benchmark.load_dataset(benchmark_sessions)
+    assert dataset.usernames == [f"{benchmark.USER_PREFIX}{index}" for index in range(4)]
+    # Comments go to the top 1% of artworks
+    assert 1 <= len(dataset.commented_artwork_ids) <= 3
+
+
+@pytest.mark.asyncio
+async def test_run_scenarios_reports_every_endpoint(benchmark_sessions):
+    """Every scenario succeeds and reports latency percentiles and query counts."""
+    await benchmark.seed_dataset(benchmark_sessions, DatasetSize(200, 2, 3, 10), seed=1)
+    dataset = await benchmark.load_dataset(benchmark_sessions)
+
+    async with benchmark._in_process_client(benchmark_sessions) as client:
+        results = await benchmark.run_scenarios(client, dataset, requests=2, concurrency=2, warmup=0)
+
+    assert list(results) == [
+        "GET /",
+        "GET /api/v1/artworks?sort=popularity",
+        "GET /api/v1/artworks?sort=views",
+        "GET /api/v1/artworks?sort=created_at",
+        "GET /api/v1/artworks?sort=likes",
+        "GET /api/v1/likes/me",
+        "GET /api/v1/comments/{artwork_id}",
+        "POST /api/v1/auth/login",
+    ]
+    for name, result in results.items():
+        assert result["errors"] == 0, name
+        assert result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"]
+        assert result["requests_per_second"] > 0
+        assert result["queries_per_request"] >= 1
+
+
+def test_percentile_nearest_rank():
+    """Percentiles pick an observed value by nearest rank."""
+    values = [float(value) for value in range(1, 101)]
+
+    assert benchmark.percentile(values, 50) == 50.0
+    assert benchmark.percentile(values, 99) == 99.0
+    assert benchmark.percentile([3.0], 95) == 3.0
+    assert benchmark.percentile([], 50) == 0.0
@@ -0,0 +1,209 @@
+"""
+Tests for the CDN catalog listing client, against a local stand-in S3 server.
+"""
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from uuid import uuid4
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.routes import artworks as artworks_routes
+from app.models.artwork import Artwork
+from app.models.category import Category
+from app.services.cdn_catalog import CdnCatalog, parse_artwork_key
+from app.tests.test_admin_artworks import create_admin_user, get_admin_token
+
+OBJECTS = (
+    [f"Baroque/rembrandt_work-{index:03d}.jpg" for index in range(7)]
+    + ["Baroque/readme.txt"]
+    + [f"Impressionism/claude-monet_water-lilies-{index}.jpg" for index in range(3)]
+)
+
+
+class _ListObjectsHandler(BaseHTTPRequestHandler):
+    """Serve ListObjectsV2 pages over the server's objects, honoring max-keys, paging params and If-None-Match."""
+
+    def do_GET(self):
+        server = self.server
+        params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        server.requests.append(params)
+        prefix = params.get("prefix", "")
+        if prefix in server.failing_prefixes:
+            self.send_response(500)
+            self.end_headers()
+            return
+
+        keys = sorted(key for key in server.objects if key.startswith(prefix))
+        start = int(params.get("continuation-token", "0"))
+        if "start-after" in params:
+            start = sum(1 for key in keys if key <= params["start-after"])
+        page_size = min(int(params.get("max-keys", "1000")), server.page_size)
+        page = keys[start:start + page_size]
+        truncated = start + page_size < len(keys)
+
+        contents = "".join(f"<Contents><Key>{key}</Key></Contents>" for key in page)
+        token = ""
+        if truncated and server.continuation_tokens:
+            token = f"<NextContinuationToken>{start + page_size}</NextContinuationToken>"
+        body = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+            f"<Prefix>{prefix}</Prefix><IsTruncated>{str(truncated).lower()}</IsTruncated>"
+            f"{token}{contents}</ListBucketResult>"
+        ).encode()
+        if server.etags:
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+        self.send_response(200)
+        if server.etags:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def s3_server():
+    """Run the stand-in S3 server on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ListObjectsHandler)
+    server.requests = []
+    server.objects = list(OBJECTS)
+    server.etags = False
+    server.page_size = 3
+    server.continuation_tokens = True
+    server.failing_prefixes = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+async def catalog(s3_server):
+    """Catalog client pointed at the stand-in server."""
+    client = CdnCatalog(f"http://127.0.0.1:{s3_server.server_port}", ttl_seconds=60)
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_list_keys_follows_continuation_tokens(catalog: CdnCatalog, s3_server):
+    """Every page of a truncated listing is fetched."""
+    keys = await catalog.list_keys("Baroque/")
+
+    assert len(keys) == 8
+    pages = [r for r in s3_server.requests if r["prefix"] == "Baroque/"]
+    assert len(pages) == 3
+    assert pages[0]["list-type"] == "2"
+    assert [p.get("continuation-token") for p in pages] == [None, "3", "6"]
+
+
+@pytest.mark.asyncio
+async def test_list_keys_without_continuation_tokens(catalog: CdnCatalog, s3_server):
+    """Servers that only report IsTruncated are paged with start-after."""
+    s3_server.continuation_tokens = False
+
+    keys = await catalog.list_keys("Baroque/")
+
+    assert keys == sorted(key for key in OBJECTS if key.startswith("Baroque/"))
+
+
+@pytest.mark.asyncio
+async def test_get_caches_listings_until_refresh(catalog: CdnCatalog, s3_server):
+    """Listings are served from the TTL cache until they expire or are refreshed."""
+    listing = await catalog.get(["Baroque", "Impressionism"])
+    assert len(listing["Baroque"]) == 7  # readme.txt is not an image
+    assert len(listing["Impressionism"]) == 3
+    fetched = len(s3_server.requests)
+
+    await catalog.get(["Baroque", "Impressionism"])
+    assert len(s3_server.requests) == fetched
+
+    await catalog.get(["Impressionism"], refresh=True)
+    assert len(s3_server.requests) == fetched + 1
+
+    catalog.ttl_seconds = 0
+    await catalog.get(["Baroque"])
+    assert len(s3_server.requests) == fetched + 4
+
+
+@pytest.mark.asyncio
+async def test_refresh_revalidates_pages_with_etags(catalog: CdnCatalog, s3_server):
+    """Expired listings are revalidated page by page; only changed pages are downloaded."""
+    s3_server.etags = True
+    await catalog.get(["Baroque"])
+    assert catalog.stats()["not_modified"] == 0
+
+    catalog.ttl_seconds = 0
+    listing = await catalog.get(["Baroque"])
+    assert len(listing["Baroque"]) == 7
+    assert catalog.stats()["not_modified"] == 3
+
+    # A new key changes the last page only
+    s3_server.objects.append("Baroque/zurbaran_new-work.jpg")
+    listing = await catalog.get(["Baroque"])
+    assert "Baroque/zurbaran_new-work.jpg" in listing["Baroque"]
+    assert catalog.stats()["not_modified"] == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_previous_listing(catalog: CdnCatalog, s3_server):
+    """A style that cannot be listed keeps serving its last good listing."""
+    await catalog.get(["Baroque"])
+    s3_server.failing_prefixes.add("Baroque/")
+
+    listing = await catalog.get(["Baroque", "Impressionism"], refresh=True)
+
+    assert len(listing["Baroque"]) == 7
+    assert len(listing["Impressionism"]) == 3
+    assert catalog.stats()["errors"] == 1
+
+
+def test_parse_artwork_key():
+    """Artist and title are derived from the file name."""
+    assert parse_artwork_key("Baroque/rembrandt_the-night-watch.jpg") == ("The Night Watch", "Rembrandt")
+    assert parse_artwork_key("Impressionism/claude-monet_water-lilies-1.jpg") == ("Water Lilies 1", "Claude Monet")
+
+
+@pytest.mark.asyncio
+async def test_scan_endpoint_excludes_existing_artworks(
+    async_client: AsyncClient, db_session: AsyncSession, catalog: CdnCatalog, monkeypatch
+):
+    """The admin scan lists CDN images that are not in the database yet."""
+    monkeypatch.setattr(artworks_routes, "cdn_catalog", catalog)
+    unique_id = uuid4().hex[:8]
+    db_session.add(Category(name=f"ScanStyle{unique_id}", slug=f"scan-style-{unique_id}"))
+    db_session.add(Artwork(
+        title="Work 000",
+        artist="Rembrandt",
+        style=f"ScanStyle{unique_id}",
+        image_path="ml/input/wikiart/Baroque/rembrandt_work-000.jpg",
+        image_url="/static/artworks/Baroque/rembrandt_work-000.jpg",
+    ))
+    await db_session.commit()
+    admin = await create_admin_user(db_session)
+    token = await get_admin_token(async_client, admin)
+
+    response = await async_client.get(
+        "/api/v1/artworks/available/scan",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"Baroque", "Impressionism"}
+    paths = [item["path"] for item in data["Baroque"]]
+    assert "Baroque/rembrandt_work-000.jpg" not in paths
+    assert len(paths) == 6
+    assert data["Impressionism"][0]["artist"] == "Claude Monet"
@@ -0,0 +1,184 @@
+"""
+Tests for ETag / Last-Modified validation of artwork, listing and comment reads.
+"""
+import pytest
+from uuid import uuid4
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.user import User
+from app.models.artwork import Artwork
+from app.models.category import Category
+from app.core.security import get_password_hash
+from app.services import catalog_version
+from app.tests.test_admin_artworks import create_admin_user, get_admin_token
+
+
+@pytest.fixture
+async def cached_artwork(db_session: AsyncSession) -> Artwork:
+    """Create an active artwork in its own style."""
+    unique_id = uuid4().hex[:8]
+    category = Category(name=f"CondStyle{unique_id}", slug=f"cond-style-{unique_id}")
+    db_session.add(category)
+    artwork = Artwork(
+        title="Conditional",
+        artist="Cond Artist",
+        style=category.name,
+        image_path=f"test/cond_{unique_id}.jpg",
+        image_url=f"/static/artworks/test/cond_{unique_id}.jpg",
+    )
+    db_session.add(artwork)
+    await db_session.commit()
+    await db_session.refresh(artwork)
+    return artwork
+
+
+@pytest.mark.asyncio
+async def test_artwork_detail_etag_and_last_modified(
+    async_client: AsyncClient, db_session: AsyncSession, cached_artwork: Artwork
+):
+    """Detail responses revalidate with If-None-Match (no Last-Modified: counters move without updated_at)."""
+    url = f"/api/v1/artworks/{cached_artwork.id}"
+    response = await async_client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    assert "last-modified" not in response.headers
+
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = await async_client.get(url, headers={"If-None-Match": 'W/"stale"'})
+    assert response.status_code == 200
+
+    response = await async_client.get(f"/api/v1/artworks/{uuid4()}", headers={"If-None-Match": etag})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_artwork_update_changes_etag(
+    async_client: AsyncClient, db_session: AsyncSession, cached_artwork: Artwork
+):
+    """An admin edit moves updated_at, so old validators stop matching."""
+    url = f"/api/v1/artworks/{cached_artwork.id}"
+    etag = (await async_client.get(url)).headers["etag"]
+    admin = await create_admin_user(db_session)
+    token = await get_admin_token(async_client, admin)
+
+    response = await async_client.post(
+        f"/api/v1/artworks/{cached_artwork.id}/toggle-active",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_counter_update_changes_etag(
+    async_client: AsyncClient, db_session: AsyncSession, cached_artwork: Artwork
+):
+    """Bulk counter updates leave updated_at alone but still invalidate detail and listing validators."""
+    detail_url = f"/api/v1/artworks/{cached_artwork.id}"
+    listing_url = f"/api/v1/artworks?style={cached_artwork.style}&sort=popularity"
+    detail_etag = (await async_client.get(detail_url)).headers["etag"]
+    listing_etag = (await async_client.get(listing_url)).headers["etag"]
+
+    await db_session.execute(
+        update(Artwork)
+        .where(Artwork.id == cached_artwork.id)
+        .values(like_count=Artwork.like_count + 1)
+        .execution_options(**catalog_version.UNTRACKED)
+    )
+    await db_session.commit()
+
+    response = await async_client.get(detail_url, headers={"If-None-Match": detail_etag})
+    assert response.status_code == 200
+    assert response.json()["like_count"] == 1
+    response = await async_client.get(listing_url, headers={"If-None-Match": listing_etag})
+    assert response.status_code == 200
+    assert response.json()[0]["like_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_orm_update_touches_updated_at(
+    async_client: AsyncClient, db_session: AsyncSession, cached_artwork: Artwork
+):
+    """Any ORM edit stamps updated_at, even where a route does not set it."""
+    url = f"/api/v1/artworks/{cached_artwork.id}"
+    etag = (await async_client.get(url)).headers["etag"]
+    before = cached_artwork.updated_at
+
+    cached_artwork.artist = "Renamed Artist"
+    db_session.add(cached_artwork)
+    await db_session.commit()
+
+    assert cached_artwork.updated_at > before
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_listing_revalidates_until_catalog_changes(
+    async_client: AsyncClient, db_session: AsyncSession, cached_artwork: Artwork
+):
+    """Listings return 304 until a listed artwork changes, in every sort order."""
+    url = f"/api/v1/artworks?style={cached_artwork.style}&sort=created_at"
+    response = await async_client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    cached_artwork.title = "Conditional (retitled)"
+    db_session.add(cached_artwork)
+    await db_session.commit()
+
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()[0]["title"] == "Conditional (retitled)"
+
+    url = f"/api/v1/artworks?style={cached_artwork.style}&sort=views"
+    etag = (await async_client.get(url)).headers["etag"]
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_comments_revalidate_until_new_comment(
+    async_client: AsyncClient, db_session: AsyncSession, cached_artwork: Artwork
+):
+    """Comment lists get a 304 until a comment is added."""
+    url = f"/api/v1/comments/{cached_artwork.id}"
+    response = await async_client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    unique_id = uuid4().hex[:8]
+    user = User(
+        email=f"cond{unique_id}@example.com",
+        username=f"cond{unique_id}",
+        hashed_password=get_password_hash("password123"),
+    )
+    db_session.add(user)
+    await db_session.commit()
+    login = await async_client.post(
+        "/api/v1/auth/login", data={"username": user.username, "password": "password123"}
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    response = await async_client.post(url, json={"content": "Lovely"}, headers=headers)
+    assert response.status_code == 201
+
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    etag = response.headers["etag"]
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
@@ -0,0 +1,70 @@
+"""
+Tests for the engine options and connection pool metrics.
+"""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.core.config import settings
+from app.db.pool import MeteredQueuePool, pool_stats
+from app.db.session import engine_options
+
+
+def test_engine_options_for_asyncpg():
+    """PostgreSQL engines get the pool settings, statement caches and server settings."""
+    options = engine_options("postgresql+asyncpg://user:pass@db:5432/artgallery")
+
+    assert options["poolclass"] is MeteredQueuePool
+    assert options["pool_size"] == settings.DB_POOL_SIZE
+    assert options["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert options["pool_recycle"] == settings.DB_POOL_RECYCLE
+    assert options["pool_pre_ping"] == settings.DB_POOL_PRE_PING
+    connect_args = options["connect_args"]
+    assert connect_args["statement_cache_size"] == settings.DB_STATEMENT_CACHE_SIZE
+    assert connect_args["prepared_statement_cache_size"] == settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+    assert connect_args["server_settings"]["application_name"] == settings.DB_APPLICATION_NAME
+
+    # The options are accepted by the engine without connecting
+    created = create_async_engine("postgresql+asyncpg://user:pass@db:5432/artgallery", **options)
+    assert pool_stats(created)["size"] == settings.DB_POOL_SIZE
+
+
+def test_engine_options_for_sqlite():
+    """SQLite keeps its default pool and gets no driver connect arguments."""
+    options = engine_options("sqlite+aiosqlite:///:memory:")
+
+    assert "poolclass" not in options
+    assert "connect_args" not in options
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_track_checkouts_and_timeouts(tmp_path):
+    """Checkouts, in-use connections and pool timeouts are reported."""
+    metered = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MeteredQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    try:
+        async with metered.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            assert pool_stats(metered)["in_use"] == 1
+
+            with pytest.raises(PoolTimeoutError):
+                async with metered.connect():
+                    pass
+
+        stats = pool_stats(metered)
+        assert stats["in_use"] == 0
+        assert stats["idle"] == 1
+        assert stats["checkouts"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["wait_seconds_max"] >= 0
+
+        # Counters survive pool recreation
+        await metered.dispose()
+        assert pool_stats(metered)["checkouts"] == 1
+    finally:
+        await metered.dispose()
@@ -0,0 +1,96 @@
+"""
+Tests for the fast JSON response path of the artwork, like and comment reads.
+"""
+import json
+import pytest
+from datetime import datetime
+from typing import List
+from uuid import uuid4
+from fastapi.encoders import jsonable_encoder
+from httpx import AsyncClient
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core import responses
+from app.core.responses import FastJSONResponse
+from app.models.artwork import Artwork
+from app.models.category import Category
+from app.schemas.artwork import ArtworkRead, artwork_read
+
+
+@pytest.fixture
+async def fast_artworks(db_session: AsyncSession) -> List[Artwork]:
+    """Create a few active artworks in their own style."""
+    unique_id = uuid4().hex[:8]
+    category = Category(name=f"FastStyle{unique_id}", slug=f"fast-style-{unique_id}")
+    db_session.add(category)
+    artworks = [
+        Artwork(
+            title=f"Fast {index}",
+            artist="Fast Artist",
+            year=1880 + index,
+            style=category.name,
+            image_path=f"ml/input/wikiart/Fast/fast_{unique_id}_{index}.jpg",
+            image_url=f"/static/artworks/Fast/fast_{unique_id}_{index}.jpg",
+            popularity_score=10.5 - index,
+        )
+        for index in range(3)
+    ]
+    db_session.add_all(artworks)
+    await db_session.commit()
+    for artwork in artworks:
+        await db_session.refresh(artwork)
+    return artworks
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_fast_json_matches_validated_output(monkeypatch, use_orjson):
+    """Both encoders produce the same JSON as the response_model path."""
+    if not use_orjson:
+        monkeypatch.setattr(responses, "orjson", None)
+    artwork = Artwork(
+        title="Étude",
+        artist="Anonyme",
+        style="Baroque",
+        image_path="ml/input/wikiart/Baroque/etude.jpg",
+        image_url="/static/artworks/Baroque/etude.jpg",
+        popularity_score=1.0,
+        created_at=datetime(2024, 5, 1, 12, 30, 0, 250),
+    )
+    payload = artwork_read(artwork, "https://cdn.example/Baroque/etude.jpg")
+
+    validated = jsonable_encoder(TypeAdapter(ArtworkRead).validate_python(payload))
+
+    assert json.loads(FastJSONResponse([payload]).body) == [validated]
+    assert set(payload) == set(ArtworkRead.model_fields)
+
+
+@pytest.mark.asyncio
+async def test_list_artworks_uses_read_schema(async_client: AsyncClient, fast_artworks: List[Artwork]):
+    """Listing items have the ArtworkRead shape, CDN image URLs and paging headers."""
+    style = fast_artworks[0].style
+    response = await async_client.get(f"/api/v1/artworks?style={style}&limit=2")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert "x-next-cursor" in response.headers
+    assert "etag" in response.headers
+    data = response.json()
+    assert [item["title"] for item in data] == ["Fast 0", "Fast 1"]
+    assert set(data[0]) == set(ArtworkRead.model_fields)
+    assert data[0]["id"] == str(fast_artworks[0].id)
+    assert data[0]["image_url"].endswith(f"/Fast/{fast_artworks[0].image_path.rsplit('/', 1)[1]}")
+    assert data[0]["popularity_score"] == 10.5
+
+
+@pytest.mark.asyncio
+async def test_get_artwork_uses_read_schema(async_client: AsyncClient, fast_artworks: List[Artwork]):
+    """The detail endpoint returns ArtworkRead with its validators."""
+    artwork = fast_artworks[1]
+    response = await async_client.get(f"/api/v1/artworks/{artwork.id}")
+
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('W/"')
+    assert "last-modified" not in response.headers
+    data = response.json()
+    assert data["year"] == artwork.year
+    assert data["created_at"] == artwork.created_at.isoformat()
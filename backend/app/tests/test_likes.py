@@ -222,6 +222,28 @@ async def test_get_my_likes(
     assert all("style" in item for item in data)
     assert all("image_url" in item for item in data)
 
+    assert {item["id"] for item in data} == {str(test_artwork.id), str(artwork2.id)}
+    assert set(data[0]) == {"id", "title", "artist", "style", "image_url"}
+    assert data[0]["image_url"] == "/static/artworks/test/path2.jpg"
+
+
+@pytest.mark.asyncio
+async def test_my_likes_page_lists_liked_artworks(
+    async_client: AsyncClient,
+    auth_headers: dict,
+    test_artwork: Artwork
+):
+    """The My Likes page renders cards for the user's liked artworks."""
+    await async_client.post(f"/api/v1/likes/{test_artwork.id}", headers=auth_headers)
+    
+    response = await async_client.get("/me/likes", headers=auth_headers)
+    
+    assert response.status_code == 200
+    content = response.content.decode()
+    assert f"/artworks/{test_artwork.id}" in content
+    assert test_artwork.image_url in content
+    assert test_artwork.title in content
+
 
 @pytest.mark.asyncio
 async def test_get_my_likes_stats_empty(
@@ -331,6 +353,77 @@ async def test_check_if_liked(
     assert response.json()["liked"] is True
 
 
+@pytest.mark.asyncio
+async def test_check_liked_batch(
+    async_client: AsyncClient,
+    auth_headers: dict,
+    test_artwork: Artwork,
+    db_session: AsyncSession,
+    test_category: Category
+):
+    """Test checking the liked state of several artworks in one request."""
+    artwork2 = Artwork(
+        title="Batch Artwork",
+        artist="Batch Artist",
+        style=test_category.name,
+        image_path="test/batch.jpg",
+        image_url="/static/artworks/test/batch.jpg",
+        is_active=True
+    )
+    db_session.add(artwork2)
+    await db_session.commit()
+    await db_session.refresh(artwork2)
+    
+    await async_client.post(f"/api/v1/likes/{artwork2.id}", headers=auth_headers)
+    
+    response = await async_client.post(
+        "/api/v1/likes/check",
+        json={"artwork_ids": [str(test_artwork.id), str(artwork2.id), str(uuid4())]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json() == {"liked": [str(artwork2.id)]}
+    
+    # Empty and oversized batches
+    response = await async_client.post("/api/v1/likes/check", json={"artwork_ids": []}, headers=auth_headers)
+    assert response.json() == {"liked": []}
+    response = await async_client.post(
+        "/api/v1/likes/check",
+        json={"artwork_ids": [str(uuid4()) for _ in range(101)]},
+        headers=auth_headers
+    )
+    assert response.status_code == 422
+    
+    response = await async_client.post("/api/v1/likes/check", json={"artwork_ids": []})
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_gallery_embeds_liked_flags(
+    async_client: AsyncClient,
+    auth_headers: dict,
+    test_artwork: Artwork
+):
+    """Test that the gallery renders liked state for a logged-in user."""
+    await async_client.post(f"/api/v1/likes/{test_artwork.id}", headers=auth_headers)
+    token = auth_headers["Authorization"].split(" ", 1)[1]
+    
+    response = await async_client.get(
+        f"/?style={test_artwork.style}",
+        cookies={"access_token": token}
+    )
+    assert response.status_code == 200
+    content = response.content.decode()
+    assert f"likeButton('{test_artwork.id}', true)" in content
+    assert "const LIKE_STATUS_KNOWN = true;" in content
+    
+    # Anonymous visitors get unliked cards and a client-side batch check
+    response = await async_client.get(f"/?style={test_artwork.style}")
+    content = response.content.decode()
+    assert f"likeButton('{test_artwork.id}', false)" in content
+    assert "const LIKE_STATUS_KNOWN = false;" in content
+
+
 @pytest.mark.asyncio
 async def test_likes_require_authentication(async_client: AsyncClient):
     """Test that likes endpoints require authentication."""
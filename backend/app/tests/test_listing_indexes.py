@@ -0,0 +1,50 @@
+"""
+Tests for the managed artwork listing indexes.
+"""
+import pytest
+from sqlalchemy import inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+from app.db.init_db import create_listing_indexes
+from app.models.artwork import Artwork, LISTING_INDEXES
+
+
+def _index_names(connection):
+    return {index["name"] for index in inspect(connection).get_indexes("artworks")}
+
+
+@pytest.mark.asyncio
+async def test_create_listing_indexes_adds_missing_indexes(db_session: AsyncSession):
+    """Test that indexes dropped from an existing table are recreated."""
+    conn = await db_session.connection()
+    await conn.execute(text("DROP INDEX ix_artworks_active_style_popularity"))
+    names = await conn.run_sync(_index_names)
+    assert "ix_artworks_active_style_popularity" not in names
+    
+    await conn.run_sync(create_listing_indexes)
+    # Running again is a no-op
+    await conn.run_sync(create_listing_indexes)
+    
+    names = await conn.run_sync(_index_names)
+    await db_session.commit()
+    assert {index.name for index in LISTING_INDEXES} <= names
+
+
+@pytest.mark.asyncio
+async def test_style_listing_uses_partial_index(db_session: AsyncSession):
+    """Test that a filtered, sorted listing is served from the composite index."""
+    query = (
+        select(Artwork)
+        .where(Artwork.is_active == True)
+        .where(Artwork.style == "Baroque")
+        .order_by(col(Artwork.popularity_score).desc(), col(Artwork.id).desc())
+        .limit(20)
+    )
+    conn = await db_session.connection()
+    compiled = query.compile(conn.sync_connection, compile_kwargs={"literal_binds": True})
+    
+    result = await conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+    plan = " ".join(str(row[-1]) for row in result)
+    
+    assert "ix_artworks_active_style_popularity" in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,59 @@
+"""
+Tests for the versioned schema migrations and the boot-time check.
+"""
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.db.migrations import (
+    MIGRATIONS,
+    SCHEMA_VERSION,
+    SchemaOutOfDate,
+    current_version,
+    ensure_schema,
+    migrate,
+)
+
+
+@pytest.fixture
+async def blank_engine(tmp_path):
+    """Engine on an empty SQLite database."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'schema.db'}")
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_migrate_applies_each_migration_once(blank_engine):
+    """The first run creates the schema and records every version; later runs do nothing."""
+    assert await current_version(blank_engine) == 0
+
+    applied = await migrate(blank_engine)
+
+    assert [migration.version for migration in applied] == [m.version for m in MIGRATIONS]
+    assert await current_version(blank_engine) == SCHEMA_VERSION
+    async with blank_engine.connect() as conn:
+        tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+    assert {"artworks", "users", "likes", "comments", "schema_migrations"} <= set(tables)
+
+    assert await migrate(blank_engine) == []
+
+
+@pytest.mark.asyncio
+async def test_boot_check_refuses_unmigrated_database(blank_engine):
+    """The check mode fails fast on a database that is behind, and passes once migrated."""
+    with pytest.raises(SchemaOutOfDate):
+        await ensure_schema(blank_engine, "check")
+
+    await ensure_schema(blank_engine, "skip")
+    assert await current_version(blank_engine) == 0
+
+    await ensure_schema(blank_engine, "migrate")
+    await ensure_schema(blank_engine, "check")
+    assert await current_version(blank_engine) == SCHEMA_VERSION
+
+
+@pytest.mark.asyncio
+async def test_boot_check_rejects_unknown_mode(blank_engine):
+    """A mistyped SCHEMA_BOOT_MODE is an error, not a silent skip."""
+    with pytest.raises(ValueError):
+        await ensure_schema(blank_engine, "auto")
@@ -0,0 +1,86 @@
+"""
+Tests for the async password hashing service.
+"""
+import asyncio
+import pytest
+from app.core.hashing import PasswordHasher, PasswordHasherBusy
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_roundtrip():
+    """Test hashing and verifying through the pool."""
+    hasher = PasswordHasher(max_workers=2, max_pending=4)
+    try:
+        hashed = await hasher.hash("secret123")
+        assert hashed != "secret123"
+        assert await hasher.verify("secret123", hashed) is True
+        assert await hasher.verify("wrong", hashed) is False
+        
+        stats = hasher.stats()
+        assert stats["completed"] == 3
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 0
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_hashing_does_not_block_event_loop():
+    """Test that the event loop keeps running while bcrypt works."""
+    hasher = PasswordHasher(max_workers=1, max_pending=4)
+    ticks = 0
+    
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+    
+    task = asyncio.create_task(ticker())
+    try:
+        await hasher.hash("secret123")
+    finally:
+        task.cancel()
+        hasher.shutdown()
+    assert ticks > 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected():
+    """Test that calls beyond workers + max_pending are rejected and counted."""
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+    try:
+        results = await asyncio.gather(
+            *(hasher.hash("secret123") for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert sum(isinstance(r, PasswordHasherBusy) for r in results) == 1
+        assert hasher.stats()["rejected"] == 1
+        assert hasher.stats()["peak_queue_depth"] >= 1
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_call_releases_its_slot():
+    """Cancelling a caller whose job has not started frees its queue slot."""
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+    try:
+        running = asyncio.create_task(hasher.hash("secret123"))
+        queued = asyncio.create_task(hasher.hash("secret123"))
+        await asyncio.sleep(0.01)
+        assert hasher.stats()["queue_depth"] == 1
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        await running
+
+        stats = hasher.stats()
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 0
+        # Both slots are usable again
+        await asyncio.gather(hasher.hash("secret123"), hasher.hash("secret123"))
+        assert hasher.stats()["rejected"] == 0
+    finally:
+        hasher.shutdown()
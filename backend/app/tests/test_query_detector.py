@@ -0,0 +1,104 @@
+"""
+Tests for the repeated/slow query detector and the query budget plugin.
+"""
+import logging
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from app.core.query_detector import QueryDetector, normalize_sql, query_detector
+from app.tests.conftest import test_engine
+from app.tests.query_budget import QUERY_BUDGETS, _budget_lookup
+
+
+def test_normalize_sql_groups_by_shape():
+    """Statements differing only in parameters normalize to the same text."""
+    asyncpg = normalize_sql("SELECT likes.id FROM likes\n  WHERE likes.user_id = $1::UUID AND likes.artwork_id IN ($2, $3, $4)")
+    sqlite = normalize_sql("SELECT likes.id FROM likes WHERE likes.user_id = ? AND likes.artwork_id IN (?, ?)")
+
+    assert asyncpg == "SELECT likes.id FROM likes WHERE likes.user_id = ?::UUID AND likes.artwork_id IN (?, ...)"
+    assert sqlite == "SELECT likes.id FROM likes WHERE likes.user_id = ? AND likes.artwork_id IN (?, ...)"
+    assert normalize_sql("SELECT * FROM artworks WHERE title = 'It''s' LIMIT 20") == (
+        "SELECT * FROM artworks WHERE title = ? LIMIT ?"
+    )
+
+
+async def _select_one_by_one(count: int):
+    """Issue the same query once per item, N+1 style."""
+    async with test_engine.connect() as conn:
+        for value in range(count):
+            await conn.execute(text("SELECT :value"), {"value": value})
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_is_flagged_with_its_origin(caplog):
+    """A statement run more than the threshold is logged with the code that issued it."""
+    detector = QueryDetector(enabled=True, repeat_threshold=3, slow_ms=10_000)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.query_detector"):
+        with detector.track("seed run") as collector:
+            await _select_one_by_one(4)
+
+    assert collector.statement_count == 4
+    [finding] = collector.findings(detector.repeat_threshold, detector.slow_ms)
+    assert finding.kind == "repeated"
+    assert finding.sql == "SELECT ?"
+    assert finding.count == 4
+    assert finding.stack[0].startswith("app/tests/test_query_detector.py:")
+    assert finding.stack[0].endswith("in _select_one_by_one")
+    assert "[seed run] repeated query executed 4 times" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_slow_query_is_flagged():
+    """A single execution over the time threshold is a finding even when run once."""
+    detector = QueryDetector(enabled=True, repeat_threshold=10, slow_ms=0)
+
+    with detector.track() as collector:
+        await _select_one_by_one(1)
+
+    assert [finding.kind for finding in collector.findings(detector.repeat_threshold, detector.slow_ms)] == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_inactive_detector_collects_nothing():
+    """Without QUERY_DETECTOR_ENABLED or observers, tracking is a no-op."""
+    detector = QueryDetector(enabled=False, repeat_threshold=3, slow_ms=100)
+
+    with detector.track() as collector:
+        await _select_one_by_one(2)
+
+    assert collector.statement_count == 0
+
+
+@pytest.mark.asyncio
+async def test_requests_are_tracked_per_route_template(async_client: AsyncClient):
+    """The middleware hands each request's statements to observers, labelled by route."""
+    collectors = []
+    query_detector.observers.append(collectors.append)
+    try:
+        await async_client.get("/api/v1/comments/00000000-0000-0000-0000-000000000001")
+    finally:
+        query_detector.observers.remove(collectors.append)
+
+    [collector] = collectors
+    assert collector.label == "GET /api/v1/comments/{artwork_id}"
+    assert 1 <= collector.statement_count <= QUERY_BUDGETS[collector.label]
+
+
+@pytest.mark.query_budget(4)
+@pytest.mark.query_budget(1, endpoint="GET /api/v1/artworks")
+def test_query_budget_markers(request):
+    """Endpoint markers beat blanket markers, which beat the default budgets."""
+    budget_for = _budget_lookup(request.node)
+
+    assert budget_for("GET /api/v1/artworks") == 1
+    assert budget_for("GET /") == 4
+    assert _budget_lookup(_Unmarked())("GET /") == QUERY_BUDGETS["GET /"]
+    assert _budget_lookup(_Unmarked())("GET /unbudgeted") is None
+
+
+class _Unmarked:
+    """Stand-in for a test item without query_budget markers."""
+
+    def iter_markers(self, name):
+        return iter(())
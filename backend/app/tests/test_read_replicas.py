@@ -0,0 +1,148 @@
+"""
+Tests for read-replica routing, using a second SQLite database as the replica.
+"""
+import pytest
+from uuid import uuid4
+from httpx import AsyncClient
+from sqlmodel import SQLModel
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.main import app
+from app.api import deps
+from app.api.deps import get_read_db
+from app.core.security import create_access_token, get_password_hash
+from app.db.routing import STICKY_COOKIE, ReadRouter
+from app.models.artwork import Artwork
+from app.models.category import Category
+from app.models.user import User
+from app.tests.conftest import test_async_session
+
+
+@pytest.fixture
+async def replica_router(tmp_path, monkeypatch):
+    """Route get_read_db through a router with one stand-in replica database."""
+    replica_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    async with replica_engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    replica_session = sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False)
+    router = ReadRouter(test_async_session, [replica_session], sticky_seconds=30)
+    monkeypatch.setattr(deps, "read_router", router)
+    override = app.dependency_overrides.pop(get_read_db)
+    yield router, replica_session
+    app.dependency_overrides[get_read_db] = override
+    await replica_engine.dispose()
+
+
+@pytest.fixture
+async def replicated_artwork(db_session: AsyncSession, replica_router) -> Artwork:
+    """An artwork present on both databases (the replica has no comments yet)."""
+    _, replica_session = replica_router
+    unique_id = uuid4().hex[:8]
+    values = {
+        "id": uuid4(),
+        "title": "Replicated",
+        "artist": "Replica Artist",
+        "style": f"ReplicaStyle{unique_id}",
+        "image_path": f"ml/input/wikiart/Replica/replicated_{unique_id}.jpg",
+        "image_url": f"/static/artworks/Replica/replicated_{unique_id}.jpg",
+    }
+    async with replica_session() as replica:
+        replica.add(Category(name=values["style"], slug=f"replica-style-{unique_id}"))
+        replica.add(Artwork(**values))
+        await replica.commit()
+    db_session.add(Category(name=values["style"], slug=f"replica-style-{unique_id}"))
+    artwork = Artwork(**values)
+    db_session.add(artwork)
+    await db_session.commit()
+    return artwork
+
+
+@pytest.fixture
+async def replica_user_token(db_session: AsyncSession) -> str:
+    """Access token of a user stored on the primary."""
+    unique_id = uuid4().hex[:8]
+    user = User(
+        email=f"replica{unique_id}@example.com",
+        username=f"replica{unique_id}",
+        hashed_password=get_password_hash("password123"),
+        role="user",
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return create_access_token(data={"sub": str(user.id)})
+
+
+@pytest.mark.asyncio
+async def test_reads_use_replica(replica_router, replicated_artwork: Artwork):
+    """Read-only routes are served from the replica."""
+    router, replica_session = replica_router
+    async with replica_session() as replica:
+        replica_copy = await replica.get(Artwork, replicated_artwork.id)
+        replica_copy.title = "Replica copy"
+        await replica.commit()
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get(f"/api/v1/artworks?style={replicated_artwork.style}")
+
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()] == ["Replica copy"]
+    assert router.stats()["replica_reads"] == 1
+
+
+@pytest.mark.asyncio
+async def test_writer_reads_own_write_from_primary(
+    replica_router, replicated_artwork: Artwork, replica_user_token: str
+):
+    """After a write, that client reads from the primary; others still see the replica."""
+    headers = {"Authorization": f"Bearer {replica_user_token}"}
+    url = f"/api/v1/comments/{replicated_artwork.id}"
+
+    async with AsyncClient(app=app, base_url="http://test") as writer:
+        response = await writer.get(url, headers=headers)
+        assert response.json() == []  # replica, before any write
+
+        response = await writer.post(url, json={"content": "Fresh"}, headers=headers)
+        assert response.status_code == 201
+        assert STICKY_COOKIE in response.cookies
+
+        # Browser-style client: the sticky cookie pins it to the primary
+        response = await writer.get(url)
+        assert [comment["content"] for comment in response.json()] == ["Fresh"]
+
+    async with AsyncClient(app=app, base_url="http://test") as api_client:
+        # Same bearer token without the cookie: remembered in-process
+        response = await api_client.get(url, headers=headers)
+        assert [comment["content"] for comment in response.json()] == ["Fresh"]
+
+    async with AsyncClient(app=app, base_url="http://test") as other:
+        response = await other.get(url)
+        assert response.json() == []  # replica has not caught up
+
+
+@pytest.mark.asyncio
+async def test_read_only_post_does_not_pin_to_primary(
+    replica_router, replicated_artwork: Artwork, replica_user_token: str
+):
+    """The batch like check is a POST that only reads; it leaves the client on the replicas."""
+    router, _ = replica_router
+    headers = {"Authorization": f"Bearer {replica_user_token}"}
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/likes/check", json={"artwork_ids": [str(replicated_artwork.id)]}, headers=headers
+        )
+        assert response.status_code == 200
+        assert STICKY_COOKIE not in response.cookies
+
+        response = await client.get(f"/api/v1/comments/{replicated_artwork.id}", headers=headers)
+        assert response.status_code == 200
+
+    assert router.stats()["sticky_clients"] == 0
+    assert router.stats()["replica_reads"] == 1
+
+
+def test_router_without_replicas_uses_primary():
+    """With no replicas configured every read goes to the primary."""
+    router = ReadRouter(test_async_session, [], sticky_seconds=5)
+    assert router.session_factory(None) is test_async_session
+    assert router.stats()["primary_reads"] == 1
@@ -0,0 +1,86 @@
+"""
+Tests for the cached categories / style reference data.
+"""
+import pytest
+from uuid import uuid4
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.artwork import Artwork
+from app.models.category import Category
+from app.services import catalog_version
+from app.services.counters import adjust_artwork_counter
+from app.services.reference_data import get_active_styles, reference_cache
+
+
+@pytest.mark.asyncio
+async def test_categories_served_with_etag(async_client: AsyncClient, db_session: AsyncSession):
+    """Categories carry an ETag and Cache-Control; a matching If-None-Match gets 304."""
+    response = await async_client.get("/api/v1/categories")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"].startswith("public, max-age=")
+
+    response = await async_client.get("/api/v1/categories", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_category_creation_invalidates_cache(async_client: AsyncClient, db_session: AsyncSession):
+    """A committed category change yields a fresh list and a new ETag."""
+    first = await async_client.get("/api/v1/categories")
+    unique_id = uuid4().hex[:8]
+    db_session.add(Category(name=f"RefStyle{unique_id}", slug=f"ref-style-{unique_id}"))
+    await db_session.commit()
+
+    second = await async_client.get("/api/v1/categories", headers={"If-None-Match": first.headers["etag"]})
+
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+    assert f"RefStyle{unique_id}" in [c["name"] for c in second.json()]
+
+
+@pytest.mark.asyncio
+async def test_active_styles_follow_artwork_toggle(db_session: AsyncSession):
+    """Deactivating the only artwork of a style drops it from the style list."""
+    style = f"ToggleStyle{uuid4().hex[:8]}"
+    db_session.add(Category(name=style, slug=style.lower()))
+    artwork = Artwork(
+        title="Toggle",
+        artist="Toggle Artist",
+        style=style,
+        image_path=f"test/{style}.jpg",
+        image_url=f"/static/artworks/test/{style}.jpg",
+    )
+    db_session.add(artwork)
+    await db_session.commit()
+    assert style in (await get_active_styles(db_session)).value
+
+    # Served from cache while nothing changes
+    hits = reference_cache.hits
+    await get_active_styles(db_session)
+    assert reference_cache.hits == hits + 1
+
+    artwork.is_active = False
+    await db_session.commit()
+    assert style not in (await get_active_styles(db_session)).value
+
+
+@pytest.mark.asyncio
+async def test_counter_updates_do_not_bump_catalog_version(db_session: AsyncSession):
+    """Like/comment counter updates leave the catalog version (and caches) alone."""
+    artwork = Artwork(
+        title="Counted",
+        artist="Counted Artist",
+        style="Impressionism",
+        image_path=f"test/counted_{uuid4().hex[:8]}.jpg",
+        image_url="/static/artworks/test/counted.jpg",
+    )
+    db_session.add(artwork)
+    await db_session.commit()
+    version = catalog_version.current()
+
+    await adjust_artwork_counter(db_session, artwork.id, "like_count", 1)
+    await db_session.commit()
+
+    assert catalog_version.current() == version
@@ -0,0 +1,141 @@
+"""
+Tests for per-request instrumentation, Server-Timing and the /metrics endpoint.
+"""
+import re
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.api.routes import metrics as metrics_route
+from app.core.metrics import MetricsRegistry, metrics_registry
+from app.db.routing import ReadRouter
+from app.tests.conftest import test_async_session
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Start each test with empty request metrics."""
+    metrics_registry.reset()
+    yield
+    metrics_registry.reset()
+
+
+def _timing(header: str) -> dict:
+    """Parse a Server-Timing header into name -> (duration ms, description)."""
+    parsed = {}
+    for metric in header.split(","):
+        name, *params = [part.strip() for part in metric.split(";")]
+        values = dict(param.split("=", 1) for param in params)
+        parsed[name] = (float(values["dur"]), values.get("desc", "").strip('"'))
+    return parsed
+
+
+@pytest.mark.asyncio
+async def test_api_request_reports_sql_statements(async_client: AsyncClient):
+    """JSON routes report their SQL statements in Server-Timing and /metrics."""
+    response = await async_client.get("/api/v1/artworks?limit=5")
+    assert response.status_code == 200
+
+    timing = _timing(response.headers["server-timing"])
+    assert set(timing) == {"app", "db", "tpl"}
+    queries = int(timing["db"][1].split()[0])
+    assert queries >= 1
+
+    body = (await async_client.get("/metrics")).text
+    labels = 'method="GET",route="/api/v1/artworks"'
+    assert f'http_requests_total{{{labels},status="200"}} 1' in body
+    assert f"http_request_db_statements_count{{{labels}}} 1" in body
+    assert f"http_request_db_statements_sum{{{labels}}} {queries}.000000" in body
+    size = re.search(rf"http_response_size_bytes_total{{{re.escape(labels)}}} (\d+)", body)
+    assert int(size.group(1)) == len(response.content)
+    assert "db_pool_checkouts" in body
+
+
+@pytest.mark.asyncio
+async def test_service_stats_are_exported(async_client: AsyncClient):
+    """The hashing pool, user cache and view counter stats are exported with their types."""
+    body = (await async_client.get("/metrics")).text
+
+    assert "# TYPE password_hasher_completed counter" in body
+    assert "# TYPE password_hasher_queue_depth gauge" in body
+    assert "# TYPE user_cache_hits counter" in body
+    assert "# TYPE user_cache_size gauge" in body
+    assert "# TYPE view_counter_recorded counter" in body
+    assert "# TYPE view_counter_pending gauge" in body
+    assert "db_replica_pool" not in body
+
+
+@pytest.mark.asyncio
+async def test_replica_pools_and_read_routing_are_exported(async_client: AsyncClient, tmp_path, monkeypatch):
+    """With replicas configured, each replica pool is one labelled series next to the routing counters."""
+    replicas = [
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path / f'replica{index}.db'}")
+        for index in range(2)
+    ]
+    monkeypatch.setattr(metrics_route, "replica_engines", replicas)
+    monkeypatch.setattr(metrics_route, "read_router", ReadRouter(test_async_session, [test_async_session], sticky_seconds=30))
+    try:
+        body = (await async_client.get("/metrics")).text
+    finally:
+        for replica in replicas:
+            await replica.dispose()
+
+    assert body.count("# TYPE db_replica_pool_in_use gauge") == 1
+    assert 'db_replica_pool_in_use{replica="0"}' in body
+    assert 'db_replica_pool_in_use{replica="1"}' in body
+    assert "# TYPE db_read_routing_replica_reads counter" in body
+    assert "db_read_routing_replicas 1" in body
+
+
+@pytest.mark.asyncio
+async def test_template_render_time_is_recorded(async_client: AsyncClient):
+    """Jinja routes report template render time under their route template."""
+    response = await async_client.get("/login")
+    assert response.status_code == 200
+
+    timing = _timing(response.headers["server-timing"])
+    assert timing["tpl"][0] > 0
+    assert timing["db"][1] == "0 queries"
+
+    body = metrics_registry.render()
+    rendered = re.search(r'http_request_render_seconds_total\{method="GET",route="/login"\} ([\d.]+)', body)
+    assert float(rendered.group(1)) > 0
+
+
+@pytest.mark.asyncio
+async def test_routes_are_labelled_by_template(async_client: AsyncClient):
+    """Path parameters do not create one series per value; unknown paths share one label."""
+    await async_client.get("/api/v1/comments/00000000-0000-0000-0000-000000000001")
+    await async_client.get("/api/v1/comments/00000000-0000-0000-0000-000000000002")
+    await async_client.get("/no-such-page")
+
+    body = metrics_registry.render()
+    assert 'http_requests_total{method="GET",route="/api/v1/comments/{artwork_id}",status="200"} 2' in body
+    assert 'route="unmatched",status="404"} 1' in body
+    assert "00000000-0000-0000-0000-000000000001" not in body
+
+
+def test_histogram_buckets_are_cumulative():
+    """Rendered buckets count every observation at or below their bound."""
+    registry = MetricsRegistry()
+    for statements in (0, 2, 2, 40):
+        registry.observe_request("GET", "/", 200, 0.01, statements, 0.0, 0.0, 10)
+
+    body = registry.render([("db_pool_in_use", "gauge", 3)])
+    labels = 'method="GET",route="/"'
+    assert f'http_request_db_statements_bucket{{{labels},le="0"}} 1' in body
+    assert f'http_request_db_statements_bucket{{{labels},le="2"}} 3' in body
+    assert f'http_request_db_statements_bucket{{{labels},le="20"}} 3' in body
+    assert f'http_request_db_statements_bucket{{{labels},le="+Inf"}} 4' in body
+    assert f"http_response_size_bytes_total{{{labels}}} 40" in body
+    assert "# TYPE db_pool_in_use gauge\ndb_pool_in_use 3" in body
+
+
+def test_labelled_extra_samples_share_one_type_line():
+    """Extra samples of one family are rendered together under a single TYPE line."""
+    body = MetricsRegistry().render([
+        ('pool_in_use{replica="0"}', "gauge", 1),
+        ("pool_checkouts", "counter", 5),
+        ('pool_in_use{replica="1"}', "gauge", 2),
+    ])
+    assert '# TYPE pool_in_use gauge\npool_in_use{replica="0"} 1\npool_in_use{replica="1"} 2' in body
+    assert "# TYPE pool_checkouts counter\npool_checkouts 5" in body
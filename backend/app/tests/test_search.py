@@ -0,0 +1,117 @@
+"""
+Tests for artwork search.
+"""
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.category import Category
+from app.models.artwork import Artwork
+from app.services import catalog_version
+from app.services.search import TrigramIndex
+
+
+def _row(title, artist, style="S", is_active=True):
+    return (uuid4(), title, artist, style, is_active, datetime.utcnow())
+
+
+def test_trigram_index_matches_substrings():
+    """Test that the fallback index matches case-insensitive substrings."""
+    rows = [
+        _row("Water Lilies", "Claude Monet"),
+        _row("Starry Night", "Vincent van Gogh"),
+        _row("Monet's Garden", "Unknown"),
+    ]
+    index = TrigramIndex()
+    index.build(rows, version=1)
+    
+    ids = [artwork_id for artwork_id, _ in index.search("MONET")]
+    assert set(ids) == {rows[0][0], rows[2][0]}
+    assert [artwork_id for artwork_id, _ in index.search("ry")] == [rows[1][0]]
+    assert index.search("rembrandt") == []
+    assert index.search("   ") == []
+
+
+def test_trigram_index_ranking_and_filters():
+    """Test ranking tiers and the style/active filters."""
+    exact = _row("Sunflowers", "Vincent van Gogh", style="A")
+    prefix = _row("Sunflowers in a Vase", "Someone", style="A")
+    inner = _row("Fields of sunflowers", "Someone", style="B")
+    hidden = _row("Sunflowers", "Someone", style="A", is_active=False)
+    index = TrigramIndex()
+    index.build([inner, prefix, exact, hidden], version=1)
+    
+    ranked = index.search("sunflowers")
+    assert [artwork_id for artwork_id, _ in ranked] == [exact[0], prefix[0], inner[0]]
+    assert ranked[0][1] > ranked[1][1] > ranked[2][1]
+    
+    assert [a for a, _ in index.search("sunflowers", style="B")] == [inner[0]]
+    assert hidden[0] in [a for a, _ in index.search("sunflowers", include_inactive=True)]
+
+
+@pytest.mark.asyncio
+async def test_catalog_version_bumps_on_commit(db_session: AsyncSession):
+    """Test that committed catalog writes advance the catalog version."""
+    before = catalog_version.current()
+    db_session.add(Category(name=f"Version{uuid4().hex[:8]}", slug=f"version-{uuid4().hex[:8]}"))
+    await db_session.commit()
+    assert catalog_version.current() > before
+
+
+@pytest.mark.asyncio
+async def test_catalog_version_ignores_rolled_back_writes(db_session: AsyncSession):
+    """Test that catalog writes that are rolled back leave the version alone."""
+    before = catalog_version.current()
+    db_session.add(Category(name=f"Version{uuid4().hex[:8]}", slug=f"version-{uuid4().hex[:8]}"))
+    await db_session.flush()
+    await db_session.rollback()
+    assert catalog_version.current() == before
+
+
+@pytest.mark.asyncio
+async def test_search_endpoint_returns_scored_results(async_client: AsyncClient, db_session: AsyncSession):
+    """Test the search endpoint ranks matches and reports scores."""
+    unique = uuid4().hex[:8]
+    category = Category(name=f"SearchApi{unique}", slug=f"search-api-{unique}")
+    db_session.add(category)
+    await db_session.commit()
+    
+    db_session.add_all([
+        Artwork(
+            title=f"Nocturne {unique}",
+            artist="James Whistler",
+            style=category.name,
+            image_path=f"ml/input/wikiart/{category.name}/nocturne.jpg",
+            image_url="/static/nocturne.jpg",
+        ),
+        Artwork(
+            title=f"Study for a Nocturne {unique}",
+            artist="James Whistler",
+            style=category.name,
+            image_path=f"ml/input/wikiart/{category.name}/study.jpg",
+            image_url="/static/study.jpg",
+        ),
+        Artwork(
+            title=f"Nocturne {unique} (hidden)",
+            artist="James Whistler",
+            style=category.name,
+            image_path=f"ml/input/wikiart/{category.name}/hidden.jpg",
+            image_url="/static/hidden.jpg",
+            is_active=False,
+        ),
+    ])
+    await db_session.commit()
+    
+    response = await async_client.get(f"/api/v1/artworks/search?q=nocturne%20{unique}")
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["title"] for r in results] == [f"Nocturne {unique}", f"Study for a Nocturne {unique}"]
+    assert results[0]["score"] > results[1]["score"]
+    assert results[0]["image_url"].endswith(f"{category.name}/nocturne.jpg")
+    
+    response = await async_client.get(f"/api/v1/artworks/search?q=nocturne%20{unique}&skip=1&limit=1")
+    assert [r["title"] for r in response.json()] == [f"Study for a Nocturne {unique}"]
+    
+    response = await async_client.get("/api/v1/artworks/search?q=")
+    assert response.status_code == 422
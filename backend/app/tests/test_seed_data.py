@@ -0,0 +1,161 @@
+"""
+Tests for the bulk WikiArt artwork seeder.
+"""
+import asyncio
+import time
+import pytest
+from uuid import uuid4
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel, select
+from app.models.artwork import Artwork, IMAGE_PATH_UNIQUE_INDEX
+from app.models.category import Category
+from app.scripts import seed_data
+from app.tests.conftest import test_async_session
+
+
+@pytest.fixture
+def wikiart_dir(tmp_path, monkeypatch):
+    """Create a small WikiArt-style tree and point the seeder at the test database."""
+    monkeypatch.setattr(seed_data, "async_session", test_async_session)
+    style = f"SeedStyle{uuid4().hex[:8]}"
+    style_dir = tmp_path / style
+    style_dir.mkdir()
+    for index in range(5):
+        (style_dir / f"seed-artist_painting-{index}.jpg").write_bytes(b"")
+    (style_dir / "notes.txt").write_text("not an image")
+    return tmp_path, style
+
+
+async def _style_artworks(db_session: AsyncSession, style: str):
+    """Return the seeded artworks of a style."""
+    result = await db_session.execute(select(Artwork).where(Artwork.style == style))
+    return result.scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_seed_artworks_inserts_kept_images(db_session: AsyncSession, wikiart_dir):
+    """New images are inserted in bulk and the run reports throughput."""
+    root, style = wikiart_dir
+
+    stats = await seed_data.seed_artworks(str(root), top_percentage=1.0)
+
+    assert stats["scanned"] == 5
+    assert stats["added"] == 5
+    assert stats["updated"] == 0
+    assert stats["rows_per_second"] > 0
+    artworks = await _style_artworks(db_session, style)
+    assert len(artworks) == 5
+    artwork = next(a for a in artworks if a.image_path.endswith("painting-0.jpg"))
+    assert artwork.artist == "Seed Artist"
+    assert artwork.title == "Painting 0"
+    assert artwork.image_url == f"/static/artworks/{style}/seed-artist_painting-0.jpg"
+    assert artwork.views == 0 and artwork.like_count == 0 and artwork.is_active
+
+    category = (await db_session.execute(select(Category).where(Category.name == style))).scalar_one()
+    assert category.slug == style.lower()
+
+
+@pytest.mark.asyncio
+async def test_seed_artworks_is_idempotent_and_updates_scores(db_session: AsyncSession, wikiart_dir):
+    """Re-running only writes rows whose score or URL changed."""
+    root, style = wikiart_dir
+    await seed_data.seed_artworks(str(root), top_percentage=1.0)
+
+    stats = await seed_data.seed_artworks(str(root), top_percentage=1.0)
+    assert stats["added"] == 0
+    assert stats["updated"] == 0
+
+    scores = {f"{style}/seed-artist_painting-1.jpg": 0.75}
+    stats = await seed_data.seed_artworks(str(root), popularity_scores=scores, top_percentage=1.0)
+    assert stats["added"] == 0
+    assert stats["updated"] == 1
+
+    artworks = await _style_artworks(db_session, style)
+    assert len(artworks) == 5
+    scored = {a.image_path.rsplit("/", 1)[-1]: a.popularity_score for a in artworks}
+    assert scored["seed-artist_painting-1.jpg"] == 0.75
+    assert scored["seed-artist_painting-0.jpg"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_seed_artworks_scans_styles_in_parallel(db_session: AsyncSession, tmp_path, monkeypatch):
+    """Several style folders are scanned by worker threads and all get written."""
+    monkeypatch.setattr(seed_data, "async_session", test_async_session)
+    styles = [f"ParallelStyle{uuid4().hex[:8]}" for _ in range(5)]
+    for style in styles:
+        style_dir = tmp_path / style
+        style_dir.mkdir()
+        for index in range(4):
+            (style_dir / f"parallel-artist_work-{index}.png").write_bytes(b"")
+
+    scores = {f"{styles[0]}/parallel-artist_work-3.png": 0.9}
+    stats = await seed_data.seed_artworks(
+        str(tmp_path), popularity_scores=scores, top_percentage=0.25, workers=2
+    )
+
+    assert stats["scanned"] == 20
+    assert stats["added"] == 5
+    kept = await _style_artworks(db_session, styles[0])
+    assert [a.image_path.rsplit("/", 1)[-1] for a in kept] == ["parallel-artist_work-3.png"]
+
+
+def test_scan_style_sample_is_deterministic(tmp_path):
+    """Without scores, the kept sample depends only on the folder contents."""
+    style_dir = tmp_path / "Sampled"
+    style_dir.mkdir()
+    for index in range(20):
+        (style_dir / f"a_b-{index}.jpg").write_bytes(b"")
+
+    first = seed_data.scan_style(str(tmp_path), "Sampled", None, 0.25)
+    second = seed_data.scan_style(str(tmp_path), "Sampled", None, 0.25)
+
+    assert len(first.files) == 20
+    assert len(first.keep) == 5
+    assert first.keep == second.keep
+
+
+@pytest.mark.asyncio
+async def test_failed_scan_stops_the_other_workers(monkeypatch):
+    """When one folder fails, no further folders are scanned and nothing follows the sentinel."""
+    scanned = []
+
+    def fake_scan(wikiart_dir, style, popularity_scores, top_percentage):
+        if style == "A":
+            raise OSError("unreadable folder")
+        time.sleep(0.05)
+        scanned.append(style)
+        return seed_data.StyleScan(style=style, files=[], keep=set())
+
+    monkeypatch.setattr(seed_data, "scan_style", fake_scan)
+    queue = asyncio.Queue()
+
+    with pytest.raises(OSError):
+        await seed_data.scan_styles("unused", ["A", "B", "C", "D", "E"], None, 0.1, 2, queue)
+    items = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert items[-1] is None
+
+    await asyncio.sleep(0.3)
+    assert queue.empty()
+    assert len(scanned) <= 1  # only the scan already running in a thread
+
+
+@pytest.mark.asyncio
+async def test_has_image_path_index(tmp_path):
+    """The seeder only relies on ON CONFLICT (image_path) when the unique index exists."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'index.db'}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        sessions = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        async with sessions() as session:
+            assert await seed_data.has_image_path_index(session) is False
+
+        async with engine.begin() as conn:
+            await conn.execute(text(f"CREATE UNIQUE INDEX {IMAGE_PATH_UNIQUE_INDEX.name} ON artworks (image_path)"))
+        async with sessions() as session:
+            assert await seed_data.has_image_path_index(session) is True
+    finally:
+        await engine.dispose()
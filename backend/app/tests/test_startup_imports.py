@@ -0,0 +1,24 @@
+"""
+Tests that importing the application does not load heavy optional modules.
+"""
+import json
+import subprocess
+import sys
+from app.scripts.profile_startup import BACKEND_DIR, HEAVY_MODULES
+
+
+def test_app_import_does_not_load_heavy_modules():
+    """A fresh worker importing app.main loads neither PyTorch nor httpx."""
+    # Fresh interpreter: other tests may already have imported these modules
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys; from app.main import app; "
+            f"print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))",
+        ],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+    assert "torch" in HEAVY_MODULES
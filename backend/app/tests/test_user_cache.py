@@ -0,0 +1,132 @@
+"""
+Tests for the authenticated-user cache.
+"""
+import time
+import pytest
+from uuid import uuid4
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.user import User
+from app.core.security import get_password_hash
+from app.core.user_cache import UserCache, UserPrincipal, user_cache
+
+
+def _principal(role: str = "user") -> UserPrincipal:
+    unique_id = uuid4().hex[:8]
+    return UserPrincipal(
+        id=uuid4(),
+        email=f"p{unique_id}@example.com",
+        username=f"p{unique_id}",
+        role=role,
+        is_active=True,
+    )
+
+
+@pytest.fixture
+async def cached_user(db_session: AsyncSession) -> User:
+    """Create a regular user."""
+    unique_id = uuid4().hex[:8]
+    user = User(
+        email=f"cached{unique_id}@example.com",
+        username=f"cached{unique_id}",
+        hashed_password=get_password_hash("password123"),
+        role="user",
+        is_active=True
+    )
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    return user
+
+
+def test_cache_hit_miss_and_lru_eviction():
+    """Test hit/miss counting and least-recently-used eviction."""
+    cache = UserCache(max_entries=2, ttl_seconds=60)
+    first, second, third = _principal(), _principal(), _principal()
+    
+    assert cache.get("t1") is None
+    cache.put("t1", first)
+    cache.put("t2", second)
+    assert cache.get("t1") == first  # t1 is now most recently used
+    cache.put("t3", third)
+    
+    assert cache.get("t2") is None
+    assert cache.get("t1") == first
+    assert cache.get("t3") == third
+    stats = cache.stats()
+    assert stats == {"size": 2, "hits": 3, "misses": 2, "evictions": 1, "invalidations": 0}
+
+
+def test_cache_respects_ttl_and_token_expiry():
+    """Test that entries expire with the TTL or the token, whichever is first."""
+    cache = UserCache(max_entries=10, ttl_seconds=0.01)
+    cache.put("short", _principal())
+    time.sleep(0.02)
+    assert cache.get("short") is None
+    
+    cache = UserCache(max_entries=10, ttl_seconds=60)
+    cache.put("expired", _principal(), token_exp=time.time() - 1)
+    assert cache.get("expired") is None
+
+
+def test_invalidate_user_drops_all_tokens():
+    """Test that invalidating a user removes every token cached for it."""
+    cache = UserCache(max_entries=10, ttl_seconds=60)
+    principal, other = _principal(), _principal()
+    cache.put("a", principal)
+    cache.put("b", principal)
+    cache.put("c", other)
+    
+    cache.invalidate_user(principal.id)
+    
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") == other
+
+
+@pytest.mark.asyncio
+async def test_authenticated_requests_hit_cache(async_client: AsyncClient, cached_user: User):
+    """Test that repeated requests with the same token are served from the cache."""
+    response = await async_client.post(
+        "/api/v1/auth/login",
+        data={"username": cached_user.username, "password": "password123"}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    
+    response = await async_client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+    hits = user_cache.stats()["hits"]
+    
+    response = await async_client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["username"] == cached_user.username
+    assert user_cache.stats()["hits"] == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_role_change_invalidates_cached_principal(
+    async_client: AsyncClient,
+    cached_user: User,
+    db_session: AsyncSession
+):
+    """Test that committing a role change is visible to the next request."""
+    response = await async_client.post(
+        "/api/v1/auth/login",
+        data={"username": cached_user.username, "password": "password123"}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    
+    response = await async_client.get("/api/v1/auth/me", headers=headers)
+    assert response.json()["role"] == "user"
+    
+    cached_user.role = "manager"
+    await db_session.commit()
+    
+    response = await async_client.get("/api/v1/auth/me", headers=headers)
+    assert response.json()["role"] == "manager"
+    
+    cached_user.is_active = False
+    await db_session.commit()
+    
+    response = await async_client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 403
@@ -0,0 +1,123 @@
+"""
+Tests for the write-behind artwork view counter.
+"""
+import threading
+import pytest
+from uuid import uuid4
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.artwork import Artwork
+from app.services.view_counter import ViewCounter, view_counter
+from app.tests.conftest import test_async_session
+
+
+async def _create_artwork(db_session: AsyncSession, views: int = 0) -> Artwork:
+    """Create a test artwork."""
+    unique_id = uuid4().hex[:8]
+    artwork = Artwork(
+        title=f"Viewed {unique_id}",
+        artist="View Artist",
+        style="Impressionism",
+        image_path=f"test/viewed_{unique_id}.jpg",
+        image_url=f"/static/artworks/test/viewed_{unique_id}.jpg",
+        views=views,
+    )
+    db_session.add(artwork)
+    await db_session.commit()
+    await db_session.refresh(artwork)
+    return artwork
+
+
+async def _stored_views(artwork_id) -> int:
+    """Read the persisted view count with a fresh session."""
+    async with test_async_session() as session:
+        artwork = await session.get(Artwork, artwork_id)
+        return artwork.views
+
+
+@pytest.mark.asyncio
+async def test_flush_batches_pending_views(db_session: AsyncSession):
+    """Buffered views for several artworks are written in one flush."""
+    first = await _create_artwork(db_session, views=10)
+    second = await _create_artwork(db_session)
+    counter = ViewCounter(shards=4)
+
+    for _ in range(3):
+        counter.record(first.id)
+    counter.record(second.id, 5)
+    assert counter.pending() == 8
+
+    written = await counter.flush(test_async_session)
+
+    assert written == 8
+    assert counter.pending() == 0
+    assert await _stored_views(first.id) == 13
+    assert await _stored_views(second.id) == 5
+    stats = counter.stats()
+    assert stats["recorded"] == 8
+    assert stats["flushed"] == 8
+    assert stats["flushes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_with_nothing_pending_is_noop():
+    """An empty buffer does not touch the database."""
+    counter = ViewCounter(shards=2)
+    assert await counter.flush(test_async_session) == 0
+    assert counter.stats()["flushes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_pending_views(db_session: AsyncSession):
+    """Counts drained by a failed flush are merged back for the next one."""
+    artwork = await _create_artwork(db_session)
+    counter = ViewCounter(shards=2)
+    counter.record(artwork.id, 2)
+
+    def broken_factory():
+        raise RuntimeError("database unavailable")
+
+    with pytest.raises(RuntimeError):
+        await counter.flush(broken_factory)
+    assert counter.pending() == 2
+    assert counter.stats()["failures"] == 1
+
+    await counter.stop(test_async_session)
+    assert await _stored_views(artwork.id) == 2
+
+
+def test_drain_loses_no_concurrent_views():
+    """Views recorded from other threads while draining end up drained or pending."""
+    counter = ViewCounter(shards=2)
+    artwork_ids = [uuid4() for _ in range(4)]
+    per_thread = 5000
+
+    def record_views():
+        for i in range(per_thread):
+            counter.record(artwork_ids[i % len(artwork_ids)])
+
+    threads = [threading.Thread(target=record_views) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    drained = 0
+    while any(thread.is_alive() for thread in threads):
+        drained += sum(counter._drain().values())
+    for thread in threads:
+        thread.join()
+
+    assert drained + counter.pending() == 4 * per_thread
+
+
+@pytest.mark.asyncio
+async def test_get_artwork_records_view(async_client: AsyncClient, db_session: AsyncSession):
+    """Fetching an artwork buffers a view instead of writing it inline."""
+    artwork = await _create_artwork(db_session)
+    await view_counter.flush(test_async_session)
+
+    response = await async_client.get(f"/api/v1/artworks/{artwork.id}")
+    assert response.status_code == 200
+    assert await _stored_views(artwork.id) == 0
+    assert view_counter.pending() >= 1
+
+    await view_counter.flush(test_async_session)
+    assert await _stored_views(artwork.id) == 1
@@ -5,20 +5,22 @@ from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Request, Depends, HTTPException, status, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, update, delete
 from app.api.deps import get_db, get_current_user_optional
 from app.models.user import User
+from app.core.instrumentation import TimedJinja2Templates
+from app.core.user_cache import UserPrincipal
 from app.models.artwork import Artwork
+from app.services.search import search_artworks
 
 router = APIRouter()
 
 # Setup Jinja2 templates
-templates = Jinja2Templates(directory="/app/frontend/www/templates")
+templates = TimedJinja2Templates(directory="/app/frontend/www/templates")
 
 
-def require_admin(current_user: Optional[User]) -> User:
+def require_admin(current_user: Optional[UserPrincipal]) -> UserPrincipal:
     """
     Helper to check if user is authenticated and has admin role.
     Redirects to home if not.
@@ -31,7 +33,7 @@ def require_admin(current_user: Optional[User]) -> User:
     return current_user
 
 
-def require_manager_or_admin(current_user: Optional[User]) -> User:
+def require_manager_or_admin(current_user: Optional[UserPrincipal]) -> UserPrincipal:
     """
     Helper to check if user is authenticated and has manager or admin role.
     Redirects to home if not.
@@ -47,7 +49,7 @@ def require_manager_or_admin(current_user: Optional[User]) -> User:
 @router.get("/admin", response_class=HTMLResponse)
 async def admin_dashboard(
     request: Request,
-    current_user: User = Depends(get_current_user_optional),
+    current_user: UserPrincipal = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -86,7 +88,7 @@ async def admin_artworks(
     page: int = 0,
     per_page: int = 50,
     q: Optional[str] = None,
-    current_user: User = Depends(get_current_user_optional),
+    current_user: UserPrincipal = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -100,21 +102,16 @@ async def admin_artworks(
     except HTTPException:
         return RedirectResponse(url="/", status_code=status.HTTP_303_SEE_OTHER)
     
-    # Build query for artworks
-    query = select(Artwork)
-    
-    # Apply search filter if provided
     if q:
-        search_term = f"%{q}%"
-        query = query.where(
-            (Artwork.title.ilike(search_term)) | (Artwork.artist.ilike(search_term))
+        # Ranked title/artist search, including inactive artworks
+        hits = await search_artworks(
+            db, q, include_inactive=True, offset=page * per_page, limit=per_page
         )
-    
-    # Apply pagination and ordering
-    query = query.order_by(Artwork.created_at.desc()).offset(page * per_page).limit(per_page)
-    
-    result = await db.execute(query)
-    artworks = result.scalars().all()
+        artworks = [artwork for artwork, _ in hits]
+    else:
+        query = select(Artwork).order_by(Artwork.created_at.desc()).offset(page * per_page).limit(per_page)
+        result = await db.execute(query)
+        artworks = result.scalars().all()
     
     return templates.TemplateResponse(
         request=request,
@@ -132,7 +129,7 @@ async def admin_artworks(
 @router.post("/admin/artworks/{artwork_id}/toggle-active")
 async def toggle_artwork_active(
     artwork_id: UUID,
-    current_user: User = Depends(get_current_user_optional),
+    current_user: UserPrincipal = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -166,7 +163,7 @@ async def toggle_artwork_active(
 @router.post("/admin/artworks/{artwork_id}/delete")
 async def delete_artwork(
     artwork_id: UUID,
-    current_user: User = Depends(get_current_user_optional),
+    current_user: UserPrincipal = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -202,7 +199,7 @@ async def admin_users(
     request: Request,
     page: int = 0,
     per_page: int = 50,
-    current_user: User = Depends(get_current_user_optional),
+    current_user: UserPrincipal = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -241,7 +238,7 @@ async def admin_users(
 async def change_user_role(
     user_id: UUID,
     role: str = Form(...),
-    current_user: User = Depends(get_current_user_optional),
+    current_user: UserPrincipal = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -272,7 +269,7 @@ async def change_user_role(
             detail="User not found"
         )
     
-    # Update role
+    # Update role (committing invalidates the user's cached principals)
     user.role = role
     await db.commit()
     
@@ -3,11 +3,11 @@ Web routes for My Likes page.
 """
 from fastapi import APIRouter, Request, Depends, HTTPException, status
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
 from app.api.deps import get_db, get_current_user_optional
-from app.models.user import User
+from app.core.instrumentation import TimedJinja2Templates
+from app.core.user_cache import UserPrincipal
 from app.models.like import Like
 from app.models.artwork import Artwork
 from app.services import artist_descriptions
@@ -15,13 +15,23 @@ from app.services import artist_descriptions
 router = APIRouter()
 
 # Setup Jinja2 templates
-templates = Jinja2Templates(directory="/app/frontend/www/templates")
+templates = TimedJinja2Templates(directory="/app/frontend/www/templates")
+
+# Artwork columns rendered by the liked-artwork cards
+LIKED_CARD_COLUMNS = [
+    Artwork.id,
+    Artwork.title,
+    Artwork.artist,
+    Artwork.year,
+    Artwork.style,
+    Artwork.image_url,
+]
 
 
 @router.get("/me/likes", response_class=HTMLResponse)
 async def my_likes_page(
     request: Request,
-    current_user: User = Depends(get_current_user_optional),
+    current_user: UserPrincipal = Depends(get_current_user_optional),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -33,23 +43,24 @@ async def my_likes_page(
     if not current_user:
         return RedirectResponse(url="/login?next=/me/likes", status_code=status.HTTP_303_SEE_OTHER)
     
-    # Get liked artworks
+    # Get liked artworks (only the columns the cards render, as plain rows)
     artworks_query = (
-        select(Artwork)
+        select(*LIKED_CARD_COLUMNS)
         .join(Like, Like.artwork_id == Artwork.id)
         .where(Like.user_id == current_user.id)
         .order_by(Like.created_at.desc())
     )
     artworks_result = await db.execute(artworks_query)
-    liked_artworks = artworks_result.scalars().all()
+    liked_artworks = artworks_result.all()
     
     # Add artist descriptions to artworks
+    descriptions = artist_descriptions.describe_artists(artwork.artist for artwork in liked_artworks)
     artworks_with_descriptions = []
     for artwork in liked_artworks:
-        description = artist_descriptions.get_description_snippet(artwork.artist)
+        entry = descriptions[artwork.artist]
         artworks_with_descriptions.append({
             'artwork': artwork,
-            'description': description
+            'description': entry.snippet if entry else None
         })
     
     # Get style statistics
@@ -4,18 +4,22 @@ Web routes for HTML gallery pages.
 from typing import Optional
 from fastapi import APIRouter, Request, Depends, Query
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, distinct
+from sqlalchemy import select
 from sqlmodel import col
-from app.api.deps import get_db
+from app.api.deps import get_read_db, get_current_user_optional
+from app.core.instrumentation import TimedJinja2Templates
+from app.core.user_cache import UserPrincipal
 from app.models.artwork import Artwork
 from app.services import artist_descriptions
+from app.services.likes import get_liked_artwork_ids
+from app.services.search import search_artworks
+from app.services.reference_data import get_active_styles
 
 router = APIRouter()
 
 # Setup Jinja2 templates
-templates = Jinja2Templates(directory="/app/frontend/www/templates")
+templates = TimedJinja2Templates(directory="/app/frontend/www/templates")
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -25,57 +29,63 @@ async def gallery(
     style: Optional[str] = Query(None, description="Filter by style"),
     page: int = Query(0, ge=0, description="Page number"),
     per_page: int = Query(24, ge=1, le=100, description="Items per page"),
-    db: AsyncSession = Depends(get_db)
+    current_user: Optional[UserPrincipal] = Depends(get_current_user_optional),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Render the gallery page with artwork grid.
     
     Supports:
-    - q: search query for title/artist (case-insensitive)
+    - q: search query for title/artist (case-insensitive, ranked by relevance)
     - style: exact style filter
     - page: pagination page number
     - per_page: items per page (default 24)
+    
+    For a logged-in user (access_token cookie) the liked state of every card
+    is embedded in the page, so no per-card like checks are needed.
     """
-    # Build query for artworks
-    query = select(Artwork).where(Artwork.is_active == True)
+    offset = page * per_page
     
-    # Apply search filter
     if q:
-        search_term = f"%{q}%"
-        query = query.where(
-            (Artwork.title.ilike(search_term)) | (Artwork.artist.ilike(search_term))
-        )
-    
-    # Apply style filter
-    if style:
-        query = query.where(Artwork.style == style)
-    
-    # Order by created_at desc
-    query = query.order_by(col(Artwork.created_at).desc())
-    
-    # Apply pagination
-    offset = page * per_page
-    query = query.offset(offset).limit(per_page)
+        # Ranked title/artist search
+        hits = await search_artworks(db, q, style=style, offset=offset, limit=per_page)
+        artworks = [artwork for artwork, _ in hits]
+    else:
+        query = select(Artwork).where(Artwork.is_active == True)
+        
+        # Apply style filter
+        if style:
+            query = query.where(Artwork.style == style)
+        
+        # Order by created_at desc (id breaks ties, matching the listing indexes)
+        query = query.order_by(col(Artwork.created_at).desc(), col(Artwork.id).desc())
+        
+        # Apply pagination
+        query = query.offset(offset).limit(per_page)
+        
+        # Execute query
+        result = await db.execute(query)
+        artworks = result.scalars().all()
     
-    # Execute query
-    result = await db.execute(query)
-    artworks = result.scalars().all()
+    # Liked flags for the whole page in one query
+    liked_ids = set()
+    if current_user:
+        liked_ids = await get_liked_artwork_ids(db, current_user.id, [a.id for a in artworks])
     
-    # Add artist descriptions to artworks
+    # Add artist descriptions to artworks (one lookup per distinct artist)
+    descriptions = artist_descriptions.describe_artists(artwork.artist for artwork in artworks)
     artworks_with_descriptions = []
     for artwork in artworks:
-        description = artist_descriptions.get_description_snippet(artwork.artist)
-        full_description = artist_descriptions.get_description(artwork.artist)
+        entry = descriptions[artwork.artist]
         artworks_with_descriptions.append({
             'artwork': artwork,
-            'description_snippet': description,
-            'full_description': full_description
+            'description_snippet': entry.snippet if entry else None,
+            'full_description': entry.description if entry else None,
+            'liked': artwork.id in liked_ids
         })
     
-    # Get available styles for filter dropdown
-    styles_query = select(distinct(Artwork.style)).where(Artwork.is_active == True).order_by(Artwork.style)
-    styles_result = await db.execute(styles_query)
-    available_styles = styles_result.scalars().all()
+    # Get available styles for filter dropdown (cached reference data)
+    available_styles = (await get_active_styles(db)).value
     
     return templates.TemplateResponse(
         request=request,
@@ -87,5 +97,6 @@ async def gallery(
             "search_query": q or "",
             "page": page,
             "per_page": per_page,
+            "like_status_known": current_user is not None,
         }
     )